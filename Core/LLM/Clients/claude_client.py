@@ -116,8 +116,7 @@ class ClaudeClient(BaseLLMClient):
             cost = self.calculate_cost(input_tokens, output_tokens)
             
             # Update stats
-            self.total_tokens += total_tokens
-            self.total_cost += cost
+            self._record_usage(total_tokens, cost)
             
             return LLMResponse(
                 content=content,
@@ -200,8 +199,7 @@ class ClaudeClient(BaseLLMClient):
             cost = self.calculate_cost(input_tokens, output_tokens)
             
             # Update stats
-            self.total_tokens += total_tokens
-            self.total_cost += cost
+            self._record_usage(total_tokens, cost)
             
             return LLMResponse(
                 content=content,
@@ -119,8 +119,7 @@ class GeminiClient(BaseLLMClient):
             cost = self.calculate_cost(input_tokens, output_tokens)
             
             # Update stats
-            self.total_tokens += total_tokens
-            self.total_cost += cost
+            self._record_usage(total_tokens, cost)
             
             return LLMResponse(
                 content=content,
@@ -208,8 +207,7 @@ class GeminiClient(BaseLLMClient):
             cost = self.calculate_cost(input_tokens, output_tokens)
             
             # Update stats
-            self.total_tokens += total_tokens
-            self.total_cost += cost
+            self._record_usage(total_tokens, cost)
             
             return LLMResponse(
                 content=content,
@@ -110,7 +110,7 @@ class LocalLLMClient(BaseLLMClient):
             total_tokens = input_tokens + output_tokens
             
             # Update stats (no cost for local LLM)
-            self.total_tokens += total_tokens
+            self._record_usage(total_tokens)
             
             return LLMResponse(
                 content=content,
@@ -187,7 +187,7 @@ class LocalLLMClient(BaseLLMClient):
             total_tokens = input_tokens + output_tokens
             
             # Update stats
-            self.total_tokens += total_tokens
+            self._record_usage(total_tokens)
             
             return LLMResponse(
                 content=content,
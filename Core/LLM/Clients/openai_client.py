@@ -118,8 +118,7 @@ class OpenAIClient(BaseLLMClient):
             cost = self.calculate_cost(input_tokens, output_tokens)
             
             # Update stats
-            self.total_tokens += total_tokens
-            self.total_cost += cost
+            self._record_usage(total_tokens, cost)
             
             return LLMResponse(
                 content=content,
@@ -190,8 +189,7 @@ class OpenAIClient(BaseLLMClient):
             cost = self.calculate_cost(input_tokens, output_tokens)
             
             # Update stats
-            self.total_tokens += total_tokens
-            self.total_cost += cost
+            self._record_usage(total_tokens, cost)
             
             return LLMResponse(
                 content=content,
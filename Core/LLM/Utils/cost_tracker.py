@@ -30,6 +30,11 @@ class CostEntry:
         data = asdict(self)
         data['timestamp'] = self.timestamp.isoformat()
         return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CostEntry':
+        """Inverse of to_dict()"""
+        return cls(**{**data, 'timestamp': datetime.fromisoformat(data['timestamp'])})
 
 
 class CostTracker:
@@ -42,7 +47,9 @@ class CostTracker:
         self,
         budget_limit: Optional[float] = None,
         alert_threshold: Optional[float] = None,
-        export_dir: Optional[str] = None
+        export_dir: Optional[str] = None,
+        metrics=None,
+        retention=None
     ):
         """
         Initialize cost tracker
@@ -51,18 +58,34 @@ class CostTracker:
             budget_limit: Maximum budget in USD (None = no limit)
             alert_threshold: Alert when cost exceeds this (None = no alerts)
             export_dir: Directory to export cost data (None = don't export)
+            metrics: Metrics registry (see Core/Observability); None disables metrics
+            retention: Retention policy (see Core/ODAL/retention.py) bounding
+                the in-memory entries; None keeps every entry in memory
         """
         self.budget_limit = budget_limit
         self.alert_threshold = alert_threshold
         self.export_dir = Path(export_dir) if export_dir else None
         
-        self.entries: List[CostEntry] = []
+        self.entries: List[CostEntry] = (
+            retention.buffer('cost_entries', encode=CostEntry.to_dict, decode=CostEntry.from_dict)
+            if retention is not None else []
+        )
         self.total_cost = 0.0
         self.total_tokens = 0
+        self.total_calls = 0
         self.provider_costs: Dict[str, float] = {}
         
         if self.export_dir:
             self.export_dir.mkdir(parents=True, exist_ok=True)
+        
+        self.metrics = metrics
+        if metrics is not None:
+            self._m_cost = metrics.counter(
+                'llm_cost_tracked_usd_total', 'Tracked LLM spend in USD', ['provider']
+            )
+            self._m_tokens = metrics.counter(
+                'llm_cost_tracked_tokens_total', 'Tracked LLM tokens', ['provider']
+            )
     
     def track(
         self,
@@ -100,12 +123,17 @@ class CostTracker:
         self.entries.append(entry)
         self.total_cost += cost_usd
         self.total_tokens += entry.total_tokens
+        self.total_calls += 1
         
         # Update provider costs
         if provider not in self.provider_costs:
             self.provider_costs[provider] = 0.0
         self.provider_costs[provider] += cost_usd
         
+        if self.metrics is not None:
+            self._m_cost.labels(provider).inc(cost_usd)
+            self._m_tokens.labels(provider).inc(entry.total_tokens)
+        
         # Check alerts
         self._check_alerts()
         
@@ -139,11 +167,11 @@ class CostTracker:
         return {
             'total_cost_usd': self.total_cost,
             'total_tokens': self.total_tokens,
-            'total_calls': len(self.entries),
+            'total_calls': self.total_calls,
             'budget_limit': self.budget_limit,
             'budget_remaining': self.budget_limit - self.total_cost if self.budget_limit else None,
             'provider_breakdown': self.provider_costs.copy(),
-            'average_cost_per_call': self.total_cost / len(self.entries) if self.entries else 0,
+            'average_cost_per_call': self.total_cost / self.total_calls if self.total_calls else 0,
         }
     
     def get_provider_stats(self, provider: str) -> Dict[str, Any]:
@@ -248,11 +276,45 @@ class CostTracker:
         logger.info(f"Exported cost data to {filepath}")
         return str(filepath)
     
+    def export_state(self) -> Dict[str, Any]:
+        """
+        Totals and the newest entries as JSON-serialisable state (for engine
+        snapshots); the size is bounded however long tracking ran
+        """
+        try:
+            from ...ODAL.retention import export_history
+        except ImportError:
+            # Fallback for direct execution
+            from SDM_AI_PROJECT.Core.ODAL.retention import export_history
+        
+        return export_history(
+            {
+                'total_cost': self.total_cost,
+                'total_tokens': self.total_tokens,
+                'total_calls': self.total_calls,
+                'provider_costs': self.provider_costs.copy()
+            },
+            'entries',
+            self.entries,
+            encode=CostEntry.to_dict
+        )
+    
+    def import_state(self, state: Dict[str, Any]) -> None:
+        """Replace totals and entries with exported state"""
+        self.entries.clear()
+        for data in state['entries']:
+            self.entries.append(CostEntry.from_dict(data))
+        self.total_cost = state['total_cost']
+        self.total_tokens = state['total_tokens']
+        self.total_calls = state['total_calls']
+        self.provider_costs = dict(state['provider_costs'])
+    
     def reset(self) -> None:
         """Reset all tracking data"""
         self.entries.clear()
         self.total_cost = 0.0
         self.total_tokens = 0
+        self.total_calls = 0
         self.provider_costs.clear()
         logger.info("Cost tracker reset")
     
@@ -5,6 +5,7 @@ Routes requests to appropriate LLM based on cost, capability, and availability
 
 from typing import Optional, List, Dict, Any
 from enum import Enum
+from contextlib import nullcontext
 import logging
 
 from ..llm_client import BaseLLMClient, LLMResponse, Message
@@ -27,11 +28,31 @@ class LLMRouter:
     Supports cost-based, capability-based, and fallback routing
     """
     
-    def __init__(self):
-        """Initialize router with available clients"""
+    def __init__(self, metrics=None, tracer=None):
+        """
+        Initialize router with available clients
+        
+        Args:
+            metrics: Metrics registry (see Core/Observability); None disables metrics
+            tracer: Tracer (see Core/Observability); None disables tracing
+        """
         self.config = get_config()
         self.clients: Dict[str, BaseLLMClient] = {}
         self._initialize_clients()
+        
+        self.tracer = tracer
+        if tracer is not None:
+            for client in self.clients.values():
+                client.set_tracer(tracer)
+        
+        self.metrics = metrics
+        if metrics is not None:
+            for client in self.clients.values():
+                client.set_metrics(metrics)
+            self._m_fallbacks = metrics.counter(
+                'llm_fallbacks_total', 'Provider failures that fell through to the next provider',
+                ['provider', 'operation']
+            )
     
     def _initialize_clients(self) -> None:
         """Initialize all available LLM clients"""
@@ -170,6 +191,19 @@ class LLMRouter:
         # Fallback
         return self.select_by_cost(TaskComplexity.MODERATE)
     
+    def _fallback_span(self, operation: str):
+        """Parent span for a fallback chain (each attempt is a client span below it)"""
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.span(f'llm.{operation}_with_fallback')
+    
+    def _record_fallback(self, span, provider: str, operation: str, error: Exception) -> None:
+        """Count a failed attempt that falls through to the next provider"""
+        if self.metrics is not None:
+            self._m_fallbacks.labels(provider, operation).inc()
+        if span is not None:
+            span.add_event('llm.fallback', {'llm.provider': provider, 'error': str(error)})
+    
     def generate_with_fallback(
         self,
         prompt: str,
@@ -193,25 +227,29 @@ class LLMRouter:
         
         last_error = None
         
-        for provider in preferred_providers:
-            client = self.get_client(provider)
-            if not client:
-                logger.debug(f"Provider {provider} not available, skipping")
-                continue
-            
-            try:
-                logger.info(f"Attempting generation with {provider}")
-                response = client.generate(prompt, **kwargs)
-                logger.info(f"Successfully generated with {provider}")
-                return response
+        with self._fallback_span('generate') as span:
+            for provider in preferred_providers:
+                client = self.get_client(provider)
+                if not client:
+                    logger.debug(f"Provider {provider} not available, skipping")
+                    continue
                 
-            except Exception as e:
-                logger.warning(f"Failed with {provider}: {e}")
-                last_error = e
-                continue
-        
-        # All providers failed
-        raise RuntimeError(f"All providers failed. Last error: {last_error}")
+                try:
+                    logger.info(f"Attempting generation with {provider}")
+                    response = client.generate(prompt, **kwargs)
+                    logger.info(f"Successfully generated with {provider}")
+                    if span is not None:
+                        span.set_attribute('llm.provider', provider)
+                    return response
+                    
+                except Exception as e:
+                    logger.warning(f"Failed with {provider}: {e}")
+                    last_error = e
+                    self._record_fallback(span, provider, 'generate', e)
+                    continue
+            
+            # All providers failed
+            raise RuntimeError(f"All providers failed. Last error: {last_error}")
     
     def chat_with_fallback(
         self,
@@ -235,23 +273,27 @@ class LLMRouter:
         
         last_error = None
         
-        for provider in preferred_providers:
-            client = self.get_client(provider)
-            if not client:
-                continue
-            
-            try:
-                logger.info(f"Attempting chat with {provider}")
-                response = client.chat(messages, **kwargs)
-                logger.info(f"Successfully chatted with {provider}")
-                return response
+        with self._fallback_span('chat') as span:
+            for provider in preferred_providers:
+                client = self.get_client(provider)
+                if not client:
+                    continue
                 
-            except Exception as e:
-                logger.warning(f"Failed with {provider}: {e}")
-                last_error = e
-                continue
-        
-        raise RuntimeError(f"All providers failed. Last error: {last_error}")
+                try:
+                    logger.info(f"Attempting chat with {provider}")
+                    response = client.chat(messages, **kwargs)
+                    logger.info(f"Successfully chatted with {provider}")
+                    if span is not None:
+                        span.set_attribute('llm.provider', provider)
+                    return response
+                    
+                except Exception as e:
+                    logger.warning(f"Failed with {provider}: {e}")
+                    last_error = e
+                    self._record_fallback(span, provider, 'chat', e)
+                    continue
+            
+            raise RuntimeError(f"All providers failed. Last error: {last_error}")
     
     def get_available_providers(self) -> List[str]:
         """
@@ -7,7 +7,10 @@ from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, List, Generator
 from dataclasses import dataclass
 from datetime import datetime
+import functools
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -37,12 +40,62 @@ class Message:
     metadata: Optional[Dict[str, Any]] = None
 
 
+def _instrumented(operation: str, method):
+    """Wrap a client method to record request count and latency"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.metrics is None and self.tracer is None:
+            return method(self, *args, **kwargs)
+        
+        provider = self.__class__.__name__
+        span = None
+        if self.tracer is not None:
+            span = self.tracer.start_span(
+                f'llm.{operation}', {'llm.provider': provider, 'llm.model': self.model}, kind='client'
+            )
+            token = self.tracer.activate(span)
+        
+        start = time.perf_counter()
+        status = 'error'
+        try:
+            response = method(self, *args, **kwargs)
+            status = 'success'
+            if span is not None and getattr(response, 'tokens_used', None) is not None:
+                span.set_attribute('llm.tokens_used', response.tokens_used)
+            return response
+        except Exception as e:
+            if span is not None:
+                span.record_exception(e)
+            raise
+        finally:
+            if self.metrics is not None:
+                self._m_requests.labels(provider, self.model, operation, status).inc()
+                self._m_duration.labels(provider, operation).observe(time.perf_counter() - start)
+            if span is not None:
+                self.tracer.deactivate(token)
+                span.end()
+    
+    return wrapper
+
+
 class BaseLLMClient(ABC):
     """
     Abstract base class for all LLM clients
     Ensures consistent interface across Claude, OpenAI, Gemini, and Local LLM
+    
+    Observability:
+    - generate() and chat() of every subclass are wrapped to count and time
+      requests once set_metrics() has been called, and to run each request
+      in a client span once set_tracer() has been called (no-op otherwise)
     """
     
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for operation in ('generate', 'chat'):
+            method = cls.__dict__.get(operation)
+            if method is not None and not getattr(method, '__isabstractmethod__', False):
+                setattr(cls, operation, _instrumented(operation, method))
+    
     def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
         """
         Initialize LLM client
@@ -55,6 +108,9 @@ class BaseLLMClient(ABC):
         self.model = model or self.get_default_model()
         self.total_tokens = 0
         self.total_cost = 0.0
+        self._usage_lock = threading.Lock()
+        self.metrics = None
+        self.tracer = None
         self._validate_config()
     
     @abstractmethod
@@ -163,6 +219,56 @@ class BaseLLMClient(ABC):
         output_cost = (output_tokens / 1_000_000) * pricing['output_per_1m']
         return input_cost + output_cost
     
+    def _record_usage(self, tokens: int, cost: float = 0.0) -> None:
+        """
+        Add one call's usage to the running totals
+        Safe to call from several threads sharing one client
+        
+        Args:
+            tokens: Tokens used by the call
+            cost: Cost of the call in USD
+        """
+        with self._usage_lock:
+            self.total_tokens += tokens
+            self.total_cost += cost
+        if self.metrics is not None:
+            self._m_tokens.inc(tokens)
+            self._m_cost.inc(cost)
+    
+    def set_tracer(self, tracer) -> None:
+        """
+        Trace every generate()/chat() request as a client span
+        
+        Args:
+            tracer: Tracer (see Core/Observability), or None to disable
+        """
+        self.tracer = tracer
+    
+    def set_metrics(self, metrics) -> None:
+        """
+        Export token and cost totals to a metrics registry
+        
+        Args:
+            metrics: Metrics registry (see Core/Observability), or None to disable
+        """
+        self.metrics = metrics
+        if metrics is not None:
+            provider, model = self.__class__.__name__, self.model
+            self._m_requests = metrics.counter(
+                'llm_requests_total', 'LLM client requests by outcome',
+                ['provider', 'model', 'operation', 'status']
+            )
+            self._m_duration = metrics.histogram(
+                'llm_request_duration_seconds', 'LLM client request latency',
+                ['provider', 'operation']
+            )
+            self._m_tokens = metrics.counter(
+                'llm_tokens_total', 'Tokens used by LLM calls', ['provider', 'model']
+            ).labels(provider, model)
+            self._m_cost = metrics.counter(
+                'llm_cost_usd_total', 'Cost of LLM calls in USD', ['provider', 'model']
+            ).labels(provider, model)
+    
     @abstractmethod
     def get_pricing(self) -> Dict[str, float]:
         """
@@ -180,15 +286,18 @@ class BaseLLMClient(ABC):
         Returns:
             Dict with total tokens used and cost
         """
+        with self._usage_lock:
+            total_tokens, total_cost = self.total_tokens, self.total_cost
         return {
-            'total_tokens': self.total_tokens,
-            'total_cost_usd': self.total_cost,
+            'total_tokens': total_tokens,
+            'total_cost_usd': total_cost,
             'model': self.model,
             'provider': self.__class__.__name__
         }
     
     def reset_stats(self) -> None:
         """Reset usage statistics"""
-        self.total_tokens = 0
-        self.total_cost = 0.0
+        with self._usage_lock:
+            self.total_tokens = 0
+            self.total_cost = 0.0
         logger.info(f"Stats reset for {self.__class__.__name__}")
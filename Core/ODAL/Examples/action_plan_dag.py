@@ -0,0 +1,109 @@
+"""
+Example: Multi-Step Action Plans in the ACT Phase
+
+An intent parser turns "roll out the release" into a plan: scale three
+services, deploy once they are up, then verify; a notification runs on
+its own. Shows:
+- wall-clock time vs the sum of step times and the critical path
+- a failing step cancelling only its dependents
+- a hanging step hitting its timeout
+- the per-step timing in the audit record
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from SDM_AI_PROJECT.Core.ODAL import ODALEngine
+from SDM_AI_PROJECT.Skills.Security.Audit_Logging.audit_logger import AuditLogger, EventType
+
+
+CONTEXT = {"user_id": "planner", "user_role": "admin", "budget_limit": 5000.0, "environment": "staging"}
+
+STEP_SECONDS = {"scale": 0.10, "deploy": 0.15, "verify": 0.05, "notify": 0.02}
+
+
+class ReleasePlanParser:
+    """Intent parser producing a release plan"""
+
+    def parse(self, user_input, context):
+        step = lambda action_type, target: {"action_type": action_type, "target": target}
+        return {
+            "action_type": "deploy",
+            "estimated_cost": 100.0,
+            "environment": context.get("environment", "development"),
+            "user_input": user_input,
+            "plan": [
+                {"id": "scale-api", "action": step("scale", "api")},
+                {"id": "scale-web", "action": step("scale", "web")},
+                {"id": "scale-worker", "action": step("scale", "worker")},
+                {"id": "deploy", "action": step("deploy", "release-42"),
+                 "depends_on": ["scale-api", "scale-web", "scale-worker"]},
+                {"id": "verify", "action": step("verify", "release-42"), "depends_on": ["deploy"], "timeout": 0.5},
+                {"id": "notify", "action": step("notify", "#releases")},
+            ]
+        }
+
+
+def make_executor(fail=None, hang=None):
+    """Step executor simulating infrastructure calls"""
+    def execute(action):
+        if action["action_type"] == hang:
+            time.sleep(2)
+        time.sleep(STEP_SECONDS[action["action_type"]])
+        if action["target"] == fail:
+            raise RuntimeError(f"{action['target']} did not become healthy")
+        return {"status": "ok", "target": action["target"]}
+    return execute
+
+
+def print_plan(title, result):
+    plan = result["action_result"]["result"]
+    print(f"\n{title}: cycle {result['decision']}, action {result['action_result']['status']}")
+    for step in plan["steps"]:
+        offset = f"{step['start_offset_ms']:6.0f}ms" if step["start_offset_ms"] is not None else "      - "
+        duration = f"{step['duration_ms']:6.0f}ms" if step["duration_ms"] is not None else "      - "
+        print(f"  {step['id']:<13} {step['status']:<10} start {offset}  took {duration}  {step['error'] or ''}")
+    print(f"  wall {plan['wall_ms']:.0f}ms | sum of steps {plan['step_sum_ms']:.0f}ms "
+          f"| critical path {plan['critical_path_ms']:.0f}ms")
+    return plan
+
+
+def main():
+    """Run release plans through the engine"""
+    print("=" * 70)
+    print("ACTION PLAN DAG EXECUTION")
+    print("=" * 70)
+
+    audit_logger = AuditLogger(Path(tempfile.mkdtemp()))
+    engine = ODALEngine(audit_logger=audit_logger, intent_parser=ReleasePlanParser())
+
+    result = engine.run_cycle("Roll out release 42", dict(CONTEXT), make_executor())
+    plan = print_plan("All steps succeed", result)
+    assert plan["wall_ms"] < plan["step_sum_ms"] * 0.75
+
+    print_plan("scale-web fails", engine.run_cycle("Roll out release 42", dict(CONTEXT), make_executor(fail="web")))
+    print_plan("verify hangs", engine.run_cycle("Roll out release 42", dict(CONTEXT), make_executor(hang="verify")))
+
+    async def run_async():
+        async def execute(action):
+            await asyncio.sleep(STEP_SECONDS[action["action_type"]])
+            return {"status": "ok", "target": action["target"]}
+        return await engine.arun_cycle("Roll out release 42", dict(CONTEXT), execute)
+
+    print_plan("async executor", asyncio.run(run_async()))
+
+    executed = audit_logger.search_events(event_type=EventType.ACTION_EXECUTED)
+    steps = executed[0]["metadata"]["result"]["steps"]
+    print(f"\nAudit record of the first plan has {len(steps)} steps with timing "
+          f"(e.g. {steps[3]['id']}: {steps[3]['duration_ms']:.0f}ms)")
+
+
+if __name__ == "__main__":
+    main()
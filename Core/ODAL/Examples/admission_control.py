@@ -0,0 +1,116 @@
+"""
+Example: Admission Control Under Overload
+
+Closed-loop clients (24 batch, 6 interactive with think time) hammer an
+engine whose action backend handles 4 calls at a time (20ms each). Without admission
+control every request queues for the backend and interactive latency
+balloons with the batch load; with an AdmissionController, batch work
+above its concurrency share or the latency SLO is shed at once as
+"overloaded" and interactive requests stay fast. Also shows per-user
+token-bucket quotas and the controller's counters.
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from SDM_AI_PROJECT.Core.ODAL import ODALEngine, AdmissionController
+from SDM_AI_PROJECT.Skills.Security.Audit_Logging.audit_logger import AuditLogger
+
+
+RUN_SECONDS = 2.0
+BACKEND_SLOTS = 4
+BACKEND_SECONDS = 0.02
+
+_backend = threading.BoundedSemaphore(BACKEND_SLOTS)
+
+
+def backend_executor(action):
+    """Infrastructure API with limited capacity"""
+    with _backend:
+        time.sleep(BACKEND_SECONDS)
+    return {"status": "success", "action": action["action_type"]}
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))] if values else float("nan")
+
+
+def load_test(engine):
+    """Run closed-loop clients for RUN_SECONDS; return latencies and decisions per class"""
+    stop = threading.Event()
+    latencies = {"interactive": [], "batch": [], "shed": []}
+    decisions = {"interactive": {}, "batch": {}}
+    lock = threading.Lock()
+
+    def client(priority, user):
+        context = {"user_id": user, "user_role": "admin", "budget_limit": 5000.0, "priority": priority}
+        while not stop.is_set():
+            start = time.perf_counter()
+            result = engine.run_cycle("Deploy to staging", dict(context), backend_executor)
+            elapsed = (time.perf_counter() - start) * 1000
+            with lock:
+                decisions[priority][result["decision"]] = decisions[priority].get(result["decision"], 0) + 1
+                latencies["shed" if result["decision"] == "overloaded" else priority].append(elapsed)
+            if result["decision"] == "overloaded":
+                time.sleep(0.01)  # Client backs off
+            elif priority == "interactive":
+                time.sleep(0.03)  # Operator think time
+
+    threads = [threading.Thread(target=client, args=("batch", f"batch-{i}")) for i in range(24)]
+    threads += [threading.Thread(target=client, args=("interactive", f"oncall-{i}")) for i in range(6)]
+    for thread in threads:
+        thread.start()
+    time.sleep(RUN_SECONDS)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return latencies, decisions
+
+
+def report(title, latencies, decisions):
+    print(f"\n{title}:")
+    for priority in ("interactive", "batch"):
+        values = latencies[priority]
+        print(f"  {priority:<11} p50 {percentile(values, 0.5):6.1f}ms  p95 {percentile(values, 0.95):6.1f}ms  "
+              f"completed {len(values):>4}  decisions {decisions[priority]}")
+    if latencies["shed"]:
+        print(f"  shed requests answered in p50 {percentile(latencies['shed'], 0.5):.2f}ms")
+
+
+def main():
+    """Compare latency with and without admission control"""
+    print("=" * 70)
+    print("ADMISSION CONTROL")
+    print("=" * 70)
+
+    engine = ODALEngine(audit_logger=AuditLogger(Path(tempfile.mkdtemp())))
+    report("No admission control", *load_test(engine))
+
+    admission = AdmissionController(max_in_flight=8, class_shares={"batch": 0.5}, latency_slo_ms=60)
+    engine = ODALEngine(audit_logger=AuditLogger(Path(tempfile.mkdtemp())), admission=admission)
+    report("AdmissionController(max_in_flight=8, batch share 0.5, SLO 60ms)", *load_test(engine))
+
+    stats = engine.get_statistics()
+    print(f"\n  admission: admitted {stats['admission']['admitted']}, shed {stats['admission']['shed']} "
+          f"({stats['admission']['shed_rate']:.0%}); by class {stats['admission']['by_class']}")
+
+    # Per-user quotas: 5 requests/s, burst of 3
+    quota = AdmissionController(user_rate=5, user_burst=3, user_quotas={"ci-bot": (50, 50)})
+    engine = ODALEngine(audit_logger=AuditLogger(Path(tempfile.mkdtemp())), admission=quota)
+    for user in ("alice", "ci-bot"):
+        outcomes = [engine.run_cycle("Scale the web tier", {"user_id": user, "user_role": "admin"})["decision"]
+                    for _ in range(10)]
+        print(f"\nQuota, 10 requests from {user}: {outcomes}")
+    print(f"Counters: {quota.get_statistics()['by_class']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Example: Parking and Resuming Cycles that Require Approval
+
+Uses a policy set where production-priced actions (> $150) need approval.
+Shows:
+- parked cycles and indexed listing of pending approvals
+- approve() resuming into ACT without re-running guard or policies,
+  compared to resubmitting the request
+- reject(), expiry, and re-validation after a policy change
+- resuming from a second engine (e.g. after a restart) on the same database
+"""
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from SDM_AI_PROJECT.Core.ODAL import ODALEngine, ApprovalQueue
+from SDM_AI_PROJECT.Skills.Security.Audit_Logging.audit_logger import AuditLogger
+# The engine's own import, so PolicyDecision values compare equal
+from SDM_AI_PROJECT.Core.ODAL.odal_engine import PolicyEngine
+
+
+CONTEXT = {"user_id": "ops", "user_role": "admin", "budget_limit": 5000.0}
+
+APPROVAL_POLICY = {
+    "policy_id": "CHANGE_001",
+    "name": "Change Approval",
+    "description": "Expensive changes need a human",
+    "enabled": True,
+    "rules": [
+        {
+            "id": "expensive_change",
+            "condition": "proposed_cost > 150",
+            "action": "REQUIRE_APPROVAL",
+            "message": "Changes over $150 require approval"
+        }
+    ]
+}
+
+
+def write_policy(policy_dir: Path, extra_rules=()):
+    policy = dict(APPROVAL_POLICY, rules=APPROVAL_POLICY["rules"] + list(extra_rules))
+    with open(policy_dir / "change_001.json", "w", encoding="utf-8") as f:
+        json.dump(policy, f, indent=2)
+
+
+def build(workdir: Path, ttl_seconds=3600) -> ODALEngine:
+    return ODALEngine(
+        policy_engine=PolicyEngine(policy_dir=workdir / "policies"),
+        audit_logger=AuditLogger(workdir / "audit"),
+        approval_queue=ApprovalQueue(workdir / "approvals.db", ttl_seconds=ttl_seconds)
+    )
+
+
+def main():
+    """Park, list, approve, reject and re-validate cycles"""
+    print("=" * 70)
+    print("APPROVAL QUEUE")
+    print("=" * 70)
+
+    workdir = Path(tempfile.mkdtemp())
+    (workdir / "policies").mkdir()
+    write_policy(workdir / "policies")
+    engine = build(workdir)
+    executor = lambda action: {"status": "success", "action": action["action_type"]}
+
+    parked = [engine.run_cycle("Deploy to production", dict(CONTEXT)) for _ in range(2000)]
+    parked.append(engine.run_cycle("Scale the web tier in production", dict(CONTEXT)))
+    print(f"\nParked {len(parked)} cycles, e.g. #{parked[0]['cycle_id']}: "
+          f"{parked[0]['decision']} ({parked[0]['reason']}), approval_id {parked[0]['approval_id'][:8]}...")
+
+    for result in parked[:1500]:
+        engine.reject(result["approval_id"], approver="lead", reason="Batch declined")
+    start = time.perf_counter()
+    pending = engine.approval_queue.list_pending(limit=50)
+    print(f"List 50 of {len(parked) - 1500} pending among {len(parked)} rows: "
+          f"{(time.perf_counter() - start) * 1000:.2f}ms")
+
+    # Approve: straight into ACT
+    evaluations = len(engine.policy_engine.evaluation_history)
+    start = time.perf_counter()
+    resumed = engine.approve(parked[1600]["approval_id"], approver="lead", action_executor=executor)
+    approve_ms = (time.perf_counter() - start) * 1000
+    assert len(engine.policy_engine.evaluation_history) == evaluations, "no policy re-evaluation"
+    start = time.perf_counter()
+    engine.run_cycle("Deploy to production", dict(CONTEXT))
+    resubmit_ms = (time.perf_counter() - start) * 1000
+    print(f"\napprove(): cycle #{resumed['cycle_id']} resumed from #{resumed['resumed_from']} -> "
+          f"{resumed['decision']}, action {resumed['action_result']['status']} ({approve_ms:.2f}ms; "
+          f"resubmitting runs guard + policies again and parks again: {resubmit_ms:.2f}ms)")
+
+    try:
+        engine.approve(parked[1600]["approval_id"], approver="someone-else")
+    except ValueError as e:
+        print(f"Second approve(): {e}")
+
+    # Policy change: the parked decision is re-validated
+    write_policy(workdir / "policies", [{
+        "id": "scale_freeze", "condition": "proposed_cost > 300", "action": "REJECT",
+        "message": "Large scale-ups are frozen"
+    }])
+    engine.policy_engine.reload_policies()
+    revalidated = engine.approve(parked[-1]["approval_id"], approver="lead", action_executor=executor)
+    print(f"\nAfter a policy change: {revalidated['decision']} ({revalidated['reason']})")
+
+    # Another engine on the same database (e.g. after a restart) resumes the rest
+    other = build(workdir)
+    remaining = other.approval_queue.list_pending(limit=1000)
+    resumed = [other.approve(entry["approval_id"], approver="night-shift", action_executor=executor)
+               for entry in remaining[:3]]
+    print(f"\nSecond engine resumed {len(resumed)} of {len(remaining)} pending: "
+          f"{[r['decision'] for r in resumed]}")
+
+    # Expiry
+    short = build(workdir, ttl_seconds=0.05)
+    stale = short.run_cycle("Deploy to production", dict(CONTEXT))
+    time.sleep(0.1)
+    expired = short.approve(stale["approval_id"], approver="lead", action_executor=executor)
+    print(f"Approved after expiry: {expired['decision']} ({expired['reason']})")
+
+    print(f"\nQueue: {engine.approval_queue.get_statistics()}")
+
+
+if __name__ == "__main__":
+    main()
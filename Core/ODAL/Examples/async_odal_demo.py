@@ -0,0 +1,72 @@
+"""
+Example: Concurrent O.D.A.L. Cycles on One Event Loop
+
+Runs many cycles through ODALEngine.arun_cycle with a slow coroutine
+action executor and compares against sequential run_cycle.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from SDM_AI_PROJECT.Core.ODAL import ODALEngine
+from SDM_AI_PROJECT.Skills.Security.Audit_Logging.audit_logger import AuditLogger
+
+
+CONTEXT = {"user_id": "user123", "user_role": "admin", "budget_limit": 5000.0}
+
+
+async def slow_executor(action: dict) -> dict:
+    """Simulate an infrastructure API call that takes 100ms"""
+    await asyncio.sleep(0.1)
+    return {"status": "success", "action": action["action_type"]}
+
+
+def blocking_executor(action: dict) -> dict:
+    """Same call, but blocking"""
+    time.sleep(0.1)
+    return {"status": "success", "action": action["action_type"]}
+
+
+async def run_concurrent(engine: ODALEngine, cycles: int) -> float:
+    start = time.perf_counter()
+    results = await asyncio.gather(*[
+        engine.arun_cycle("Deploy to staging", dict(CONTEXT), slow_executor)
+        for _ in range(cycles)
+    ])
+    elapsed = time.perf_counter() - start
+    approved = sum(1 for r in results if r["decision"] == "approve")
+    print(f"[ASYNC] {cycles} cycles ({approved} approved) in {elapsed:.2f}s")
+    return elapsed
+
+
+def main():
+    """Run concurrent O.D.A.L. demonstration"""
+    cycles = 50
+    audit_logger = AuditLogger(background_writer=True)
+    engine = ODALEngine(audit_logger=audit_logger, max_concurrent_cycles=25)
+
+    print("=" * 70)
+    print("CONCURRENT O.D.A.L. CYCLES")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    for _ in range(10):
+        engine.run_cycle("Deploy to staging", dict(CONTEXT), blocking_executor)
+    sequential = (time.perf_counter() - start) * cycles / 10
+    print(f"[SYNC]  {cycles} cycles (extrapolated from 10) in {sequential:.2f}s")
+
+    concurrent = asyncio.run(run_concurrent(engine, cycles))
+    print(f"Speedup: {sequential / concurrent:.1f}x (cap: {engine.max_concurrent_cycles} in flight)")
+    print(f"Phase after run: {engine.current_phase.value}")
+
+    audit_logger.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Example: Memory per Retained Cycle, CycleRecord vs Legacy Result Dicts
+
+Runs cycles, then measures what execution_history retains per cycle:
+- legacy: the nested result dicts run_cycle used to return (rebuilt with
+  CycleRecord.to_dict(), which produces the same structure)
+- compact: the CycleRecord objects the engine keeps now
+
+Sizes are deep sizes over everything each history owns; objects owned by
+the caller (user input strings, context dicts) are excluded, and objects
+shared between cycles (interned strings, constants) are counted once.
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from SDM_AI_PROJECT.Core.ODAL import ODALEngine
+from SDM_AI_PROJECT.Core.ODAL.cycle_record import CycleRecord
+from SDM_AI_PROJECT.Skills.Security.Audit_Logging.audit_logger import AuditLogger
+
+
+CONTEXT = {"user_id": "memory", "user_role": "admin", "budget_limit": 5000.0}
+INPUTS = ["Deploy to staging", "Scale the web tier", "Deploy to production", "Remove old snapshots"]
+
+
+def deep_size(roots, exclude_ids) -> int:
+    """Total size of objects reachable from roots, each counted once"""
+    seen = set(exclude_ids)
+    total = 0
+    stack = list(roots)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, CycleRecord):
+            # Slots plus the dict storage (cycle_id and caller-set keys); not the on-demand views
+            stack.extend(getattr(obj, name) for name in CycleRecord.__slots__ if hasattr(obj, name))
+            stack.extend(dict.keys(obj))
+            stack.extend(dict.values(obj))
+        elif isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set)):
+            stack.extend(obj)
+    return total
+
+
+def main():
+    """Compare retained memory per cycle"""
+    print("=" * 70)
+    print("RETAINED MEMORY PER CYCLE")
+    print("=" * 70)
+
+    cycles = 5000
+    engine = ODALEngine(audit_logger=AuditLogger(Path(tempfile.mkdtemp())))
+    caller_owned = []
+    for i in range(cycles):
+        text, context = INPUTS[i % len(INPUTS)], dict(CONTEXT)
+        caller_owned.extend([text, context])
+        engine.run_cycle(text, context, lambda action: {"status": "success"})
+
+    exclude = {id(obj) for obj in caller_owned}
+    records = engine.execution_history
+    legacy = [record.to_dict() for record in records]
+
+    compact_bytes = deep_size(records, exclude) / cycles
+    legacy_bytes = deep_size(legacy, exclude) / cycles
+    print(f"\n{cycles} cycles retained in execution_history")
+    print(f"  Legacy nested dicts: {legacy_bytes:>7.0f} bytes/cycle")
+    print(f"  CycleRecord:         {compact_bytes:>7.0f} bytes/cycle "
+          f"({(1 - compact_bytes / legacy_bytes) * 100:.0f}% smaller)")
+
+    # Views are built on demand and match the legacy shape
+    sample = records[-1]
+    assert sample["phases"]["observe"]["user_input"] == sample.user_input
+    assert sample.to_dict() == legacy[-1]
+    assert isinstance(sample, dict) and json.dumps(sample) == json.dumps(legacy[-1])
+    print(f"\nExample view keys: {list(sample.keys())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Example: Idempotency Keys for Client Retries
+
+A client gives up on a slow request after 50ms and retries, three times.
+Without an idempotency key every retry is a new cycle (policy evaluation,
+audit events, executed action); with one, the retries join the cycle in
+flight and later retries replay its result. Also shows asyncio
+duplicates, key reuse for a different request, and TTL expiry.
+"""
+
+import asyncio
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from SDM_AI_PROJECT.Core.ODAL import ODALEngine, IdempotencyStore
+from SDM_AI_PROJECT.Skills.Security.Audit_Logging.audit_logger import AuditLogger
+
+
+CONTEXT = {"user_id": "client", "user_role": "admin", "budget_limit": 5000.0}
+
+CLIENT_TIMEOUT = 0.05
+RETRIES = 3
+
+
+class CountingExecutor:
+    """Slow infrastructure call that counts how often it really runs"""
+
+    def __init__(self, seconds=0.2):
+        self.seconds = seconds
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, action):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.seconds)
+        return {"status": "success", "action": action["action_type"]}
+
+
+def impatient_client(engine, executor, key=None):
+    """Submit, time out, retry; finally wait for the last attempt"""
+    pool = ThreadPoolExecutor(max_workers=RETRIES + 1)
+    attempts = []
+    for _ in range(RETRIES + 1):
+        future = pool.submit(engine.run_cycle, "Deploy to staging", dict(CONTEXT), executor, key)
+        attempts.append(future)
+        try:
+            return future.result(timeout=CLIENT_TIMEOUT), attempts
+        except FutureTimeout:
+            continue  # Client timeout: retry
+    results = [future.result() for future in attempts]
+    pool.shutdown()
+    return results[-1], attempts
+
+
+def build():
+    return ODALEngine(audit_logger=AuditLogger(Path(tempfile.mkdtemp())))
+
+
+def main():
+    """Compare retries with and without idempotency keys"""
+    print("=" * 70)
+    print("IDEMPOTENT RETRIES")
+    print("=" * 70)
+
+    for key in (None, "deploy-7f3a"):
+        engine, executor = build(), CountingExecutor()
+        impatient_client(engine, executor, key)
+        time.sleep(0.3)  # Let abandoned attempts finish
+        print(f"\nidempotency_key={key!r}: {RETRIES + 1} submissions -> "
+              f"{engine.get_statistics()['total_cycles']} cycles, "
+              f"{engine.policy_engine.get_statistics()['total_evaluations']} policy evaluations, "
+              f"{engine.audit_logger.get_statistics()['total_events']} audit events, "
+              f"{executor.calls} executed action(s)")
+
+    # A later retry replays the stored result
+    start = time.perf_counter()
+    replayed = engine.run_cycle("Deploy to staging", dict(CONTEXT), executor, "deploy-7f3a")
+    print(f"Retry after completion: cycle #{replayed['cycle_id']} replayed in "
+          f"{(time.perf_counter() - start) * 1e6:.0f}us (a fresh cycle takes "
+          f"{replayed['duration_ms']:.0f}ms)")
+    print(f"Store: {engine.get_statistics()['idempotency']}")
+
+    # asyncio: 20 concurrent duplicates share one cycle
+    async def duplicates():
+        async def execute(action):
+            await asyncio.sleep(0.1)
+            return {"status": "success"}
+        return await asyncio.gather(*(
+            engine.arun_cycle("Scale the web tier", dict(CONTEXT), execute, "scale-19") for _ in range(20)
+        ))
+
+    results = asyncio.run(duplicates())
+    print(f"\nasyncio: 20 duplicates -> {len({r['cycle_id'] for r in results})} distinct cycle")
+
+    try:
+        engine.run_cycle("Delete the database", dict(CONTEXT), executor, "scale-19")
+    except ValueError as e:
+        print(f"Same key, different request: ValueError({e})")
+
+    other_user = engine.run_cycle("Delete old snapshots", dict(CONTEXT, user_id="someone-else"), None, "scale-19")
+    print(f"Same key, another user: new cycle #{other_user['cycle_id']} ({other_user['decision']})")
+
+    # Expiry
+    engine = ODALEngine(audit_logger=AuditLogger(Path(tempfile.mkdtemp())),
+                        idempotency_store=IdempotencyStore(ttl_seconds=0.05))
+    first = engine.run_cycle("Deploy to staging", dict(CONTEXT), None, "short-lived")
+    time.sleep(0.1)
+    second = engine.run_cycle("Deploy to staging", dict(CONTEXT), None, "short-lived")
+    print(f"\nAfter the TTL: cycle #{first['cycle_id']} then #{second['cycle_id']} "
+          f"({engine.idempotency_store.get_statistics()['expired']} expired)")
+
+
+if __name__ == "__main__":
+    main()
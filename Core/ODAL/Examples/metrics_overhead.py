@@ -0,0 +1,83 @@
+"""
+Example: Metrics Overhead and Prometheus Scrape
+
+Runs the same cycles with and without a MetricsRegistry, reports the
+throughput difference, then serves the registry over HTTP and scrapes
+/metrics once, printing the ODAL, guard, policy and audit families.
+"""
+
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from SDM_AI_PROJECT.Core.ODAL import ODALEngine
+from SDM_AI_PROJECT.Core.Observability import MetricsRegistry
+from SDM_AI_PROJECT.Skills.Security.Prompt_Guard.prompt_guard import PromptGuard
+from SDM_AI_PROJECT.Skills.Security.Policy_Enforcement.policy_engine import PolicyEngine
+from SDM_AI_PROJECT.Skills.Security.Audit_Logging.audit_logger import AuditLogger
+
+
+CONTEXT = {"user_id": "bench", "user_role": "admin", "budget_limit": 5000.0}
+INPUTS = ["Deploy to staging", "Scale the web tier", "Deploy to production", "Remove old snapshots"]
+
+
+def build_engine(metrics=None) -> ODALEngine:
+    """Engine with a temporary audit directory"""
+    return ODALEngine(
+        prompt_guard=PromptGuard(metrics=metrics),
+        policy_engine=PolicyEngine(metrics=metrics),
+        audit_logger=AuditLogger(Path(tempfile.mkdtemp()), metrics=metrics),
+        metrics=metrics
+    )
+
+
+def measure(engine: ODALEngine, cycles: int) -> float:
+    """Run cycles and return cycles per second"""
+    start = time.perf_counter()
+    for i in range(cycles):
+        engine.run_cycle(INPUTS[i % len(INPUTS)], dict(CONTEXT))
+    return cycles / (time.perf_counter() - start)
+
+
+def main():
+    """Compare throughput and scrape the exporter"""
+    print("=" * 70)
+    print("METRICS OVERHEAD")
+    print("=" * 70)
+
+    cycles = 2000
+    registry = MetricsRegistry()
+    plain, instrumented = build_engine(), build_engine(registry)
+
+    # Interleave rounds so drift affects both engines alike
+    plain_rate, instrumented_rate = [], []
+    for _ in range(3):
+        plain_rate.append(measure(plain, cycles))
+        instrumented_rate.append(measure(instrumented, cycles))
+    baseline, with_metrics = max(plain_rate), max(instrumented_rate)
+
+    print(f"\nWithout metrics: {baseline:>8.0f} cycles/s")
+    print(f"With metrics:    {with_metrics:>8.0f} cycles/s  ({(1 - with_metrics / baseline) * 100:+.1f}% overhead)")
+
+    server = registry.start_http_server()
+    try:
+        with urllib.request.urlopen(server.url) as response:
+            body = response.read().decode("utf-8")
+    finally:
+        server.stop()
+
+    print(f"\nScraped {server.url} ({len(body)} bytes):")
+    for line in body.splitlines():
+        if line.startswith("#") or "_bucket" in line:
+            continue
+        print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
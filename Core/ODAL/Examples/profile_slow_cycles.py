@@ -0,0 +1,97 @@
+"""
+Example: Catching Slow Cycles with CycleProfiler
+
+An action executor occasionally stalls deep in a helper. The profiler
+samples 5% of cycles under cProfile and stack-samples every cycle that runs
+past 50ms, so the stall shows up in a .collapsed file even though it was
+never reproduced on purpose. Also measures the hook's cost on unsampled
+cycles against the cycle time.
+"""
+
+import pstats
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from SDM_AI_PROJECT.Core.ODAL import ODALEngine, CycleProfiler
+from SDM_AI_PROJECT.Skills.Security.Audit_Logging.audit_logger import AuditLogger
+
+
+CONTEXT = {"user_id": "profiler", "user_role": "admin", "budget_limit": 5000.0}
+
+
+def refresh_dns_cache():
+    """The intermittent culprit"""
+    time.sleep(0.08)
+
+
+def call_cloud_api(action: dict):
+    if random.random() < 0.03:
+        refresh_dns_cache()
+
+
+def executor(action: dict) -> dict:
+    call_cloud_api(action)
+    return {"status": "success", "action": action["action_type"]}
+
+
+def build_engine(profiler=None) -> ODALEngine:
+    return ODALEngine(audit_logger=AuditLogger(Path(tempfile.mkdtemp())), profiler=profiler)
+
+
+def throughput(engine: ODALEngine, cycles: int) -> float:
+    start = time.perf_counter()
+    for _ in range(cycles):
+        engine.run_cycle("Deploy to staging", dict(CONTEXT))
+    return cycles / (time.perf_counter() - start)
+
+
+def main():
+    """Run cycles with intermittent stalls and inspect the captures"""
+    print("=" * 70)
+    print("SLOW-CYCLE PROFILER")
+    print("=" * 70)
+    random.seed(7)
+
+    output_dir = Path(tempfile.mkdtemp()) / "profiles"
+    profiler = CycleProfiler(output_dir, sample_rate=0.05, slow_threshold_ms=50, max_captures=20)
+    engine = build_engine(profiler)
+    for _ in range(300):
+        engine.run_cycle("Deploy to staging", dict(CONTEXT), executor)
+
+    print(f"\n{profiler.get_statistics()}")
+    files = sorted(p.name for p in output_dir.iterdir())
+    print(f"{len(files)} files on disk (ring of {profiler.max_captures} captures), e.g.:")
+    for name in files[-4:]:
+        print(f"  {name}")
+
+    slow = sorted(output_dir.glob("*_slow.collapsed"))[-1]
+    print(f"\nHottest stack in {slow.name}:")
+    print("  " + slow.read_text().splitlines()[0].replace(";", "\n    -> "))
+
+    sampled = sorted(output_dir.glob("*_sampled.pstats"))[-1]
+    print(f"\nTop of {sampled.name}:")
+    pstats.Stats(str(sampled)).sort_stats("cumulative").print_stats(5)
+
+    # Overhead on unsampled cycles: watchdog on, sampling off
+    idle = CycleProfiler(Path(tempfile.mkdtemp()), sample_rate=0.0, slow_threshold_ms=500)
+    start = time.perf_counter()
+    for i in range(100000):
+        idle.end(idle.begin(i, "Deploy to staging"), {})
+    hook_us = (time.perf_counter() - start) * 10
+    base = max(throughput(build_engine(), 2000) for _ in range(3))
+    print(f"Unsampled hook cost: {hook_us:.1f}us per cycle "
+          f"({hook_us * base / 1e4:.1f}% of a cycle at {base:.0f} cycles/s)")
+    idle.close()
+
+    profiler.close()
+
+
+if __name__ == "__main__":
+    main()
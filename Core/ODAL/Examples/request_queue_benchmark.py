@@ -0,0 +1,130 @@
+"""
+Example: Durable Request Queue Throughput
+
+Benchmarks RequestQueue and QueueWorkers:
+- enqueue and dequeue+ack, one row per transaction vs batched,
+  with synchronous=NORMAL and FULL
+- end-to-end cycles per second with N worker processes
+- redelivery of requests leased by a worker that died
+- dead-lettering of requests that keep failing
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from SDM_AI_PROJECT.Core.ODAL import RequestQueue, run_queue_workers
+
+
+CONTEXT = {"user_id": "queue", "user_role": "admin", "budget_limit": 5000.0}
+
+TEXTS = ["Deploy to staging", "Scale the web tier", "Remove old snapshots"]
+
+ROWS = 5000
+
+
+def request(i: int) -> dict:
+    return {"input": TEXTS[i % len(TEXTS)], "context": dict(CONTEXT, request_no=i)}
+
+
+def executor(action):
+    return {"status": "success", "action": action["action_type"]}
+
+
+def flaky_executor(action):
+    if action["action_type"] == "delete":
+        raise RuntimeError("Snapshot store unavailable")
+    return {"status": "success", "action": action["action_type"]}
+
+
+def rate(count: int, seconds: float) -> str:
+    return f"{count / seconds:>9,.0f}/s"
+
+
+def bench_queue(workdir: Path, synchronous: str):
+    """Raw queue operations: per-row transactions vs batches"""
+    print(f"\nsynchronous={synchronous}:")
+    for batch in (1, 100):
+        q = RequestQueue(workdir / f"raw-{synchronous}-{batch}.db", synchronous=synchronous)
+        payloads = [request(i) for i in range(ROWS)]
+
+        start = time.perf_counter()
+        for i in range(0, ROWS, batch):
+            q.enqueue_many(payloads[i:i + batch])
+        enqueue_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        drained = 0
+        while True:
+            leases = q.dequeue("bench", batch)
+            if not leases:
+                break
+            drained += q.ack_many((lease, None) for lease in leases)
+        drain_s = time.perf_counter() - start
+        assert drained == ROWS
+        q.close()
+        print(f"  batch {batch:>3}: enqueue {rate(ROWS, enqueue_s)} | dequeue+ack {rate(ROWS, drain_s)}")
+
+
+def main():
+    """Benchmark the queue and its workers"""
+    print("=" * 70)
+    print("DURABLE REQUEST QUEUE")
+    print("=" * 70)
+
+    workdir = Path(tempfile.mkdtemp())
+    for synchronous in ("NORMAL", "FULL"):
+        bench_queue(workdir, synchronous)
+
+    # End to end: N worker processes running ODAL cycles
+    print()
+    cycles = 2000
+    for workers in (1, 4):
+        path = workdir / f"cycles-{workers}.db"
+        q = RequestQueue(path)
+        q.enqueue_many(request(i) for i in range(cycles))
+        start = time.perf_counter()
+        pool = run_queue_workers(path, workers=workers, action_executor=executor,
+                                 log_dir=workdir / f"audit-{workers}", exit_when_empty=True)
+        stats = pool.join()
+        elapsed = time.perf_counter() - start
+        print(f"{workers} worker process(es): {stats['total_cycles']} cycles in {elapsed:.2f}s "
+              f"({rate(stats['total_cycles'], elapsed).strip()}), queue {q.get_statistics()}")
+
+    # A worker dies holding leases: they come back after the visibility timeout
+    path = workdir / "recovery.db"
+    q = RequestQueue(path, visibility_timeout=0.3)
+    ids = q.enqueue_many(request(i) for i in range(50))
+    lost = q.dequeue("crashed-worker", 20)  # never acked
+    print(f"\nWorker died holding {len(lost)} leases; queue {q.get_statistics()}")
+    time.sleep(0.35)
+    pool = run_queue_workers(path, workers=2, action_executor=executor, log_dir=workdir / "audit-recovery",
+                             visibility_timeout=0.3, exit_when_empty=True)
+    stats = pool.join()
+    redelivered = q.get(ids[0])
+    late = q.ack(lost[0], {"late": True})
+    print(f"Ack from the dead worker's stale lease accepted: {late}")
+    print(f"Restarted workers processed {stats['queue']['acked']}; request #{ids[0]} took "
+          f"{redelivered['attempts']} attempts -> {redelivered['status']} ({redelivered['result']['decision']})")
+
+    # Requests that keep failing end up as dead letters
+    path = workdir / "dlq.db"
+    q = RequestQueue(path)
+    q.enqueue_many(request(i) for i in range(30))
+    pool = run_queue_workers(path, workers=2, action_executor=flaky_executor, log_dir=workdir / "audit-dlq",
+                             max_attempts=3, retry_delay=0.02, exit_when_empty=True)
+    stats = pool.join()
+    dead = q.dead_letters()
+    print(f"\nFlaky executor: worker counts {stats['queue']}, queue {q.get_statistics()}")
+    print(f"Dead letter #{dead[0]['request_id']}: '{dead[0]['payload']['input']}' after "
+          f"{dead[0]['attempts']} attempts ({dead[0]['last_error']})")
+    print(f"Requeued {q.requeue_dead()} dead letters for another round")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Example: Thread-Safety Stress Test for a Shared ODALEngine
+
+Runs cycles from 1..N threads against ONE engine and checks that cycle IDs
+are unique and that engine, policy and audit statistics add up. Two
+workloads are measured:
+- I/O-bound: the action executor waits on (simulated) infrastructure calls,
+  so throughput should scale close to linearly with threads
+- CPU-bound: no executor wait; throughput flattens once the GIL is the limit
+"""
+
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from SDM_AI_PROJECT.Core.ODAL import ODALEngine
+from SDM_AI_PROJECT.Skills.Security.Audit_Logging.audit_logger import AuditLogger
+
+
+CONTEXT = {"user_id": "stress", "user_role": "admin", "budget_limit": 5000.0}
+INPUTS = ["Deploy to staging", "Scale the web tier", "Deploy to production", "Remove old snapshots"]
+
+
+def io_executor(action: dict) -> dict:
+    """Simulate a 5ms infrastructure API call"""
+    time.sleep(0.005)
+    return {"status": "success", "action": action["action_type"]}
+
+
+def run(threads: int, cycles_per_thread: int, action_executor) -> float:
+    """Run the workload and verify consistency; returns cycles per second"""
+    audit_logger = AuditLogger(Path(tempfile.mkdtemp()), background_writer=True)
+    engine = ODALEngine(audit_logger=audit_logger)
+
+    def worker(index: int):
+        for i in range(cycles_per_thread):
+            engine.run_cycle(INPUTS[(index + i) % len(INPUTS)], dict(CONTEXT), action_executor)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(worker, range(threads)))
+    elapsed = time.perf_counter() - start
+
+    expected = threads * cycles_per_thread
+    stats = engine.get_statistics()
+    cycle_ids = {c["cycle_id"] for c in engine.execution_history}
+    audit_logger.flush()
+    audit_cycles = sum(
+        1 for e in audit_logger.events if e["description"].startswith("O.D.A.L. Cycle #")
+    )
+    assert len(cycle_ids) == expected, f"duplicate cycle IDs: {len(cycle_ids)} != {expected}"
+    assert stats["total_cycles"] == expected, stats
+    assert stats["approved"] + stats["rejected"] + stats["pending_approval"] == expected, stats
+    assert stats["policy_engine_stats"]["total_evaluations"] == expected, stats
+    assert audit_cycles == expected, audit_cycles
+    assert not engine.active_cycles
+    audit_logger.close()
+
+    return expected / elapsed
+
+
+def main():
+    """Run thread-scaling stress test"""
+    print("=" * 70)
+    print("SHARED ODALEngine THREAD STRESS TEST")
+    print("=" * 70)
+
+    for name, executor, cycles in [("I/O-bound", io_executor, 100), ("CPU-bound", None, 500)]:
+        print(f"\n{name} workload ({cycles} cycles per thread)")
+        baseline = None
+        for threads in [1, 2, 4, 8, 16]:
+            throughput = run(threads, cycles, executor)
+            baseline = baseline or throughput
+            print(f"  {threads:>2} threads: {throughput:>8.0f} cycles/s  ({throughput / baseline:4.1f}x)  [consistent]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Example: Tracing O.D.A.L. Cycles
+
+Runs sync and async cycles with a Tracer exporting to a JSONL file, then
+reads the spans back, prints the span tree of the slowest cycle and checks
+that its audit records carry the same trace ID.
+"""
+
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from SDM_AI_PROJECT.Core.ODAL import ODALEngine
+from SDM_AI_PROJECT.Core.Observability import Tracer, JsonlSpanExporter, load_spans
+from SDM_AI_PROJECT.Skills.Security.Audit_Logging.audit_logger import AuditLogger
+
+
+CONTEXT = {"user_id": "tracer", "user_role": "admin", "budget_limit": 5000.0}
+
+
+def slow_executor(action: dict) -> dict:
+    """Simulate an infrastructure call that is slow for scale actions"""
+    time.sleep(0.05 if action["action_type"] == "scale" else 0.002)
+    return {"status": "success", "action": action["action_type"]}
+
+
+def print_tree(spans: list, root: dict):
+    """Print a span and its descendants with durations"""
+    children = defaultdict(list)
+    for span in spans:
+        children[span.get("parentSpanId")].append(span)
+
+    def walk(span, depth):
+        duration = (int(span["endTimeUnixNano"]) - int(span["startTimeUnixNano"])) / 1e6
+        print(f"  {'  ' * depth}{span['name']:<{32 - 2 * depth}} {duration:8.2f}ms")
+        for child in sorted(children[span["spanId"]], key=lambda s: int(s["startTimeUnixNano"])):
+            walk(child, depth + 1)
+
+    walk(root, 0)
+
+
+def main():
+    """Run traced cycles and inspect the exported spans"""
+    print("=" * 70)
+    print("O.D.A.L. TRACING DEMO")
+    print("=" * 70)
+
+    workdir = Path(tempfile.mkdtemp())
+    exporter = JsonlSpanExporter(workdir / "traces" / "traces.jsonl")
+    tracer = Tracer(exporter)
+    audit_logger = AuditLogger(workdir / "audit", tracer=tracer)
+    engine = ODALEngine(audit_logger=audit_logger, tracer=tracer)
+
+    inputs = ["Deploy to staging", "Scale the web tier", "Remove old snapshots", "Deploy to production"]
+    results = [engine.run_cycle(text, dict(CONTEXT), slow_executor) for text in inputs]
+
+    async def run_async():
+        return await asyncio.gather(*[
+            engine.arun_cycle(text, dict(CONTEXT), slow_executor) for text in inputs
+        ])
+
+    results += asyncio.run(run_async())
+    tracer.flush()
+
+    spans = load_spans(exporter.path)
+    print(f"\n{len(results)} cycles, {len(spans)} spans exported ({exporter.get_statistics()})")
+    assert len({r["trace_id"] for r in results}) == len(results), "one trace per cycle"
+
+    slowest = max(results, key=lambda r: r["duration_ms"])
+    trace = [s for s in spans if s["traceId"] == slowest["trace_id"]]
+    root = next(s for s in trace if "parentSpanId" not in s)
+    print(f"\nSlowest cycle #{slowest['cycle_id']} (trace {slowest['trace_id']}):")
+    print_tree(trace, root)
+
+    with open(audit_logger.current_log_file) as f:
+        records = [json.loads(line) for line in f]
+    correlated = [r for r in records if r.get("trace_id") == slowest["trace_id"]]
+    span_names = {s["spanId"]: s["name"] for s in trace}
+    print(f"\nAudit records in this trace: {len(correlated)}")
+    for record in correlated:
+        print(f"  {record['event_type']:<20} in span {span_names.get(record['span_id'])}")
+    assert correlated, "audit records should carry the trace ID"
+
+    tracer.shutdown()
+
+
+if __name__ == "__main__":
+    main()
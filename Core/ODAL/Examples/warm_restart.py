@@ -0,0 +1,138 @@
+"""
+Example: Warm Restart from an Engine Snapshot
+
+Runs an engine with a cost tracker, a layered intent parser (simulated
+LLM, 50ms per call) and per-user quotas for a few thousand cycles, then:
+- snapshots it and restores the state into a fresh engine, comparing
+  statistics, the next cycle ID, and the first parses of a cold vs warm
+  intent cache
+- keeps snapshots current from a background thread while cycles run
+- shows that a damaged file is refused
+"""
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from SDM_AI_PROJECT.Core.ODAL import ODALEngine, LayeredIntentParser, AdmissionController, PeriodicSnapshot
+from SDM_AI_PROJECT.Core.LLM import CostTracker
+from SDM_AI_PROJECT.Skills.Security.Audit_Logging.audit_logger import AuditLogger
+from SDM_AI_PROJECT.Skills.Security.Policy_Enforcement.policy_engine import PolicyEngine
+
+
+LLM_LATENCY = 0.05
+
+PHRASES = ["Please roll out build {}", "Spin up {} more API workers", "Tear down preview {}"]
+
+
+class Response:
+    def __init__(self, content: str):
+        self.content = content
+
+
+class SimulatedRouter:
+    """Stands in for LLMRouter"""
+
+    def __init__(self, cost_tracker: CostTracker):
+        self.cost_tracker = cost_tracker
+        self.calls = 0
+
+    def generate_with_fallback(self, prompt, preferred_providers=None, **kwargs):
+        self.calls += 1
+        time.sleep(LLM_LATENCY)
+        self.cost_tracker.track("claude", "sonnet", 180, 20, 0.0009, "intent parse")
+        request = prompt.rsplit("Request: ", 1)[1].lower()
+        action_type = "deploy" if "roll out" in request else "scale" if "spin up" in request else "delete"
+        return Response(json.dumps({"action_type": action_type, "environment": None}))
+
+
+def build(workdir: Path):
+    cost_tracker = CostTracker()
+    router = SimulatedRouter(cost_tracker)
+    engine = ODALEngine(
+        policy_engine=PolicyEngine(cost_tracker=cost_tracker),
+        audit_logger=AuditLogger(workdir / "audit"),
+        cost_tracker=cost_tracker,
+        intent_parser=LayeredIntentParser(router),
+        admission=AdmissionController(user_rate=50, user_burst=100)
+    )
+    return engine, router
+
+
+def requests(count: int):
+    for i in range(count):
+        text = PHRASES[i % len(PHRASES)].format(i % 40) if i % 2 else "Deploy to staging"
+        yield text, {"user_id": f"user{i % 25}", "user_role": "admin", "budget_limit": 5000.0}
+
+
+def main():
+    """Snapshot, restore and compare"""
+    print("=" * 70)
+    print("WARM RESTART")
+    print("=" * 70)
+
+    workdir = Path(tempfile.mkdtemp())
+    engine, router = build(workdir)
+    for text, context in requests(3000):
+        engine.run_cycle(text, context)
+    before = engine.get_statistics()
+    print(f"\nRan {before['total_cycles']} cycles ({router.calls} LLM calls, "
+          f"{before['policy_engine_stats']['total_evaluations']} policy evaluations, "
+          f"${engine.cost_tracker.get_summary()['total_cost_usd']:.4f} tracked)")
+
+    snapshot = engine.snapshot(workdir / "engine.snap")
+    print(f"snapshot(): {snapshot['size'] / 1024:.0f} KiB in {snapshot['duration_ms']:.1f}ms, "
+          f"sections {snapshot['sections']}")
+
+    # "Restart"
+    restarted, restarted_router = build(workdir)
+    restored = restarted.restore(workdir / "engine.snap")
+    after = restarted.get_statistics()
+    print(f"restore(): {restored['duration_ms']:.1f}ms, sections {restored['sections']}")
+    for key in ("total_cycles", "approved", "rejected", "pending_approval"):
+        assert before[key] == after[key], key
+    assert before["policy_engine_stats"] == after["policy_engine_stats"]
+    assert before["latency_ms"]["cycle"] == after["latency_ms"]["cycle"]
+    assert engine.cost_tracker.get_summary() == restarted.cost_tracker.get_summary()
+    print("Statistics, policy counters, cost summary and latency histograms match")
+
+    next_cycle = restarted.run_cycle("Deploy to staging", {"user_id": "user1", "user_role": "admin"})
+    print(f"Next cycle ID after restart: #{next_cycle['cycle_id']} (a cold engine would reuse #1)")
+
+    cold, cold_router = build(workdir)
+    for label, target, target_router in (("cold", cold, cold_router), ("warm", restarted, restarted_router)):
+        calls = target_router.calls
+        start = time.perf_counter()
+        for text, context in requests(60):
+            target.intent_parser.parse(text, context)
+        print(f"  first 60 parses, {label} cache: {(time.perf_counter() - start) * 1000:6.0f}ms, "
+              f"{target_router.calls - calls} LLM calls")
+
+    # Background snapshots while cycles run
+    periodic = PeriodicSnapshot(restarted, workdir / "periodic.snap", interval_seconds=0.1).start()
+    start = time.perf_counter()
+    for text, context in requests(2000):
+        restarted.run_cycle(text, context)
+    periodic.stop()
+    print(f"\nPeriodicSnapshot: {periodic.snapshots} snapshots during {time.perf_counter() - start:.1f}s of cycles, "
+          f"last {periodic.last_duration_ms:.1f}ms / {periodic.last_size / 1024:.0f} KiB")
+
+    # A damaged file is refused rather than half-loaded
+    damaged = workdir / "damaged.snap"
+    data = bytearray((workdir / "engine.snap").read_bytes())
+    data[len(data) // 2] ^= 0xFF
+    damaged.write_bytes(bytes(data))
+    try:
+        build(workdir)[0].restore(damaged)
+    except ValueError as e:
+        print(f"\nDamaged snapshot refused: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,41 @@ Observe-Decide-Act-Log state machine for SDM Agent.
 """
 
 from .odal_engine import ODALEngine, ODALPhase, DecisionOutcome
+from .stats import ShardedStats, LatencyHistogram, merge_snapshots
+from .batch import BatchRun, run_batch
+from .profiler import CycleProfiler
+from .retention import RetentionBuffer, RetentionPolicy
+from .intent_parser import LayeredIntentParser
+from .action_plan import ActionPlan, PlanStep
+from .approval_queue import ApprovalQueue
+from .request_queue import RequestQueue, QueueWorkers, run_queue_workers
+from .idempotency import IdempotencyStore
+from .admission import AdmissionController, TokenBucket
+from .scheduler import FairScheduler
+from .snapshot import PeriodicSnapshot
 
 __all__ = [
     "ODALEngine",
     "ODALPhase",
     "DecisionOutcome",
+    "ShardedStats",
+    "LatencyHistogram",
+    "merge_snapshots",
+    "BatchRun",
+    "run_batch",
+    "CycleProfiler",
+    "RetentionBuffer",
+    "RetentionPolicy",
+    "LayeredIntentParser",
+    "ActionPlan",
+    "PlanStep",
+    "ApprovalQueue",
+    "RequestQueue",
+    "QueueWorkers",
+    "run_queue_workers",
+    "IdempotencyStore",
+    "AdmissionController",
+    "TokenBucket",
+    "FairScheduler",
+    "PeriodicSnapshot",
 ]
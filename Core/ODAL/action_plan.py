@@ -0,0 +1,338 @@
+"""
+Action Plan: Dependency-DAG Execution for the ACT Phase
+
+A proposed action may carry a multi-step plan ("scale three services, then
+deploy, then verify") as a list of steps with dependencies:
+
+    {"action_type": "deploy", ..., "plan": [
+        {"id": "scale-api", "action": {...}},
+        {"id": "scale-web", "action": {...}},
+        {"id": "deploy", "action": {...}, "depends_on": ["scale-api", "scale-web"]},
+        {"id": "verify", "action": {...}, "depends_on": ["deploy"], "timeout": 30},
+    ]}
+
+Steps whose dependencies have succeeded run concurrently (at most
+max_workers at a time), each under its own timeout. A failed, timed-out
+step cancels everything that depends on it; independent branches carry
+on. Wall-clock time approaches the critical path instead of the sum.
+A step's timeout counts from when it starts running, not from when it
+was handed to a (possibly busy) pool.
+
+Timeouts cannot interrupt a synchronous step already running on a thread;
+it is abandoned (its result ignored). Coroutine steps run by arun() are
+cancelled.
+"""
+
+import asyncio
+import inspect
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, wait
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+def _resolve(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+class PlanStep:
+    """One step of an action plan, with its outcome once run"""
+
+    __slots__ = (
+        "step_id", "action", "depends_on", "timeout",
+        "status", "result", "error", "started", "finished"
+    )
+
+    def __init__(
+        self,
+        step_id: str,
+        action: Dict[str, Any],
+        depends_on: Optional[List[str]] = None,
+        timeout: Optional[float] = None
+    ):
+        """
+        Initialize Plan Step.
+
+        Args:
+            step_id: Unique step ID within the plan
+            action: Action passed to the action executor
+            depends_on: IDs of steps that must succeed first
+            timeout: Seconds this step may run (None = plan default)
+        """
+        self.step_id = step_id
+        self.action = action
+        self.depends_on = list(depends_on or [])
+        self.timeout = timeout
+        self.status = "pending"
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.started is None or self.finished is None:
+            return None
+        return (self.finished - self.started) * 1000
+
+    def to_dict(self, plan_start: float) -> Dict[str, Any]:
+        return {
+            "id": self.step_id,
+            "action_type": self.action.get("action_type"),
+            "depends_on": self.depends_on,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "start_offset_ms": (self.started - plan_start) * 1000 if self.started is not None else None,
+            "duration_ms": self.duration_ms
+        }
+
+
+class ActionPlan:
+    """
+    Dependency DAG of action steps.
+
+    Features:
+    - Validation of step IDs, dependencies and cycles up front
+    - Bounded concurrency with per-step timeouts
+    - Failure cancels dependents only
+    - Result with per-step timing, wall time, step-time sum and critical path
+    """
+
+    def __init__(
+        self,
+        steps: List[PlanStep],
+        max_workers: int = 4,
+        default_timeout: Optional[float] = None
+    ):
+        """
+        Initialize Action Plan.
+
+        Args:
+            steps: Plan steps
+            max_workers: Steps running at once
+            default_timeout: Timeout for steps without their own (None = no limit)
+
+        Raises:
+            ValueError: Duplicate IDs, unknown dependencies or a dependency cycle
+        """
+        self.steps: Dict[str, PlanStep] = {}
+        for step in steps:
+            if step.step_id in self.steps:
+                raise ValueError(f"Duplicate plan step: {step.step_id}")
+            self.steps[step.step_id] = step
+        self.max_workers = max_workers
+        self.default_timeout = default_timeout
+
+        self._dependents: Dict[str, List[str]] = {step_id: [] for step_id in self.steps}
+        self._waiting: Dict[str, int] = {}
+        for step in self.steps.values():
+            for dependency in step.depends_on:
+                if dependency not in self.steps:
+                    raise ValueError(f"Plan step {step.step_id} depends on unknown step {dependency}")
+                self._dependents[dependency].append(step.step_id)
+            self._waiting[step.step_id] = len(step.depends_on)
+        self._order = self._topological_order()
+        self._started_at: Optional[float] = None
+
+    @classmethod
+    def from_action(cls, action: Dict[str, Any], max_workers: int = 4, default_timeout: Optional[float] = None):
+        """Build from a proposed action's "plan" list"""
+        steps = [
+            PlanStep(
+                str(step.get("id", index)),
+                step["action"],
+                step.get("depends_on"),
+                step.get("timeout")
+            )
+            for index, step in enumerate(action["plan"])
+        ]
+        return cls(steps, max_workers, default_timeout)
+
+    def _topological_order(self) -> List[str]:
+        waiting = dict(self._waiting)
+        order = [step_id for step_id, count in waiting.items() if count == 0]
+        for step_id in order:
+            for dependent in self._dependents[step_id]:
+                waiting[dependent] -= 1
+                if waiting[dependent] == 0:
+                    order.append(dependent)
+        if len(order) != len(self.steps):
+            cyclic = sorted(step_id for step_id, count in waiting.items() if count)
+            raise ValueError(f"Plan has a dependency cycle through: {', '.join(cyclic)}")
+        return order
+
+    # Scheduling state shared by run() and arun()
+
+    def _initially_ready(self) -> List[PlanStep]:
+        return [self.steps[step_id] for step_id in self._order if self._waiting[step_id] == 0]
+
+    def _timeout(self, step: PlanStep) -> Optional[float]:
+        return step.timeout if step.timeout is not None else self.default_timeout
+
+    def _succeed(self, step: PlanStep, result: Any) -> List[PlanStep]:
+        """Record success; return dependents that became ready"""
+        step.finished = time.perf_counter()
+        step.status = "success"
+        step.result = result
+        ready = []
+        for dependent in self._dependents[step.step_id]:
+            self._waiting[dependent] -= 1
+            if self._waiting[dependent] == 0 and self.steps[dependent].status == "pending":
+                ready.append(self.steps[dependent])
+        return ready
+
+    def _fail(self, step: PlanStep, status: str, error: str):
+        """Record a failure or timeout and cancel everything downstream"""
+        step.finished = time.perf_counter()
+        step.status = status
+        step.error = error
+        stack = list(self._dependents[step.step_id])
+        while stack:
+            dependent = self.steps[stack.pop()]
+            if dependent.status == "pending":
+                dependent.status = "cancelled"
+                dependent.error = f"Dependency {step.step_id} {status}"
+                stack.extend(self._dependents[dependent.step_id])
+
+    # Drivers
+
+    def run(self, step_executor: Callable[[Dict], Any], pool: Executor) -> Dict[str, Any]:
+        """
+        Execute the plan on a thread pool.
+
+        Args:
+            step_executor: Called with each step's action
+            pool: Executor the steps run on
+
+        Returns:
+            Plan result (see result())
+        """
+        self._started_at = time.perf_counter()
+        ready = self._initially_ready()
+        running = {}  # future -> step
+
+        def call(step: PlanStep):
+            step.started = time.perf_counter()
+            return step_executor(step.action)
+
+        while ready or running:
+            while ready and len(running) < self.max_workers:
+                step = ready.pop(0)
+                step.status = "running"
+                running[pool.submit(call, step)] = step
+
+            # A step's timeout runs from when a worker starts it, not while it
+            # queues in the (shared) pool; a queued step's deadline is at least
+            # now + timeout, so waking then is never late
+            now = time.perf_counter()
+            deadlines = [
+                (step.started if step.started is not None else now) + self._timeout(step)
+                for step in running.values() if self._timeout(step) is not None
+            ]
+            wait_for = max(min(deadlines) - now, 0) if deadlines else None
+            done, _ = wait(list(running), timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                step = running.pop(future)
+                try:
+                    ready.extend(self._succeed(step, future.result()))
+                except Exception as e:
+                    self._fail(step, "failed", str(e))
+
+            now = time.perf_counter()
+            for future, step in list(running.items()):
+                timeout = self._timeout(step)
+                if timeout is not None and step.started is not None and now >= step.started + timeout:
+                    # A running thread cannot be stopped; abandon it
+                    del running[future]
+                    self._fail(step, "timeout", f"Timed out after {timeout}s")
+
+        return self.result()
+
+    async def arun(
+        self,
+        step_executor: Callable[[Dict], Any],
+        run_in_executor: Callable[..., Awaitable]
+    ) -> Dict[str, Any]:
+        """
+        Execute the plan on the event loop.
+
+        Args:
+            step_executor: Function or coroutine function called with each step's action
+            run_in_executor: Coroutine function running a plain function off the loop
+
+        Returns:
+            Plan result (see result())
+        """
+        self._started_at = time.perf_counter()
+        ready = self._initially_ready()
+        running = {}  # task -> step
+
+        async def call(step: PlanStep):
+            timeout = self._timeout(step)
+            if inspect.iscoroutinefunction(step_executor):
+                step.started = time.perf_counter()
+                result = await asyncio.wait_for(step_executor(step.action), timeout)
+            else:
+                # The timeout starts when a worker picks the step up, not while it queues
+                loop = asyncio.get_running_loop()
+                began = loop.create_future()
+
+                def timed(action):
+                    step.started = time.perf_counter()
+                    loop.call_soon_threadsafe(_resolve, began)
+                    return step_executor(action)
+
+                work = asyncio.ensure_future(run_in_executor(timed, step.action))
+                await asyncio.wait([began, work], return_when=asyncio.FIRST_COMPLETED)
+                began.cancel()
+                if timeout is not None and not work.done():
+                    timeout = max(timeout - (time.perf_counter() - step.started), 0)
+                result = await asyncio.wait_for(work, timeout)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        while ready or running:
+            while ready and len(running) < self.max_workers:
+                step = ready.pop(0)
+                step.status = "running"
+                running[asyncio.ensure_future(call(step))] = step
+
+            done, _ = await asyncio.wait(list(running), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                step = running.pop(task)
+                try:
+                    ready.extend(self._succeed(step, task.result()))
+                except asyncio.TimeoutError:
+                    self._fail(step, "timeout", f"Timed out after {self._timeout(step)}s")
+                except Exception as e:
+                    self._fail(step, "failed", str(e))
+
+        return self.result()
+
+    def critical_path_ms(self) -> float:
+        """Longest dependency chain, by measured step durations"""
+        longest: Dict[str, float] = {}
+        for step_id in self._order:
+            step = self.steps[step_id]
+            before = max((longest[d] for d in step.depends_on), default=0.0)
+            longest[step_id] = before + (step.duration_ms or 0.0)
+        return max(longest.values(), default=0.0)
+
+    def result(self) -> Dict[str, Any]:
+        """Plan outcome with per-step timing"""
+        start = self._started_at if self._started_at is not None else time.perf_counter()
+        finished = [step.finished for step in self.steps.values() if step.finished is not None]
+        statuses = [step.status for step in self.steps.values()]
+        return {
+            "status": "success" if all(s == "success" for s in statuses) else "failed",
+            "steps": [self.steps[step_id].to_dict(start) for step_id in self._order],
+            "succeeded": statuses.count("success"),
+            "failed": statuses.count("failed") + statuses.count("timeout"),
+            "cancelled": statuses.count("cancelled"),
+            "wall_ms": (max(finished) - start) * 1000 if finished else 0.0,
+            "step_sum_ms": sum(step.duration_ms or 0.0 for step in self.steps.values()),
+            "critical_path_ms": self.critical_path_ms()
+        }
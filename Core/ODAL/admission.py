@@ -0,0 +1,336 @@
+"""
+Admission Control: Load Shedding in Front of O.D.A.L. Cycles
+
+Without admission control every request is accepted, queues grow and
+latency with them - for everyone. AdmissionController decides, before
+any phase runs, whether a cycle may start:
+
+1. Quota: each user has a token bucket (rate per second, burst); an
+   empty bucket refuses the request.
+2. Concurrency: cycles in flight are capped per priority class; lower
+   classes get a smaller share, keeping headroom for interactive work.
+3. Latency: while recent cycle latency exceeds the SLO, only the
+   protected classes are admitted.
+
+A refused request is either rejected at once or, with defer_seconds,
+waits that long for capacity to free up. The engine turns a refusal into
+an "overloaded" decision without observing, deciding or acting.
+
+Priority comes from context["priority"]: "interactive" (default),
+"batch" or "background"; anything else counts as the default.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+PRIORITY_CLASSES = ("interactive", "batch", "background")
+DEFAULT_PRIORITY = "interactive"
+
+_ASYNC_DEFER_POLL_SECONDS = 0.005
+
+
+def priority_of(context: Dict) -> str:
+    """Priority class of a request; missing or unknown values get the default class"""
+    priority = context.get("priority", DEFAULT_PRIORITY)
+    # A client-supplied field must not crash the cycle before it is logged
+    return priority if priority in PRIORITY_CLASSES else DEFAULT_PRIORITY
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at rate tokens per second"""
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float, now: Optional[float] = None):
+        """
+        Initialize Token Bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity (starts full)
+            now: time.monotonic() reading the bucket starts at (default: now)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic() if now is None else now
+
+    def take(self, now: float) -> bool:
+        # Readings taken by other threads may arrive slightly out of order
+        self.tokens = min(self.burst, self.tokens + max(now - self.updated, 0.0) * self.rate)
+        self.updated = max(now, self.updated)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class AdmissionController:
+    """
+    Admission controller with quotas, concurrency shares and a latency SLO.
+
+    Features:
+    - Per-user token buckets (with per-user overrides; LRU-bounded)
+    - In-flight caps per priority class
+    - Latency EWMA against an SLO; stale readings count as healthy
+    - Immediate rejection or bounded deferral (threads and asyncio)
+    - Admit/shed/defer counters by class and reason
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 64,
+        class_shares: Optional[Dict[str, float]] = None,
+        latency_slo_ms: Optional[float] = None,
+        protected_classes: Tuple[str, ...] = ("interactive",),
+        latency_window_seconds: float = 10.0,
+        user_rate: Optional[float] = None,
+        user_burst: Optional[float] = None,
+        user_quotas: Optional[Dict[str, Tuple[float, float]]] = None,
+        defer_seconds: float = 0.0,
+        max_users: int = 100000,
+        metrics=None
+    ):
+        """
+        Initialize Admission Controller.
+
+        Args:
+            max_in_flight: Cycles in flight at once (interactive share = 1.0)
+            class_shares: Fraction of max_in_flight each class may use
+                (default: interactive 1.0, batch 0.75, background 0.5)
+            latency_slo_ms: Target cycle latency; above it only
+                protected_classes are admitted (None = no latency check)
+            protected_classes: Classes still admitted while over the SLO
+            latency_window_seconds: Latency readings older than this are
+                ignored (nothing completing means nothing to protect)
+            user_rate: Requests per second per user (None = no quotas)
+            user_burst: Bucket size per user (default: 2 seconds of user_rate,
+                at least 1 request)
+            user_quotas: Per-user (rate, burst) overrides
+            defer_seconds: How long a refused request may wait for capacity
+                (0 = reject at once); quota refusals never wait
+            max_users: Token buckets kept (least recently used dropped)
+            metrics: Metrics registry (see Core/Observability); None disables metrics
+        """
+        shares = {"interactive": 1.0, "batch": 0.75, "background": 0.5}
+        shares.update(class_shares or {})
+        self.max_in_flight = max_in_flight
+        self.class_limits = {
+            priority: max(1, int(max_in_flight * shares[priority])) for priority in PRIORITY_CLASSES
+        }
+        self.latency_slo_ms = latency_slo_ms
+        self.protected_classes = frozenset(protected_classes)
+        self.latency_window_seconds = latency_window_seconds
+        self.user_rate = user_rate
+        self.user_burst = user_burst if user_burst is not None else max((user_rate or 0) * 2, 1)
+        self.user_quotas = dict(user_quotas or {})
+        self.defer_seconds = defer_seconds
+        self.max_users = max_users
+
+        self._condition = threading.Condition()
+        self.in_flight = 0
+        self._buckets: "OrderedDict[Any, TokenBucket]" = OrderedDict()
+        self._latency_ewma: Optional[float] = None
+        self._latency_updated = 0.0
+        self._counts: Dict[str, int] = {}
+
+        self.metrics = metrics
+        if metrics is not None:
+            self._m_decisions = metrics.counter(
+                "odal_admission_total", "Admission decisions", ["priority", "outcome"]
+            )
+            metrics.gauge("odal_admission_in_flight", "Admitted cycles in flight").set_function(
+                lambda controller: controller.in_flight, owner=self
+            )
+
+    # Checks (called with the condition held)
+
+    def _count(self, priority: str, outcome: str):
+        key = f"{priority}:{outcome}"
+        self._counts[key] = self._counts.get(key, 0) + 1
+        if self.metrics is not None:
+            self._m_decisions.labels(priority, outcome).inc()
+
+    def _take_token(self, user_id: Any, now: float) -> bool:
+        if user_id in self.user_quotas:
+            rate, burst = self.user_quotas[user_id]
+        elif self.user_rate is not None:
+            rate, burst = self.user_rate, self.user_burst
+        else:
+            return True
+        bucket = self._buckets.get(user_id)
+        if bucket is None:
+            bucket = self._buckets[user_id] = TokenBucket(rate, burst, now)
+            if len(self._buckets) > self.max_users:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(user_id)
+        return bucket.take(now)
+
+    def latency_ms(self, now: Optional[float] = None) -> Optional[float]:
+        """Recent cycle latency (EWMA), or None if there is no fresh reading"""
+        now = time.monotonic() if now is None else now
+        if self._latency_ewma is None or now - self._latency_updated > self.latency_window_seconds:
+            return None
+        return self._latency_ewma
+
+    def _capacity_refusal(self, priority: str, now: float) -> Optional[str]:
+        if self.in_flight >= self.class_limits[priority]:
+            return "concurrency"
+        if self.latency_slo_ms is not None and priority not in self.protected_classes:
+            latency = self.latency_ms(now)
+            if latency is not None and latency > self.latency_slo_ms:
+                return "latency"
+        return None
+
+    @staticmethod
+    def _reason(refusal: str, priority: str) -> str:
+        if refusal == "quota":
+            return "Overloaded: request quota exceeded"
+        if refusal == "concurrency":
+            return f"Overloaded: too many {priority} cycles in flight"
+        return f"Overloaded: latency above SLO, shedding {priority} requests"
+
+    def _admit(self, priority: str, refusal: str):
+        self.in_flight += 1
+        self._count(priority, "deferred_admitted" if refusal else "admitted")
+
+    # Public API
+
+    def admit(self, context: Dict) -> Optional[str]:
+        """
+        Admit a request or explain why not, waiting up to defer_seconds.
+
+        Args:
+            context: Cycle context (user_id, priority)
+
+        Returns:
+            None if admitted (call release() when the cycle ends),
+            otherwise the refusal reason
+        """
+        priority = priority_of(context)
+        with self._condition:
+            now = time.monotonic()
+            if not self._take_token(context.get("user_id"), now):
+                self._count(priority, "shed_quota")
+                return self._reason("quota", priority)
+
+            refusal = self._capacity_refusal(priority, now)
+            if refusal is not None and self.defer_seconds > 0:
+                deadline = now + self.defer_seconds
+                while refusal is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                    retry = self._capacity_refusal(priority, time.monotonic())
+                    if retry is None:
+                        self._admit(priority, refusal)
+                        return None
+                    refusal = retry
+
+            if refusal is None:
+                self._admit(priority, None)
+                return None
+            self._count(priority, f"shed_{refusal}")
+            return self._reason(refusal, priority)
+
+    async def aadmit(self, context: Dict) -> Optional[str]:
+        """admit() for the event loop: deferral waits without blocking the loop"""
+        priority = priority_of(context)
+        with self._condition:
+            now = time.monotonic()
+            if not self._take_token(context.get("user_id"), now):
+                self._count(priority, "shed_quota")
+                return self._reason("quota", priority)
+            refusal = self._capacity_refusal(priority, now)
+            if refusal is None:
+                self._admit(priority, None)
+                return None
+
+        deadline = time.monotonic() + self.defer_seconds
+        while time.monotonic() < deadline:
+            await asyncio.sleep(_ASYNC_DEFER_POLL_SECONDS)
+            with self._condition:
+                retry = self._capacity_refusal(priority, time.monotonic())
+                if retry is None:
+                    self._admit(priority, refusal)
+                    return None
+                refusal = retry
+
+        with self._condition:
+            self._count(priority, f"shed_{refusal}")
+        return self._reason(refusal, priority)
+
+    def release(self, duration_ms: Optional[float] = None, alpha: float = 0.2):
+        """
+        End an admitted cycle.
+
+        Args:
+            duration_ms: Cycle latency, fed into the latency EWMA
+            alpha: EWMA weight of this reading
+        """
+        with self._condition:
+            self.in_flight -= 1
+            if duration_ms is not None:
+                now = time.monotonic()
+                if self._latency_ewma is None or now - self._latency_updated > self.latency_window_seconds:
+                    self._latency_ewma = duration_ms
+                else:
+                    self._latency_ewma += alpha * (duration_ms - self._latency_ewma)
+                self._latency_updated = now
+            self._condition.notify_all()
+
+    def export_state(self) -> Dict[str, Any]:
+        """Token-bucket levels and counters as JSON-serialisable state (for engine snapshots)"""
+        with self._condition:
+            now = time.monotonic()
+            buckets = [
+                [user_id, min(bucket.burst, bucket.tokens + max(now - bucket.updated, 0.0) * bucket.rate)]
+                for user_id, bucket in self._buckets.items()
+            ]
+            return {"buckets": buckets, "counts": dict(self._counts)}
+
+    def import_state(self, state: Dict[str, Any]):
+        """
+        Replace bucket levels and counters with exported state.
+
+        Buckets resume at their saved level (refilling from now on, at the
+        currently configured rate), so a restart does not hand every user
+        a fresh burst.
+        """
+        with self._condition:
+            now = time.monotonic()
+            self._buckets.clear()
+            for user_id, tokens in state.get("buckets", []):
+                if user_id in self.user_quotas:
+                    rate, burst = self.user_quotas[user_id]
+                elif self.user_rate is not None:
+                    rate, burst = self.user_rate, self.user_burst
+                else:
+                    continue  # Quotas are off now
+                bucket = self._buckets[user_id] = TokenBucket(rate, burst, now)
+                bucket.tokens = min(tokens, burst)
+            self._counts = dict(state.get("counts", {}))
+
+    def get_statistics(self) -> Dict[str, Any]:
+        with self._condition:
+            by_class: Dict[str, Dict[str, int]] = {}
+            for key, count in self._counts.items():
+                priority, outcome = key.split(":", 1)
+                by_class.setdefault(priority, {})[outcome] = count
+            admitted = sum(n for key, n in self._counts.items() if key.endswith("admitted"))
+            shed = sum(n for key, n in self._counts.items() if ":shed_" in key)
+            return {
+                "admitted": admitted,
+                "shed": shed,
+                "shed_rate": shed / (admitted + shed) if admitted + shed else 0.0,
+                "in_flight": self.in_flight,
+                "latency_ms": self.latency_ms(),
+                "by_class": by_class,
+                "tracked_users": len(self._buckets)
+            }
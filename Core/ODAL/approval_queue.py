@@ -0,0 +1,212 @@
+"""
+Approval Queue: Durable Parking of Cycles Awaiting Human Approval
+
+A cycle whose decision is require_approval is checkpointed here (observation
+and decision: input, context, guard summary, proposed action, reasoning,
+policy details, policy-set version). ODALEngine.approve()/reject() resume it
+straight into ACT, without re-running the guard, intent parsing or policy
+evaluation - unless the policy set changed in the meantime.
+
+Storage is a local SQLite database in WAL mode; pending entries are listed
+through a partial index, so listing stays fast however many decided
+entries accumulate.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS approvals (
+    approval_id    TEXT PRIMARY KEY,
+    cycle_id       INTEGER NOT NULL,
+    status         TEXT NOT NULL,
+    created_at     REAL NOT NULL,
+    expires_at     REAL,
+    policy_version TEXT,
+    user_id        TEXT,
+    action_type    TEXT,
+    reasoning      TEXT,
+    checkpoint     TEXT NOT NULL,
+    decided_at     REAL,
+    decided_by     TEXT,
+    note           TEXT
+);
+CREATE INDEX IF NOT EXISTS approvals_pending
+    ON approvals (created_at) WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS approvals_pending_user
+    ON approvals (user_id, created_at) WHERE status = 'pending';
+"""
+
+_SUMMARY_COLUMNS = (
+    "approval_id", "cycle_id", "status", "created_at", "expires_at",
+    "policy_version", "user_id", "action_type", "reasoning"
+)
+
+
+class ApprovalQueue:
+    """
+    SQLite-backed queue of cycles awaiting approval.
+
+    Features:
+    - WAL journal; one small row per parked cycle
+    - Atomic claim: an entry is approved/rejected at most once, even with
+      several processes sharing the database
+    - Expiry (per queue TTL)
+    - Indexed listing of pending entries
+    """
+
+    def __init__(self, path: Path, ttl_seconds: Optional[float] = 7 * 24 * 3600):
+        """
+        Initialize Approval Queue.
+
+        Args:
+            path: SQLite database file
+            ttl_seconds: Pending entries expire after this long (None = never)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("PRAGMA busy_timeout=5000")
+        self._db.executescript(_SCHEMA)
+
+    def park(self, checkpoint: Dict[str, Any], policy_version: Optional[str] = None) -> str:
+        """
+        Store a cycle checkpoint.
+
+        Args:
+            checkpoint: Observation and decision of the cycle (JSON-serialisable)
+            policy_version: Version of the policy set that made the decision
+
+        Returns:
+            Approval ID
+        """
+        approval_id = uuid.uuid4().hex
+        now = time.time()
+        action = checkpoint.get("proposed_action") or {}
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO approvals (approval_id, cycle_id, status, created_at, expires_at,"
+                " policy_version, user_id, action_type, reasoning, checkpoint)"
+                " VALUES (?, ?, 'pending', ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    approval_id,
+                    checkpoint["cycle_id"],
+                    now,
+                    now + self.ttl_seconds if self.ttl_seconds is not None else None,
+                    policy_version,
+                    (checkpoint.get("context") or {}).get("user_id"),
+                    action.get("action_type"),
+                    checkpoint.get("reasoning"),
+                    json.dumps(checkpoint, default=str)
+                )
+            )
+        return approval_id
+
+    def claim(self, approval_id: str, status: str, decided_by: Optional[str] = None,
+              note: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Move a pending entry to approved/rejected, exactly once.
+
+        An expired entry is marked expired instead.
+
+        Args:
+            approval_id: Entry to decide
+            status: "approved" or "rejected"
+            decided_by: Approver identity
+            note: Free-text reason
+
+        Returns:
+            Entry with its checkpoint and final status
+
+        Raises:
+            KeyError: Unknown approval ID
+            ValueError: Entry is no longer pending
+        """
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._db.execute(
+                    f"SELECT {', '.join(_SUMMARY_COLUMNS)}, checkpoint FROM approvals WHERE approval_id = ?",
+                    (approval_id,)
+                ).fetchone()
+                if row is None:
+                    raise KeyError(approval_id)
+                entry = dict(zip(_SUMMARY_COLUMNS, row[:-1]))
+                if entry["status"] != "pending":
+                    raise ValueError(f"Approval {approval_id} is already {entry['status']}")
+                if entry["expires_at"] is not None and entry["expires_at"] <= now:
+                    status = "expired"
+                self._db.execute(
+                    "UPDATE approvals SET status = ?, decided_at = ?, decided_by = ?, note = ?"
+                    " WHERE approval_id = ?",
+                    (status, now, decided_by, note, approval_id)
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        entry["status"] = status
+        entry["checkpoint"] = json.loads(row[-1])
+        return entry
+
+    def list_pending(self, user_id: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Pending, unexpired entries, oldest first (without checkpoints).
+
+        Args:
+            user_id: Only entries for this user
+            limit: Maximum entries returned
+        """
+        where = "status = 'pending' AND (expires_at IS NULL OR expires_at > ?)"
+        params: List[Any] = [time.time()]
+        if user_id is not None:
+            where += " AND user_id = ?"
+            params.append(user_id)
+        params.append(limit)
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT {', '.join(_SUMMARY_COLUMNS)} FROM approvals"
+                f" WHERE {where} ORDER BY created_at LIMIT ?",
+                params
+            ).fetchall()
+        return [dict(zip(_SUMMARY_COLUMNS, row)) for row in rows]
+
+    def get(self, approval_id: str) -> Optional[Dict[str, Any]]:
+        """Entry summary (any status), or None"""
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {', '.join(_SUMMARY_COLUMNS)} FROM approvals WHERE approval_id = ?",
+                (approval_id,)
+            ).fetchone()
+        return dict(zip(_SUMMARY_COLUMNS, row)) if row else None
+
+    def expire(self) -> int:
+        """Mark overdue pending entries expired; returns how many"""
+        with self._lock:
+            cursor = self._db.execute(
+                "UPDATE approvals SET status = 'expired', decided_at = ?"
+                " WHERE status = 'pending' AND expires_at <= ?",
+                (time.time(), time.time())
+            )
+        return cursor.rowcount
+
+    def get_statistics(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._db.execute("SELECT status, COUNT(*) FROM approvals GROUP BY status").fetchall()
+        return dict(rows)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,443 @@
+"""
+O.D.A.L. Batch Mode: Worker-Pool Execution of Many Cycles
+
+Shards a stream of requests across N workers (threads or processes). Each
+worker builds its own engine - Prompt Guard, Policy Engine and a
+multi-writer Audit Logger segment - once, then runs cycles until the input
+is exhausted. Requests flow through a bounded input queue, so a huge (or
+lazy) request iterable is never materialised and producers are throttled
+to what the workers can handle.
+
+Results stream back either in input order or as they complete, and the
+per-worker statistics are merged into the shape of ODALEngine.get_statistics().
+"""
+
+import multiprocessing
+import os
+import queue
+import re
+import socket
+import threading
+import traceback
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+try:
+    from .odal_engine import ODALEngine
+    from .stats import merge_snapshots
+except ImportError:
+    # Fallback for direct execution
+    from odal_engine import ODALEngine
+    from stats import merge_snapshots
+
+try:
+    from Skills.Security.Prompt_Guard.prompt_guard import PromptGuard
+    from Skills.Security.Policy_Enforcement.policy_engine import PolicyEngine
+    from Skills.Security.Audit_Logging.audit_logger import AuditLogger
+    from Skills.Security.Audit_Logging.audit_report import ReportAggregate
+except ImportError:
+    # Fallback for direct execution
+    from SDM_AI_PROJECT.Skills.Security.Prompt_Guard.prompt_guard import PromptGuard
+    from SDM_AI_PROJECT.Skills.Security.Policy_Enforcement.policy_engine import PolicyEngine
+    from SDM_AI_PROJECT.Skills.Security.Audit_Logging.audit_logger import AuditLogger
+    from SDM_AI_PROJECT.Skills.Security.Audit_Logging.audit_report import ReportAggregate
+
+
+_STOP = None
+_QUEUE_POLL_SECONDS = 0.1
+
+
+def default_engine_factory(
+    worker_index: int,
+    log_dir: Optional[Path] = None,
+    policy_dir: Optional[Path] = None
+) -> ODALEngine:
+    """
+    Build a worker engine with its own guard, policy engine and audit segment.
+
+    Args:
+        worker_index: Worker number (0-based)
+        log_dir: Audit log directory shared by all workers
+        policy_dir: Policy directory
+
+    Returns:
+        Initialised ODALEngine
+    """
+    writer_id = re.sub(
+        r"[^A-Za-z0-9_-]", "_", f"{socket.gethostname()}-{os.getpid()}-w{worker_index}"
+    )
+    return ODALEngine(
+        prompt_guard=PromptGuard(),
+        policy_engine=PolicyEngine(policy_dir=policy_dir),
+        audit_logger=AuditLogger(
+            log_dir, multi_writer=True, writer_id=writer_id, background_writer=True
+        )
+    )
+
+
+def _normalize_request(request: Union[str, Dict]) -> Dict:
+    if isinstance(request, str):
+        return {"input": request, "context": {}}
+    return request
+
+
+def _worker_main(
+    worker_index: int,
+    workers: int,
+    engine_factory: Callable[[int], ODALEngine],
+    action_executor: Optional[Callable],
+    input_queue,
+    output_queue
+):
+    """Worker loop (thread or process): build the engine once, run cycles until _STOP"""
+    try:
+        engine = engine_factory(worker_index)
+        # Stride cycle IDs so they stay unique across the whole batch
+        engine.set_cycle_ids(start=worker_index + 1, step=workers)
+
+        while True:
+            item = input_queue.get()
+            if item is _STOP:
+                break
+            index, request = item
+            result = engine.run_cycle(
+                request.get("input", ""),
+                request.get("context"),
+                action_executor
+            )
+            result["batch_index"] = index
+            result["worker"] = worker_index
+            output_queue.put(("result", index, result))
+
+        engine.audit_logger.close()
+        output_queue.put(("done", worker_index, {
+            "stats": engine.get_stats_snapshot(),
+            "prompt_guard_stats": engine.prompt_guard.get_statistics(),
+            "policy_engine_stats": engine.policy_engine.get_statistics(),
+            "audit_totals": engine.audit_logger.totals.to_dict()
+        }))
+    except BaseException:
+        output_queue.put(("error", worker_index, traceback.format_exc()))
+
+
+def merge_statistics(worker_stats: List[Dict]) -> Dict:
+    """
+    Merge per-worker statistics into the ODALEngine.get_statistics() shape.
+
+    Args:
+        worker_stats: Payloads reported by the workers
+
+    Returns:
+        Merged statistics
+    """
+    snapshot = merge_snapshots(s["stats"] for s in worker_stats)
+    if not snapshot["counters"].get("total_cycles"):
+        return {"total_cycles": 0}
+
+    # Prompt Guard
+    detections = sum(s["prompt_guard_stats"]["total_detections"] for s in worker_stats)
+    guard_stats: Dict[str, Any] = {"total_detections": detections}
+    if detections:
+        distribution: Dict[str, int] = {}
+        last = []
+        for s in worker_stats:
+            for level, n in s["prompt_guard_stats"].get("severity_distribution", {}).items():
+                distribution[level] = distribution.get(level, 0) + n
+            if s["prompt_guard_stats"].get("last_detection"):
+                last.append(s["prompt_guard_stats"]["last_detection"])
+        guard_stats["severity_distribution"] = distribution
+        guard_stats["last_detection"] = max(last)
+
+    # Policy Engine
+    evaluations = sum(s["policy_engine_stats"]["total_evaluations"] for s in worker_stats)
+    policy_stats: Dict[str, Any] = {"total_evaluations": evaluations}
+    if evaluations:
+        approvals = sum(s["policy_engine_stats"]["approvals"] for s in worker_stats if "approvals" in s["policy_engine_stats"])
+        policy_stats.update({
+            "approvals": approvals,
+            "rejections": evaluations - approvals,
+            "approval_rate": approvals / evaluations
+        })
+
+    # Audit Logger
+    audit = ReportAggregate()
+    for s in worker_stats:
+        audit.merge(ReportAggregate.from_dict(s["audit_totals"]))
+
+    return ODALEngine.summarize_statistics(snapshot, guard_stats, policy_stats, audit.to_statistics())
+
+
+class BatchRun:
+    """
+    One batch execution; iterate it to receive results.
+
+    Features:
+    - Self-managed thread or process workers
+    - Bounded input and output queues (backpressure)
+    - Ordered or as-completed result streaming; ordered runs hold at most
+      reorder_window results back behind a slow request
+    - Merged statistics once iteration finishes
+    """
+
+    def __init__(
+        self,
+        requests: Iterable[Union[str, Dict]],
+        workers: int = 4,
+        mode: str = "thread",
+        ordered: bool = True,
+        action_executor: Optional[Callable] = None,
+        engine_factory: Optional[Callable[[int], ODALEngine]] = None,
+        queue_size: Optional[int] = None,
+        mp_context: Optional[str] = None,
+        reorder_window: Optional[int] = None
+    ):
+        """
+        Initialize Batch Run.
+
+        Args:
+            requests: Iterable of {"input": str, "context": dict} (or plain strings)
+            workers: Number of workers
+            mode: "thread" or "process"
+            ordered: Yield results in input order (otherwise as completed)
+            action_executor: Executor for approved actions (picklable in process mode)
+            engine_factory: Callable(worker_index) -> ODALEngine, called inside
+                each worker (picklable in process mode)
+            queue_size: Bound of the input/output queues (default: 4 per worker)
+            mp_context: multiprocessing start method for process mode
+            reorder_window: In ordered mode, requests submitted ahead of the
+                oldest unfinished one (default: what the queues and workers
+                hold); bounds the results buffered while it is slow
+        """
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unknown batch mode: {mode}")
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+
+        self.requests = requests
+        self.workers = workers
+        self.mode = mode
+        self.ordered = ordered
+        self.action_executor = action_executor
+        self.engine_factory = engine_factory or default_engine_factory
+        self.queue_size = queue_size or workers * 4
+        self.mp_context = mp_context
+        self.reorder_window = reorder_window or self.queue_size * 2 + workers
+
+        self.submitted = 0
+        self.completed = 0
+        self.statistics: Optional[Dict] = None
+        self._started = False
+        self._feed_error: Optional[BaseException] = None
+        # Results yielded in order so far; the feeder stays within reorder_window of it
+        self._released = 0
+        self._window = threading.Condition()
+
+    def _start(self):
+        if self.mode == "process":
+            context = multiprocessing.get_context(self.mp_context)
+            self._input = context.Queue(self.queue_size)
+            self._output = context.Queue(self.queue_size)
+            worker_cls = context.Process
+        else:
+            self._input = queue.Queue(self.queue_size)
+            self._output = queue.Queue(self.queue_size)
+            worker_cls = threading.Thread
+
+        self._stop = threading.Event()
+        self._workers = [
+            worker_cls(
+                target=_worker_main,
+                args=(i, self.workers, self.engine_factory, self.action_executor, self._input, self._output),
+                name=f"odal-batch-{i}",
+                daemon=True
+            )
+            for i in range(self.workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+        self._feeder = threading.Thread(target=self._feed, name="odal-batch-feeder", daemon=True)
+        self._feeder.start()
+
+    def _put(self, item) -> bool:
+        """Blocking put that gives up when the run is abandoned"""
+        while not self._stop.is_set():
+            try:
+                self._input.put(item, timeout=_QUEUE_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _wait_for_window(self, index: int) -> bool:
+        """Block while index is a full reorder window ahead; False when the run is abandoned"""
+        with self._window:
+            while index >= self._released + self.reorder_window:
+                if self._stop.is_set():
+                    return False
+                self._window.wait(_QUEUE_POLL_SECONDS)
+        return True
+
+    def _feed(self):
+        try:
+            for index, request in enumerate(self.requests):
+                if self.ordered and not self._wait_for_window(index):
+                    return
+                if not self._put((index, _normalize_request(request))):
+                    return
+                self.submitted = index + 1
+        except BaseException as e:
+            self._feed_error = e
+        finally:
+            for _ in range(self.workers):
+                if not self._put(_STOP):
+                    return
+
+    def __iter__(self) -> Iterator[Dict]:
+        if self._started:
+            raise RuntimeError("A BatchRun can only be iterated once")
+        self._started = True
+        self._start()
+
+        worker_stats = []
+        pending: Dict[int, Dict] = {}
+        next_index = 0
+        finished = False
+        try:
+            while len(worker_stats) < self.workers:
+                kind, key, payload = self._output.get()
+                if kind == "error":
+                    raise RuntimeError(f"Batch worker {key} failed:\n{payload}")
+                if kind == "done":
+                    worker_stats.append(payload)
+                    continue
+
+                self.completed += 1
+                if not self.ordered:
+                    yield payload
+                    continue
+                pending[key] = payload
+                ready = []
+                while next_index in pending:
+                    ready.append(pending.pop(next_index))
+                    next_index += 1
+                if ready:
+                    with self._window:
+                        self._released = next_index
+                        self._window.notify()
+                    yield from ready
+
+            finished = True
+            if self._feed_error is not None:
+                raise RuntimeError("Reading batch requests failed") from self._feed_error
+            self.statistics = merge_statistics(worker_stats)
+        finally:
+            self._shutdown(finished)
+
+    @staticmethod
+    def _drain(q):
+        try:
+            while True:
+                q.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _shutdown(self, finished: bool):
+        self._stop.set()
+        self._feeder.join()
+
+        if not finished:
+            # Abandoned early: drop queued work and release blocked workers
+            self._drain(self._input)
+            for _ in self._workers:
+                try:
+                    self._input.put_nowait(_STOP)
+                except queue.Full:
+                    break
+
+        for worker in self._workers:
+            for _ in range(50):
+                worker.join(timeout=_QUEUE_POLL_SECONDS)
+                if not worker.is_alive():
+                    break
+                self._drain(self._output)  # A worker may be blocked on a full output queue
+            if self.mode == "process" and worker.is_alive():
+                worker.terminate()
+
+        if self.mode == "process":
+            for q in (self._input, self._output):
+                q.cancel_join_thread()
+                q.close()
+
+
+def run_batch(
+    requests: Iterable[Union[str, Dict]],
+    workers: int = 4,
+    mode: str = "thread",
+    ordered: bool = True,
+    action_executor: Optional[Callable] = None,
+    log_dir: Optional[Path] = None,
+    policy_dir: Optional[Path] = None,
+    engine_factory: Optional[Callable[[int], ODALEngine]] = None,
+    queue_size: Optional[int] = None,
+    reorder_window: Optional[int] = None
+) -> BatchRun:
+    """
+    Run many O.D.A.L. cycles on a worker pool.
+
+    Args:
+        requests: Iterable of {"input": str, "context": dict} (or plain strings)
+        workers: Number of workers
+        mode: "thread" or "process"
+        ordered: Yield results in input order (otherwise as completed)
+        action_executor: Executor for approved actions
+        log_dir: Audit log directory for the default engine factory
+        policy_dir: Policy directory for the default engine factory
+        engine_factory: Custom Callable(worker_index) -> ODALEngine
+        queue_size: Bound of the input/output queues
+        reorder_window: Ordered mode: requests submitted ahead of the oldest
+            unfinished one
+
+    Returns:
+        BatchRun to iterate; its .statistics are set once iteration finishes
+    """
+    if engine_factory is None:
+        engine_factory = partial(default_engine_factory, log_dir=log_dir, policy_dir=policy_dir)
+    return BatchRun(
+        requests,
+        workers=workers,
+        mode=mode,
+        ordered=ordered,
+        action_executor=action_executor,
+        engine_factory=engine_factory,
+        queue_size=queue_size,
+        reorder_window=reorder_window
+    )
+
+
+# Example usage
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    def slow_executor(action: Dict) -> Dict:
+        time.sleep(0.01)  # Simulated infrastructure call
+        return {"status": "success", "action": action["action_type"]}
+
+    requests = (
+        {"input": text, "context": {"user_id": f"user{i % 10}", "user_role": "admin", "budget_limit": 5000.0}}
+        for i, text in enumerate(["Deploy to staging", "Scale the web tier", "Remove old snapshots"] * 200)
+    )
+
+    start = time.perf_counter()
+    run = run_batch(requests, workers=8, mode="thread", action_executor=slow_executor,
+                    log_dir=Path(tempfile.mkdtemp()))
+    for result in run:
+        if result["batch_index"] % 200 == 0:
+            print(f"[BATCH] #{result['batch_index']} worker={result['worker']} decision={result['decision']}")
+    elapsed = time.perf_counter() - start
+
+    stats = run.statistics
+    print(f"{stats['total_cycles']} cycles in {elapsed:.2f}s ({stats['total_cycles'] / elapsed:.0f}/s)")
+    print(f"Approved: {stats['approved']}, Rejected: {stats['rejected']}, Pending: {stats['pending_approval']}")
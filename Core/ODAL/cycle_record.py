@@ -0,0 +1,364 @@
+"""
+Cycle Record: Compact Storage for O.D.A.L. Cycle Results
+
+A cycle used to be a nested dict that repeated user_input, context and an
+ISO timestamp in every phase and embedded the full Prompt Guard metadata,
+all of it retained in execution_history. CycleRecord keeps one slot per
+fact instead: references to the caller's input, context and the proposed
+action, monotonic-ns timestamps, and Prompt Guard metadata reduced to a
+tuple when the input was clean (it is rebuilt on demand).
+
+CycleRecord is a dict subclass with the legacy keys (cycle_id, timestamp,
+phases, decision, reason, action_result, error, duration_ms, trace_id), so
+existing result["..."] / .get() / isinstance(result, dict) / json.dumps
+callers keep working. Nested views are built on first access through the
+mapping interface and then kept, so result["phases"]["observe"]["x"] = ...
+sticks; to_dict() returns a plain dict (reusing any views already built).
+The dict storage holds cycle_id (json's C encoder only asks a non-empty
+dict subclass for its items) and any keys set by callers.
+"""
+
+import json
+import time
+from collections.abc import MutableMapping
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+
+# Monotonic clocks have no epoch; anchor once to render wall-clock timestamps
+_WALL_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+# Keys of PromptGuard.validate() metadata for a clean input
+_GUARD_KEYS = (
+    "timestamp", "severity_score", "severity_level", "detected_patterns",
+    "input_length", "is_safe", "threshold", "context"
+)
+
+
+def _iso(monotonic_ns: int) -> str:
+    return datetime.utcfromtimestamp((monotonic_ns + _WALL_OFFSET_NS) / 1e9).isoformat()
+
+
+def _rebuild(state: Dict[str, Any], extra: Dict[str, Any]) -> "CycleRecord":
+    """Unpickle a CycleRecord (see CycleRecord.__reduce__)"""
+    record = CycleRecord.__new__(CycleRecord)
+    for name, value in state.items():
+        setattr(record, name, value)
+    dict.update(record, extra)
+    return record
+
+
+class CycleRecord(dict):
+    """
+    One O.D.A.L. cycle result.
+
+    Features:
+    - __slots__ storage; inputs and actions are referenced, not copied
+    - Monotonic-ns phase timestamps (ISO strings only in views)
+    - Legacy dict interface (a real dict subclass) with nested views built
+      on first access and cached
+    - Extra keys set by callers (e.g. batch_index) kept in the dict storage
+    """
+
+    __slots__ = (
+        "started_ns", "finished_ns", "trace_id",
+        # Observe
+        "user_input", "context", "is_safe", "guard", "observed_ns",
+        # Decide
+        "proposed_action", "outcome", "reasoning", "policy_details", "decided_ns",
+        # Act
+        "action_output", "action_status", "act_started_ns", "acted_ns",
+        # Result
+        "decision", "reason", "error", "views"
+    )
+
+    # Keys stored directly in a slot of the same name
+    _SCALAR_KEYS = frozenset(("trace_id", "decision", "reason", "error"))
+    # Keys computed from the slots (a caller-set value of the same name wins)
+    _COMPUTED_KEYS = frozenset(("phases", "timestamp", "action_result", "duration_ms"))
+    # Listed first by __iter__, so skipped among the stored keys
+    _LEADING_KEYS = _COMPUTED_KEYS | {"cycle_id"}
+
+    def __init__(self, cycle_id: Optional[int]):
+        """
+        Initialize Cycle Record.
+
+        Args:
+            cycle_id: Engine-assigned cycle ID (None for a shed request,
+                which never became a cycle)
+        """
+        dict.__setitem__(self, "cycle_id", cycle_id)
+        self.started_ns = time.monotonic_ns()
+        self.finished_ns: Optional[int] = None
+        self.trace_id: Optional[str] = None
+        self.observed_ns: Optional[int] = None
+        self.decided_ns: Optional[int] = None
+        self.acted_ns: Optional[int] = None
+        self.decision: Optional[str] = None
+        self.reason: Optional[str] = None
+        self.error: Optional[str] = None
+        self.views: Optional[Dict[str, Dict]] = None
+
+    # Recording (called by the engine)
+
+    def set_observation(self, user_input: str, context: Dict, is_safe: bool, guard_metadata: Dict):
+        self.user_input = user_input
+        self.context = context
+        self.is_safe = is_safe
+        # Clean inputs keep 3 values; anything unusual keeps the full dict
+        if (
+            not guard_metadata.get("detected_patterns")
+            and tuple(guard_metadata) == _GUARD_KEYS
+            and guard_metadata["context"] is context
+        ):
+            self.guard = (
+                guard_metadata["severity_score"],
+                guard_metadata["severity_level"],
+                guard_metadata["threshold"]
+            )
+        else:
+            self.guard = guard_metadata
+        self.observed_ns = time.monotonic_ns()
+        self._add_phase("observe")
+
+    def set_decision(self, proposed_action: Dict, outcome: str, reasoning: str, policy_details: List[Dict]):
+        self.proposed_action = proposed_action
+        self.outcome = outcome
+        self.reasoning = reasoning
+        self.policy_details = policy_details or None
+        self.decided_ns = time.monotonic_ns()
+        self._add_phase("decide")
+
+    def set_action(self, output: Any, status: str, started_ns: int):
+        self.action_output = output
+        self.action_status = status
+        self.act_started_ns = started_ns
+        self.acted_ns = time.monotonic_ns()
+        self._add_phase("act")
+
+    def finish(self):
+        self.finished_ns = time.monotonic_ns()
+
+    # Derived values
+
+    @property
+    def cycle_id(self) -> Optional[int]:
+        return dict.__getitem__(self, "cycle_id")
+
+    @cycle_id.setter
+    def cycle_id(self, cycle_id: int):
+        dict.__setitem__(self, "cycle_id", cycle_id)
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.finished_ns is None:
+            return None
+        return (self.finished_ns - self.started_ns) / 1e6
+
+    @property
+    def timestamp(self) -> str:
+        return _iso(self.started_ns)
+
+    def security_metadata(self) -> Dict:
+        """Prompt Guard metadata as returned by validate()"""
+        if isinstance(self.guard, dict):
+            return self.guard
+        severity_score, severity_level, threshold = self.guard
+        return {
+            "timestamp": _iso(self.observed_ns),
+            "severity_score": severity_score,
+            "severity_level": severity_level,
+            "detected_patterns": [],
+            "input_length": len(self.user_input),
+            "is_safe": self.is_safe,
+            "threshold": threshold,
+            "context": self.context
+        }
+
+    # Legacy views
+
+    def observation(self) -> Optional[Dict]:
+        if self.observed_ns is None:
+            return None
+        return {
+            "user_input": self.user_input,
+            "context": self.context,
+            "is_safe": self.is_safe,
+            "security_metadata": self.security_metadata(),
+            "timestamp": _iso(self.observed_ns)
+        }
+
+    def decision_view(self) -> Optional[Dict]:
+        if self.decided_ns is None:
+            return None
+        return {
+            "proposed_action": self.proposed_action,
+            "outcome": self.outcome,
+            "reasoning": self.reasoning,
+            "policy_details": self.policy_details or [],
+            "timestamp": _iso(self.decided_ns)
+        }
+
+    def action_view(self) -> Optional[Dict]:
+        if self.acted_ns is None:
+            return None
+        return {
+            "action": self.proposed_action,
+            "result": self.action_output,
+            "status": self.action_status,
+            "duration_ms": (self.acted_ns - self.act_started_ns) / 1e6,
+            "timestamp": _iso(self.acted_ns)
+        }
+
+    # Phase name -> (timestamp slot, view builder)
+    _PHASE_VIEWS = {
+        "observe": ("observed_ns", "observation"),
+        "decide": ("decided_ns", "decision_view"),
+        "act": ("acted_ns", "action_view")
+    }
+
+    def phases(self) -> Dict[str, Dict]:
+        """Phase views, reusing any already handed out"""
+        return {
+            name: self._phase_view(name)
+            for name, (stamp, _) in self._PHASE_VIEWS.items() if getattr(self, stamp) is not None
+        }
+
+    def _phase_view(self, name: str) -> Dict:
+        if self.views is not None and name in self.views:
+            return self.views[name]
+        return getattr(self, self._PHASE_VIEWS[name][1])()
+
+    def _cached(self, name: str) -> Dict:
+        """View kept on the record once handed out, so callers' mutations stick"""
+        if self.views is None:
+            self.views = {}
+        view = self.views.get(name)
+        if view is None:
+            if name == "phases":
+                view = {
+                    phase: self._cached(phase)
+                    for phase, (stamp, _) in self._PHASE_VIEWS.items() if getattr(self, stamp) is not None
+                }
+            else:
+                view = self._phase_view(name)
+            self.views[name] = view
+        return view
+
+    def _add_phase(self, name: str):
+        """Keep a handed-out phases dict current as the cycle advances"""
+        if self.views is not None and "phases" in self.views:
+            self.views["phases"][name] = self._cached(name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Legacy nested result dict (views are built fresh unless already handed out)"""
+        result = {}
+        for key in self:
+            if key == "phases" and not dict.__contains__(self, key):
+                result[key] = self.views["phases"] if self.views and "phases" in self.views else self.phases()
+            elif key == "action_result" and not dict.__contains__(self, key):
+                result[key] = self._phase_view("act")
+            else:
+                result[key] = self[key]
+        return result
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), default=str, **kwargs)
+
+    # Mapping interface
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._SCALAR_KEYS:
+            value = getattr(self, key)
+            if value is None:
+                raise KeyError(key)
+            return value
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        if key == "phases":
+            return self._cached("phases")
+        if key == "timestamp":
+            return self.timestamp
+        if key == "duration_ms" and self.finished_ns is not None:
+            return self.duration_ms
+        if key == "action_result" and self.acted_ns is not None:
+            return self._cached("act")
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key in self._SCALAR_KEYS:
+            setattr(self, key, value)
+        else:
+            dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: str):
+        if key != "cycle_id" and dict.__contains__(self, key):
+            dict.__delitem__(self, key)
+        elif key in self._SCALAR_KEYS and getattr(self, key) is not None:
+            setattr(self, key, None)
+        else:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield "cycle_id"
+        yield "timestamp"
+        yield "phases"
+        if self.trace_id is not None:
+            yield "trace_id"
+        if self.decision is not None:
+            yield "decision"
+        if self.reason is not None:
+            yield "reason"
+        if self.acted_ns is not None:
+            yield "action_result"
+        if self.error is not None:
+            yield "error"
+        if self.finished_ns is not None:
+            yield "duration_ms"
+        for key in dict.__iter__(self):
+            if key not in self._LEADING_KEYS:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        return key in iter(self)
+
+    # dict's own methods read the (extras-only) storage; route them through the mapping
+    get = MutableMapping.get
+    keys = MutableMapping.keys
+    pop = MutableMapping.pop
+    popitem = MutableMapping.popitem
+    setdefault = MutableMapping.setdefault
+    update = MutableMapping.update
+    __eq__ = MutableMapping.__eq__
+    __hash__ = None
+
+    def __ne__(self, other: object) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def items(self):
+        # Through to_dict(): serialising a record (json.dumps calls items())
+        # must not leave cached views on records kept in execution_history
+        return self.to_dict().items()
+
+    def values(self):
+        return self.to_dict().values()
+
+    def copy(self) -> Dict[str, Any]:
+        return self.to_dict()
+
+    def clear(self):
+        raise TypeError("CycleRecord keys cannot all be removed")
+
+    def __reduce__(self):
+        state = {name: getattr(self, name) for name in self.__slots__ if hasattr(self, name)}
+        return _rebuild, (state, dict(dict.items(self)))
+
+    def __repr__(self) -> str:
+        return (
+            f"CycleRecord(cycle_id={self.cycle_id}, decision={self.decision!r}, "
+            f"duration_ms={self.duration_ms})"
+        )
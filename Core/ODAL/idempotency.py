@@ -0,0 +1,197 @@
+"""
+Idempotency Store: Result Reuse for Retried O.D.A.L. Requests
+
+A client that times out and retries would otherwise start a second cycle:
+a second policy evaluation, second audit trail and - worst - a second
+executed action. run_cycle(..., idempotency_key=...) consults this store
+first:
+
+- completed key: the stored result is returned (nothing runs again)
+- key in flight: the caller waits for that cycle and shares its result
+- new key: the caller runs the cycle and publishes its result
+
+Keys are scoped per user (context["user_id"]), bounded in number (LRU)
+and expire after a TTL. Reusing a key for a different request (other
+input or context) raises ValueError rather than returning an unrelated
+result. Cycles that ended in a system error are shared with waiters but
+not stored, so a later retry runs again.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+def _set_result(future: asyncio.Future, result: Any):
+    if not future.done():
+        future.set_result(result)
+
+
+class InFlight:
+    """A cycle being run for an idempotency key; waiters block on it"""
+
+    __slots__ = ("fingerprint", "result", "_event", "_lock", "_waiters")
+
+    def __init__(self, fingerprint: Hashable):
+        """
+        Initialize In Flight.
+
+        Args:
+            fingerprint: Identifies the request the key was first used for
+        """
+        self.fingerprint = fingerprint
+        self.result: Any = None
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._waiters = []  # (loop, future) of async waiters
+
+    def resolve(self, result: Any):
+        """Publish the result (None = abandoned; waiters retry)"""
+        with self._lock:
+            self.result = result
+            self._event.set()
+            waiters, self._waiters = self._waiters, []
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_set_result, future, result)
+
+    def wait(self, timeout: Optional[float] = None) -> Any:
+        """Block until resolved; raises TimeoutError"""
+        if not self._event.wait(timeout):
+            raise TimeoutError("Timed out waiting for the in-flight cycle")
+        return self.result
+
+    async def await_result(self, timeout: Optional[float] = None) -> Any:
+        """Wait on the event loop until resolved; raises asyncio.TimeoutError"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if self._event.is_set():
+                return self.result
+            self._waiters.append((loop, future))
+        return await asyncio.wait_for(future, timeout)
+
+
+class IdempotencyStore:
+    """
+    Bounded, TTL'd store of cycle results by idempotency key.
+
+    Features:
+    - Replays completed results; joins concurrent duplicates to the
+      in-flight cycle (threads and asyncio alike)
+    - LRU bound on stored results; expiry after ttl_seconds
+    - Fingerprint check against key reuse for a different request
+    - Hit/join/miss counters
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: Optional[float] = 24 * 3600,
+        wait_timeout: Optional[float] = None
+    ):
+        """
+        Initialize Idempotency Store.
+
+        Args:
+            max_entries: Completed results kept (least recently used evicted)
+            ttl_seconds: Seconds a completed result is replayed (None = until evicted)
+            wait_timeout: Seconds a duplicate waits for the in-flight cycle
+                (None = as long as it takes)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.wait_timeout = wait_timeout
+
+        self._lock = threading.Lock()
+        self._results: "OrderedDict[Hashable, Tuple[float, Hashable, Any]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, InFlight] = {}
+        self._counts = {"replayed": 0, "joined": 0, "executed": 0, "expired": 0, "evicted": 0}
+
+    def _expire(self, now: float):
+        """Drop expired results from the front (completion order = expiry order)"""
+        while self._results:
+            key, (expires_at, _, _) = next(iter(self._results.items()))
+            if expires_at > now:
+                break
+            del self._results[key]
+            self._counts["expired"] += 1
+
+    def begin(self, key: Hashable, fingerprint: Hashable) -> Tuple[str, Any]:
+        """
+        Look up a key, claiming it if nobody has.
+
+        Args:
+            key: Scoped idempotency key
+            fingerprint: Identifies the request
+
+        Returns:
+            ("replay", result), ("join", InFlight) or ("run", InFlight);
+            a "run" caller must finish with complete() or abandon()
+
+        Raises:
+            ValueError: The key was used for a different request
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            stored = self._results.get(key)
+            if stored is not None and stored[0] <= now:
+                # Replays moved it out of expiry order
+                del self._results[key]
+                self._counts["expired"] += 1
+                stored = None
+            if stored is not None:
+                if stored[1] != fingerprint:
+                    raise ValueError("Idempotency key reused for a different request")
+                self._results.move_to_end(key)
+                self._counts["replayed"] += 1
+                return "replay", stored[2]
+
+            flight = self._in_flight.get(key)
+            if flight is not None:
+                if flight.fingerprint != fingerprint:
+                    raise ValueError("Idempotency key reused for a different request")
+                self._counts["joined"] += 1
+                return "join", flight
+
+            flight = self._in_flight[key] = InFlight(fingerprint)
+            self._counts["executed"] += 1
+            return "run", flight
+
+    def complete(self, key: Hashable, flight: InFlight, result: Any, store: bool = True):
+        """
+        Publish a finished cycle to its waiters and (optionally) store it.
+
+        Args:
+            key: Key passed to begin()
+            flight: InFlight returned by begin()
+            result: Cycle result
+            store: Keep it for replays (False for retryable failures)
+        """
+        with self._lock:
+            if self._in_flight.get(key) is flight:
+                del self._in_flight[key]
+            if store:
+                expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds is not None else float("inf")
+                self._results[key] = (expires_at, flight.fingerprint, result)
+                self._results.move_to_end(key)
+                while len(self._results) > self.max_entries:
+                    self._results.popitem(last=False)
+                    self._counts["evicted"] += 1
+        flight.resolve(result)
+
+    def abandon(self, key: Hashable, flight: InFlight):
+        """Release a claimed key without a result; one waiter takes over"""
+        with self._lock:
+            if self._in_flight.get(key) is flight:
+                del self._in_flight[key]
+        flight.resolve(None)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        with self._lock:
+            statistics = dict(self._counts)
+            statistics["stored"] = len(self._results)
+            statistics["in_flight"] = len(self._in_flight)
+        return statistics
@@ -0,0 +1,325 @@
+"""
+Intent Parser: Layered Natural-Language Intent Parsing for the DECIDE Phase
+
+Turns user input into the proposed action the Policy Engine evaluates.
+Asking an LLM every time is slow and costs money, so parses go through
+layers and stop at the first one that answers:
+
+1. rules    - deterministic keyword pass, only for obvious inputs
+2. exact    - LRU cache of earlier LLM parses, keyed by normalized input
+3. similar  - recent LLM parses whose wording nearly matches
+4. llm      - LLMRouter with a structured (JSON) output prompt
+
+Every returned action records the layer that answered in "intent_layer";
+get_statistics() reports hit ratios per layer.
+"""
+
+import json
+import re
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Action types the Policy Engine knows, with the keywords the rule pass matches
+ACTION_KEYWORDS = (
+    ("deploy", ("deploy",)),
+    ("scale", ("scale",)),
+    ("delete", ("delete", "remove")),
+)
+ACTION_TYPES = tuple(action_type for action_type, _ in ACTION_KEYWORDS) + ("unknown",)
+
+# Estimated cost per action type; requests naming production cost twice as much
+ACTION_COSTS = {"deploy": 100.0, "scale": 200.0, "delete": 0.0, "unknown": 0.0}
+PRODUCTION_COST_FACTOR = 2
+
+ENVIRONMENTS = ("development", "staging", "production")
+
+# Negated requests are never "obvious" to the rule pass
+_NEGATIONS = frozenset(("not", "no", "never", "don", "dont", "without"))
+# Verbs and particles that change what a request does ("roll out" vs "roll back")
+_ACTION_TOKENS = frozenset(keyword for _, keywords in ACTION_KEYWORDS for keyword in keywords) | frozenset((
+    "rollback", "roll", "revert", "back", "out", "restart", "start", "stop", "create", "destroy",
+    "terminate", "tear", "spin", "up", "down", "update", "upgrade", "downgrade", "release", "ship"
+))
+# Tokens that must match exactly for a similarity-cache hit
+_ENTITY_TOKENS = frozenset((
+    "dev", "development", "stage", "staging", "prod", "production", "test"
+)) | _NEGATIONS | _ACTION_TOKENS
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+INTENT_PROMPT = """You convert infrastructure requests into JSON.
+Reply with one JSON object and nothing else:
+{{"action_type": one of {action_types}, "environment": one of {environments} or null, "requested_instances": integer or null}}
+Use "unknown" when the request is not one of these actions.
+
+Request: {user_input}"""
+
+
+def build_action(
+    action_type: str,
+    environment: str,
+    user_input: str,
+    requested_instances: Optional[int] = None
+) -> Dict[str, Any]:
+    """Proposed action in the shape PolicyEngine.evaluate() expects"""
+    estimated_cost = ACTION_COSTS.get(action_type, 0.0)
+    if "prod" in user_input.lower():
+        # Only when the request says so; a production default from the
+        # context does not change the estimate
+        estimated_cost *= PRODUCTION_COST_FACTOR
+    action = {
+        "action_type": action_type,
+        "estimated_cost": estimated_cost,
+        "environment": environment,
+        "user_input": user_input
+    }
+    if requested_instances is not None:
+        action["requested_instances"] = requested_instances  # Checked by the instance-limit policy
+    return action
+
+
+def rule_intent(user_input: str, context: Dict) -> Tuple[Dict[str, Any], int]:
+    """
+    Keyword-based parse (the engine's built-in parser).
+
+    Returns:
+        (action, number of action types whose keywords matched)
+    """
+    text = user_input.lower()
+    matched = [
+        action_type for action_type, keywords in ACTION_KEYWORDS
+        if any(keyword in text for keyword in keywords)
+    ]
+    environment = "production" if "prod" in text else context.get("environment", "development")
+    return build_action(matched[0] if matched else "unknown", environment, user_input), len(matched)
+
+
+class LayeredIntentParser:
+    """
+    Intent parser with rule, cache and LLM layers.
+
+    Features:
+    - Rule pass answers short, non-negated inputs naming exactly one action
+    - Exact-match LRU and similarity caches of LLM parses
+    - Similarity hits require identical action/environment/negation/number tokens
+    - Falls back to the rule parse if the LLM fails or returns invalid JSON
+    - Per-layer counts and hit ratios; thread-safe
+    """
+
+    LAYERS = ("rules", "exact", "similar", "llm", "fallback")
+
+    def __init__(
+        self,
+        router=None,
+        preferred_providers: Optional[List[str]] = None,
+        rule_max_words: int = 12,
+        cache_size: int = 1024,
+        similarity_threshold: float = 0.85,
+        similarity_window: int = 256,
+        metrics=None
+    ):
+        """
+        Initialize Layered Intent Parser.
+
+        Args:
+            router: LLMRouter (anything with generate_with_fallback); None
+                disables the LLM layer and the caches in front of it
+            preferred_providers: Provider order passed to the router
+            rule_max_words: Longer inputs are never answered by the rule pass
+            cache_size: Exact-match cache entries (LRU)
+            similarity_threshold: Minimum token Jaccard similarity for a
+                similarity-cache hit (None disables the layer)
+            similarity_window: Recent LLM parses searched by the similarity layer
+            metrics: Metrics registry (counter/histogram factory); None disables metrics
+        """
+        self.router = router
+        self.preferred_providers = preferred_providers
+        self.rule_max_words = rule_max_words
+        self.cache_size = cache_size
+        self.similarity_threshold = similarity_threshold
+
+        self._exact: OrderedDict = OrderedDict()
+        self._recent: deque = deque(maxlen=similarity_window)
+        self._lock = threading.Lock()
+        self.layer_counts = Counter()
+        self.llm_errors = 0
+        self.llm_seconds = 0.0
+
+        self.metrics = metrics
+        if metrics is not None:
+            parses = metrics.counter("intent_parses_total", "Intent parses by answering layer", ["layer"])
+            self._m_layers = {layer: parses.labels(layer) for layer in self.LAYERS}
+            self._m_llm_duration = metrics.histogram("intent_llm_parse_seconds", "LLM intent parse duration")
+
+    def parse(self, user_input: str, context: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Parse user input into a proposed action.
+
+        Args:
+            user_input: User's command/request
+            context: Cycle context (supplies the default environment)
+
+        Returns:
+            Action dict with "intent_layer" set to the answering layer
+        """
+        context = context or {}
+        action, matched = rule_intent(user_input, context)
+        if self.router is None:
+            return self._answer(action, "rules")
+
+        words = user_input.lower().split()
+        tokens = frozenset(_TOKEN.findall(" ".join(words)))
+        if matched == 1 and len(words) <= self.rule_max_words and not tokens & _NEGATIONS:
+            return self._answer(action, "rules")
+
+        default_env = context.get("environment", "development")
+        key = (" ".join(words), default_env)
+        with self._lock:
+            cached = self._exact.get(key)
+            if cached is not None:
+                self._exact.move_to_end(key)
+                layer = "exact"
+            elif self.similarity_threshold is not None:
+                cached = self._find_similar(tokens, default_env)
+                layer = "similar"
+                if cached is not None:
+                    # Repeats of this wording become exact hits
+                    self._store(key, cached)
+        if cached is not None:
+            return self._answer(build_action(cached[0], cached[1], user_input, cached[2]), layer)
+
+        parsed = self._ask_llm(user_input)
+        if parsed is None:
+            return self._answer(action, "fallback")
+
+        action_type, environment, instances = parsed
+        environment = environment or default_env
+        with self._lock:
+            self._store(key, (action_type, environment, instances))
+            self._recent.append((tokens, default_env, action_type, environment, instances))
+        return self._answer(build_action(action_type, environment, user_input, instances), "llm")
+
+    def _store(self, key: Tuple[str, str], parsed: Tuple[str, str, Optional[int]]):
+        """Add to the exact-match LRU (lock held)"""
+        self._exact[key] = parsed
+        if len(self._exact) > self.cache_size:
+            self._exact.popitem(last=False)
+
+    def _find_similar(self, tokens: frozenset, default_env: str) -> Optional[Tuple[str, str, Optional[int]]]:
+        """Newest recent parse at or above the similarity threshold (lock held)"""
+        entities = tokens & _ENTITY_TOKENS
+        entities |= {t for t in tokens if t.isdigit()}
+        for other, other_env, action_type, environment, instances in reversed(self._recent):
+            if other_env != default_env:
+                continue
+            if (other & _ENTITY_TOKENS) | {t for t in other if t.isdigit()} != entities:
+                continue
+            if len(tokens & other) / len(tokens | other) >= self.similarity_threshold:
+                return action_type, environment, instances
+        return None
+
+    def _ask_llm(self, user_input: str) -> Optional[Tuple[str, Optional[str], Optional[int]]]:
+        """Structured-output parse via the router; None on failure"""
+        prompt = INTENT_PROMPT.format(
+            action_types=list(ACTION_TYPES), environments=list(ENVIRONMENTS), user_input=user_input
+        )
+        start = time.perf_counter()
+        try:
+            response = self.router.generate_with_fallback(
+                prompt, preferred_providers=self.preferred_providers, temperature=0.0, max_tokens=100
+            )
+            parsed = self._parse_response(response.content)
+        except Exception as e:
+            print(f"[INTENT] LLM parse failed, using rule parse: {e}")
+            parsed = None
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self.llm_seconds += elapsed
+            if parsed is None:
+                self.llm_errors += 1
+        if self.metrics is not None:
+            self._m_llm_duration.observe(elapsed)
+        return parsed
+
+    @staticmethod
+    def _parse_response(content: str) -> Optional[Tuple[str, Optional[str], Optional[int]]]:
+        """Validate the model's JSON; anything off-schema is rejected"""
+        match = re.search(r"\{.*\}", content, re.DOTALL)
+        if match is None:
+            return None
+        data = json.loads(match.group(0))
+        action_type = data.get("action_type")
+        environment = data.get("environment")
+        if action_type not in ACTION_TYPES:
+            return None
+        if environment is not None and environment not in ENVIRONMENTS:
+            return None
+        instances = data.get("requested_instances")
+        if instances is not None and (type(instances) is not int or instances < 0):
+            return None
+        return action_type, environment, instances
+
+    def _answer(self, action: Dict[str, Any], layer: str) -> Dict[str, Any]:
+        action["intent_layer"] = layer
+        with self._lock:
+            self.layer_counts[layer] += 1
+        if self.metrics is not None:
+            self._m_layers[layer].inc()
+        return action
+
+    def clear_cache(self):
+        with self._lock:
+            self._exact.clear()
+            self._recent.clear()
+
+    def export_state(self) -> Dict:
+        """Caches and counters as JSON-serialisable state (for engine snapshots)"""
+        with self._lock:
+            return {
+                "exact": [[text, env, *parsed] for (text, env), parsed in self._exact.items()],
+                "recent": [[sorted(entry[0]), *entry[1:]] for entry in self._recent],
+                "layer_counts": dict(self.layer_counts),
+                "llm_errors": self.llm_errors,
+                "llm_seconds": self.llm_seconds
+            }
+
+    def import_state(self, state: Dict):
+        """Replace caches and counters with exported state (a warm cache after restart)"""
+        with self._lock:
+            self._exact.clear()
+            for text, env, action_type, environment, instances in state.get("exact", []):
+                self._store((text, env), (action_type, environment, instances))
+            self._recent.clear()
+            self._recent.extend(
+                (frozenset(tokens), env, action_type, environment, instances)
+                for tokens, env, action_type, environment, instances in state.get("recent", [])
+            )
+            self.layer_counts = Counter(state.get("layer_counts", {}))
+            self.llm_errors = state.get("llm_errors", 0)
+            self.llm_seconds = state.get("llm_seconds", 0.0)
+
+    def get_statistics(self) -> Dict:
+        """Parse counts and hit ratio per layer"""
+        with self._lock:
+            counts = dict(self.layer_counts)
+            total = sum(counts.values())
+            llm_calls = counts.get("llm", 0) + self.llm_errors
+            llm_seconds = self.llm_seconds
+            cache_entries = len(self._exact)
+            llm_errors = self.llm_errors
+
+        if total == 0:
+            return {"total_parses": 0}
+
+        return {
+            "total_parses": total,
+            "layers": {layer: counts.get(layer, 0) for layer in self.LAYERS},
+            "hit_ratios": {layer: counts.get(layer, 0) / total for layer in self.LAYERS},
+            "llm_calls": llm_calls,
+            "llm_errors": llm_errors,
+            "avg_llm_ms": llm_seconds / llm_calls * 1000 if llm_calls else 0.0,
+            "cache_entries": cache_entries
+        }
@@ -5,10 +5,17 @@ The core operational loop for the SDM Agent.
 Integrates Security Skills for governed decision-making.
 """
 
+import asyncio
+import contextvars
+import copy
+import inspect
+import itertools
+import json
+import threading
 import time
-from typing import Dict, List, Optional, Any, Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Callable, Iterator, Tuple
 from enum import Enum
-from datetime import datetime
 from pathlib import Path
 import sys
 
@@ -26,6 +33,22 @@ except ImportError:
     from SDM_AI_PROJECT.Skills.Security.Policy_Enforcement.policy_engine import PolicyEngine, PolicyDecision
     from SDM_AI_PROJECT.Skills.Security.Audit_Logging.audit_logger import AuditLogger, EventType
 
+try:
+    from .stats import ShardedStats, LatencyHistogram
+    from .cycle_record import CycleRecord
+    from .intent_parser import rule_intent
+    from .action_plan import ActionPlan
+    from .idempotency import IdempotencyStore
+    from .snapshot import read_snapshot, write_snapshot
+except ImportError:
+    # Fallback for direct execution
+    from stats import ShardedStats, LatencyHistogram
+    from cycle_record import CycleRecord
+    from intent_parser import rule_intent
+    from action_plan import ActionPlan
+    from idempotency import IdempotencyStore
+    from snapshot import read_snapshot, write_snapshot
+
 
 class ODALPhase(Enum):
     """O.D.A.L. Loop phases"""
@@ -41,6 +64,16 @@ class DecisionOutcome(Enum):
     APPROVE = "approve"
     REJECT = "reject"
     REQUIRE_APPROVAL = "require_approval"
+    OVERLOADED = "overloaded"
+
+
+# Strictness of policy results, for combining a plan's step evaluations
+_POLICY_SEVERITY = {
+    PolicyDecision.APPROVE: 0,
+    PolicyDecision.WARN: 1,
+    PolicyDecision.REQUIRE_APPROVAL: 2,
+    PolicyDecision.REJECT: 3
+}
 
 
 class ODALEngine:
@@ -58,6 +91,80 @@ class ODALEngine:
     - Prompt Guard validates inputs (Observe → Decide)
     - Policy Engine validates actions (Decide)
     - Audit Logger records everything (Log)
+    
+    Concurrency:
+    - run_cycle runs one cycle synchronously
+    - arun_cycle runs cycles on an asyncio event loop; many can be in
+      flight at once (up to max_concurrent_cycles), with guard and policy
+      work offloaded to an executor
+    - One engine may be shared by many threads: cycle IDs are allocated
+      atomically, phase is tracked per cycle in active_cycles, and
+      statistics are kept in per-thread shards merged on read
+    
+    Statistics:
+    - Counters per decision outcome and latency histograms for the whole
+      cycle and each phase; get_statistics() cost does not grow with the
+      number of cycles run
+    - get_stats_snapshot() returns a mergeable snapshot (see stats.merge_snapshots)
+    
+    Results:
+    - Cycles return CycleRecord objects (see cycle_record.py): compact
+      records kept in execution_history; a dict subclass that reads (and
+      serialises) like the legacy nested result dict
+    - Optional metrics registry (Core/Observability) for Prometheus export;
+      it is passed on to the guard, policy engine and logger built here
+    - Optional RetentionPolicy bounding execution_history (and the guard,
+      policy and audit histories built here); evicted cycles spill to disk
+    
+    Tracing:
+    - With a tracer, each cycle is a trace: an odal.cycle root span with one
+      child span per phase; policy rules, LLM calls and audit records made
+      during a phase attach to it through the active-span contextvar
+    
+    Speculation (opt-in):
+    - Intent parsing and a side-effect-free policy pre-evaluation start
+      concurrently with the Prompt Guard check; DECIDE only commits them
+      once the input is known to be safe
+    - On a guard rejection (or error) the speculative work is cancelled if
+      not yet running, otherwise its result is dropped; it is never acted on,
+      logged as a decision, or counted in policy statistics
+    - Latency saved is reported per cycle (speculation_saved_ms) and in
+      get_statistics()
+    
+    Action plans:
+    - An approved action with a "plan" list runs as a dependency DAG
+      (see action_plan.py): independent steps concurrently, each with a
+      timeout; a failed step cancels its dependents. The action result
+      (and its audit record) carries per-step timing.
+    - DECIDE evaluates every step's action as well; a step that would be
+      rejected or need approval decides for the whole plan.
+    
+    Approvals:
+    - With an approval queue, require_approval cycles are checkpointed
+      (result["approval_id"]); approve()/reject() resume them straight into
+      ACT, re-evaluating policies only if the policy set changed
+    
+    Idempotency:
+    - run_cycle/arun_cycle(..., idempotency_key=...) run at most one cycle
+      per key and user (see idempotency.py): a retry gets the stored
+      result, a concurrent duplicate waits for the cycle in flight
+    
+    Admission control:
+    - With an AdmissionController (see admission.py), a request over its
+      user's quota, its priority class's concurrency share or the latency
+      SLO gets an "overloaded" decision before any phase runs (no cycle
+      ID; counted apart from the cycles in the statistics)
+    
+    Scheduling:
+    - With a FairScheduler (see scheduler.py), admitted cycles wait for one
+      of its slots in weighted-fair order across priority classes and
+      tenants (in arun_cycle the slots replace max_concurrent_cycles)
+    
+    Snapshots:
+    - snapshot(path)/restore(path) save and reload the cycle counter,
+      statistics and the state of the guard, policy engine, cost tracker,
+      intent parser and admission controller (see snapshot.py), so a
+      restarted engine resumes warm
     """
     
     def __init__(
@@ -65,7 +172,24 @@ class ODALEngine:
         prompt_guard: Optional[PromptGuard] = None,
         policy_engine: Optional[PolicyEngine] = None,
         audit_logger: Optional[AuditLogger] = None,
-        cost_tracker = None
+        cost_tracker = None,
+        max_concurrent_cycles: int = 64,
+        executor: Optional[Executor] = None,
+        metrics=None,
+        tracer=None,
+        profiler=None,
+        retention=None,
+        speculative: bool = False,
+        intent_parser=None,
+        plan_workers: int = 4,
+        step_timeout: Optional[float] = None,
+        approval_queue=None,
+        idempotency_store=None,
+        admission=None,
+        scheduler=None,
+        cycle_id_start: int = 1,
+        cycle_id_step: int = 1,
+        cycle_ids: Optional[Iterator[int]] = None
     ):
         """
         Initialize O.D.A.L. Engine.
@@ -75,22 +199,224 @@ class ODALEngine:
             policy_engine: Policy enforcement
             audit_logger: Audit logging
             cost_tracker: Cost tracking integration
+            max_concurrent_cycles: Cap on cycles in flight in arun_cycle
+            executor: Executor for guard/policy/sync executor work in arun_cycle
+                (default: the event loop's default executor)
+            metrics: Metrics registry (see Core/Observability); None disables metrics
+            tracer: Tracer (see Core/Observability); None disables tracing
+            profiler: CycleProfiler for sampled / slow run_cycle captures
+                (see profiler.py); None disables profiling
+            retention: RetentionPolicy bounding execution_history and the
+                histories of the components built here (see retention.py);
+                None keeps everything in memory
+            speculative: Parse intent and pre-evaluate policies while the
+                Prompt Guard runs (uses executor, or a pool created on demand)
+            intent_parser: Parser with parse(user_input, context) -> action,
+                e.g. LayeredIntentParser (see intent_parser.py); None uses
+                the built-in keyword rules
+            plan_workers: Steps of one action plan running at once
+            step_timeout: Default per-step timeout in seconds for action plans
+                (None = no limit; steps may set their own)
+            approval_queue: ApprovalQueue parking require_approval cycles
+                (see approval_queue.py); None just returns them
+            idempotency_store: IdempotencyStore for idempotency keys
+                (see idempotency.py); default: in-memory, 10k results, 24h TTL
+            admission: AdmissionController shedding load before cycles start
+                (see admission.py); None admits everything
+            scheduler: FairScheduler ordering cycles waiting to run
+                (see scheduler.py); None runs them as they arrive
+            cycle_id_start: First cycle ID
+            cycle_id_step: Gap between cycle IDs (engines sharing an ID space
+                use the same step and different starts)
+            cycle_ids: Iterator handing out cycle IDs, e.g. blocks reserved
+                from a shared store; overrides cycle_id_start/cycle_id_step
         """
-        self.prompt_guard = prompt_guard or PromptGuard()
-        self.policy_engine = policy_engine or PolicyEngine(cost_tracker=cost_tracker)
-        self.audit_logger = audit_logger or AuditLogger()
+        self.prompt_guard = prompt_guard or PromptGuard(metrics=metrics, retention=retention)
+        self.policy_engine = policy_engine or PolicyEngine(
+            cost_tracker=cost_tracker, metrics=metrics, tracer=tracer, retention=retention
+        )
+        self.audit_logger = audit_logger or AuditLogger(metrics=metrics, tracer=tracer, retention=retention)
         self.cost_tracker = cost_tracker
         
-        self.current_phase = ODALPhase.IDLE
         self.cycle_count = 0
-        self.execution_history = []
+        # Spilled cycles read back as legacy result dicts
+        self.execution_history = (
+            retention.buffer("odal_cycles", encode=CycleRecord.to_dict) if retention is not None else []
+        )
+        self._cycle_lock = threading.Lock()
+        self.set_cycle_ids(cycle_id_start, cycle_id_step, cycle_ids)
+        self._stats = ShardedStats()
+        
+        # Per-cycle phase tracking (cycle_id -> phase), in start order
+        self.active_cycles: Dict[int, ODALPhase] = {}
+        self._phase_started: Dict[int, float] = {}
+        self.max_concurrent_cycles = max_concurrent_cycles
+        self.executor = executor
+        self._cycle_semaphore: Optional[asyncio.Semaphore] = None
+        self.speculative = speculative
+        self.intent_parser = intent_parser
+        self.plan_workers = plan_workers
+        self.step_timeout = step_timeout
+        self.approval_queue = approval_queue
+        self.idempotency_store = idempotency_store or IdempotencyStore()
+        self.admission = admission
+        self.scheduler = scheduler
+        # Runs speculation and plan steps when no executor is given
+        self._pool: Optional[Executor] = None
+        
+        # cycle_id -> [cycle span, activation token, current phase span]
+        self.tracer = tracer
+        self._cycle_spans: Dict[int, List] = {}
+        self.profiler = profiler
+        
+        self.metrics = metrics
+        if metrics is not None:
+            self._m_cycles = metrics.counter("odal_cycles_total", "O.D.A.L. cycles by decision", ["decision"])
+            self._m_cycle_duration = metrics.histogram("odal_cycle_duration_seconds", "O.D.A.L. cycle duration")
+            phase_duration = metrics.histogram(
+                "odal_phase_duration_seconds", "Time spent in each O.D.A.L. phase", ["phase"]
+            )
+            self._m_phases = {
+                phase: phase_duration.labels(phase.value) for phase in ODALPhase if phase is not ODALPhase.IDLE
+            }
+            # Summed over engines sharing the registry; held weakly
+            metrics.gauge("odal_active_cycles", "Cycles currently in flight").set_function(
+                lambda engine: len(engine.active_cycles), owner=self
+            )
+    
+    @property
+    def current_phase(self) -> ODALPhase:
+        """Phase of the most recently started in-flight cycle (IDLE if none)"""
+        with self._cycle_lock:
+            for phase in reversed(self.active_cycles.values()):
+                return phase
+        return ODALPhase.IDLE
+    
+    def set_cycle_ids(self, start: int = 1, step: int = 1, ids: Optional[Iterator[int]] = None):
+        """
+        Choose how cycle IDs are allocated (before cycles run).
+        
+        Args:
+            start: First cycle ID
+            step: Gap between cycle IDs; workers sharing an ID space use
+                start = worker index + 1 and step = worker count
+            ids: Iterator handing out cycle IDs; overrides start/step, and
+                restore() leaves it alone
+        """
+        if step < 1:
+            raise ValueError("cycle_id_step must be at least 1")
+        with self._cycle_lock:
+            self.cycle_id_start = start
+            self.cycle_id_step = step
+            self._cycle_id_source = ids
+            self._cycle_ids = ids if ids is not None else itertools.count(start, step)
+    
+    def get_phase(self, cycle_id: int) -> ODALPhase:
+        """Get the current phase of an in-flight cycle (IDLE if finished)"""
+        return self.active_cycles.get(cycle_id, ODALPhase.IDLE)
+    
+    def _set_phase(self, cycle_id: Optional[int], phase: ODALPhase):
+        """Move a cycle to a new phase, recording how long the previous one took"""
+        if cycle_id is None:
+            return
+        previous = self.active_cycles.get(cycle_id)
+        if previous is phase:
+            return
+        now = time.perf_counter()
+        if previous is not None:
+            elapsed = now - self._phase_started[cycle_id]
+            self._stats.observe(f"phase:{previous.value}", elapsed * 1000)
+            if self.metrics is not None:
+                self._m_phases[previous].observe(elapsed)
+        self._phase_started[cycle_id] = now
+        self.active_cycles[cycle_id] = phase
+        
+        if self.tracer is not None:
+            self._trace_phase(cycle_id, phase)
+    
+    def _trace_phase(self, cycle_id: int, phase: ODALPhase):
+        """End the previous phase span and make a new one the active span"""
+        spans = self._cycle_spans.get(cycle_id)
+        if spans is None:
+            return
+        if spans[2] is not None:
+            spans[2].end()
+        spans[2] = self.tracer.start_span(f"odal.{phase.value}", parent=spans[0])
+        self.tracer.activate(spans[2])
+    
+    def _start_cycle(self) -> CycleRecord:
+        """Allocate a cycle ID and its record"""
+        with self._cycle_lock:
+            cycle_id = next(self._cycle_ids)
+            self.cycle_count = cycle_id
+            self._phase_started[cycle_id] = time.perf_counter()
+            self.active_cycles[cycle_id] = ODALPhase.OBSERVE
+        
+        result = CycleRecord(cycle_id)
+        
+        if self.tracer is not None:
+            # Joins the caller's trace if a span is active, else starts a new one
+            span = self.tracer.start_span("odal.cycle", {"odal.cycle_id": cycle_id})
+            self._cycle_spans[cycle_id] = [span, self.tracer.activate(span), None]
+            result.trace_id = span.trace_id
+            self._trace_phase(cycle_id, ODALPhase.OBSERVE)
+        
+        return result
+    
+    @staticmethod
+    def _fail_cycle(result: CycleRecord, error: Exception):
+        result.error = str(error)
+        result.decision = DecisionOutcome.REJECT.value
+        result.reason = f"System error: {error}"
+    
+    def _finish_cycle(self, result: CycleRecord):
+        result.finish()
+        duration_ms = result.duration_ms
+        self.execution_history.append(result)
+        
+        cycle_id = result.cycle_id
+        phase = self.active_cycles.get(cycle_id)
+        if phase is not None:
+            elapsed = time.perf_counter() - self._phase_started[cycle_id]
+            self._stats.observe(f"phase:{phase.value}", elapsed * 1000)
+            if self.metrics is not None:
+                self._m_phases[phase].observe(elapsed)
+        
+        self._stats.add("total_cycles")
+        self._stats.add(f"decision:{result.decision}")
+        self._stats.add("duration_ms", duration_ms)
+        self._stats.observe("cycle", duration_ms)
+        if self.metrics is not None:
+            self._m_cycles.labels(result.decision).inc()
+            self._m_cycle_duration.observe(duration_ms / 1000)
+        
+        with self._cycle_lock:
+            self.active_cycles.pop(cycle_id, None)
+            self._phase_started.pop(cycle_id, None)
+        
+        if self.tracer is not None:
+            self._end_cycle_trace(result)
+    
+    def _end_cycle_trace(self, result: CycleRecord):
+        spans = self._cycle_spans.pop(result.cycle_id, None)
+        if spans is None:
+            return
+        span, token, phase_span = spans
+        if phase_span is not None:
+            phase_span.end()
+        span.set_attribute("odal.decision", str(result.decision))
+        if result.error is not None:
+            span.set_status("error", result.error)
+        span.end()
+        self.tracer.deactivate(token)
     
     def run_cycle(
         self,
         user_input: str,
         context: Optional[Dict] = None,
-        action_executor: Optional[Callable] = None
-    ) -> Dict[str, Any]:
+        action_executor: Optional[Callable] = None,
+        idempotency_key: Optional[str] = None
+    ) -> CycleRecord:
         """
         Run one complete O.D.A.L. cycle.
         
@@ -98,106 +424,659 @@ class ODALEngine:
             user_input: User's command/request
             context: Additional context (user_id, permissions, etc.)
             action_executor: Function to execute approved actions
+            idempotency_key: Client-chosen request key; repeated calls with
+                the same key (and user) return the first call's result
         
         Returns:
-            Cycle result with decision, action, and logs
+            Cycle result with decision, action, and logs (a CycleRecord;
+            reads like the legacy result dict)
+        
+        Raises:
+            ValueError: idempotency_key was already used for a different input or context
         """
-        self.cycle_count += 1
-        cycle_start = time.time()
+        if idempotency_key is not None:
+            return self._run_idempotent(idempotency_key, user_input, context, action_executor)
+        
         context = context or {}
+        if self.admission is not None:
+            refusal = self.admission.admit(context)
+            if refusal is not None:
+                return self._shed_cycle(refusal)
         
-        result = {
-            "cycle_id": self.cycle_count,
-            "timestamp": datetime.utcnow().isoformat(),
-            "phases": {}
-        }
+        # Every admitted cycle releases its admission exactly once, even if
+        # it never gets a slot or fails before its phases start
+        result = None
+        try:
+            if self.scheduler is not None:
+                self.scheduler.acquire(context)
+            try:
+                result = self._run_phases(user_input, context, action_executor)
+            finally:
+                if self.scheduler is not None:
+                    self.scheduler.release()
+        finally:
+            if self.admission is not None:
+                self.admission.release(result.duration_ms if result is not None else None)
+        
+        return result
+    
+    def _run_phases(self, user_input: str, context: Dict, action_executor: Optional[Callable]) -> CycleRecord:
+        """Observe, decide, act and log one admitted cycle"""
+        result = self._start_cycle()
+        profile = None
+        speculation = None
         
         try:
+            # Inside the try: end() and _finish_cycle pair with every start
+            if self.profiler is not None:
+                profile = self.profiler.begin(result.cycle_id, user_input)
+            if self.speculative:
+                speculation = self._start_speculation(user_input, context)
+            
             # Phase 1: OBSERVE
-            observation = self._observe(user_input, context)
-            result["phases"]["observe"] = observation
+            self._observe(result, user_input, context)
             
-            if not observation["is_safe"]:
+            if not result.is_safe:
                 # Early rejection due to prompt injection
-                result["decision"] = DecisionOutcome.REJECT.value
-                result["reason"] = "Prompt injection detected"
+                result.decision = DecisionOutcome.REJECT.value
+                result.reason = "Prompt injection detected"
                 self._log_cycle(result)
                 return result
             
             # Phase 2: DECIDE
-            decision = self._decide(observation, context)
-            result["phases"]["decide"] = decision
-            result["decision"] = decision["outcome"]
-            result["reason"] = decision["reasoning"]
+            self._decide(result, context, speculation)
+            speculation = None
+            result.decision = result.outcome
+            result.reason = result.reasoning
             
-            if decision["outcome"] != DecisionOutcome.APPROVE.value:
+            if result.outcome != DecisionOutcome.APPROVE.value:
                 # Rejected or requires approval
+                if self.approval_queue is not None and result.outcome == DecisionOutcome.REQUIRE_APPROVAL.value:
+                    self._park(result)
                 self._log_cycle(result)
                 return result
             
             # Phase 3: ACT
-            action_result = self._act(decision["proposed_action"], action_executor)
-            result["phases"]["act"] = action_result
-            result["action_result"] = action_result
+            self._act(result, action_executor)
             
             # Phase 4: LOG
             self._log_cycle(result)
             
         except Exception as e:
-            result["error"] = str(e)
-            result["decision"] = DecisionOutcome.REJECT.value
-            result["reason"] = f"System error: {e}"
+            self._fail_cycle(result, e)
             self._log_cycle(result)
         
         finally:
-            result["duration_ms"] = (time.time() - cycle_start) * 1000
-            self.execution_history.append(result)
+            if speculation is not None:
+                self._discard_speculation(speculation)
+            self._finish_cycle(result)
+            if profile is not None:
+                self.profiler.end(profile, result)
+        
+        return result
+    
+    async def arun_cycle(
+        self,
+        user_input: str,
+        context: Optional[Dict] = None,
+        action_executor: Optional[Callable] = None,
+        idempotency_key: Optional[str] = None
+    ) -> CycleRecord:
+        """
+        Run one complete O.D.A.L. cycle on the event loop.
+        
+        Same result shape as run_cycle. Many calls may run concurrently
+        (e.g. via asyncio.gather); at most max_concurrent_cycles are in
+        flight, the rest wait for a slot.
+        
+        Args:
+            user_input: User's command/request
+            context: Additional context (user_id, permissions, etc.)
+            action_executor: Function or coroutine function to execute approved
+                actions (plain functions run in the executor)
+            idempotency_key: Client-chosen request key (see run_cycle); a
+                duplicate waits without holding a concurrency slot
+        
+        Returns:
+            Cycle result with decision, action, and logs
+        """
+        if idempotency_key is not None:
+            return await self._arun_idempotent(idempotency_key, user_input, context, action_executor)
+        
+        context = context or {}
+        if self.admission is not None:
+            # Before the semaphore: shed requests must not queue for a slot
+            refusal = await self.admission.aadmit(context)
+            if refusal is not None:
+                return self._shed_cycle(refusal)
+        
+        if self.scheduler is not None:
+            gate = self.scheduler.slot(context)
+        else:
+            if self._cycle_semaphore is None:
+                self._cycle_semaphore = asyncio.Semaphore(self.max_concurrent_cycles)
+            gate = self._cycle_semaphore
+        
+        # Released even if the cycle is cancelled or times out waiting for the gate
+        result = None
+        try:
+            async with gate:
+                result = await self._arun_phases(user_input, context, action_executor)
+        finally:
+            if self.admission is not None:
+                self.admission.release(result.duration_ms if result is not None else None)
+        
+        return result
+    
+    async def _arun_phases(self, user_input: str, context: Dict, action_executor: Optional[Callable]) -> CycleRecord:
+        """Async counterpart of _run_phases"""
+        result = self._start_cycle()
+        speculation = self._astart_speculation(user_input, context) if self.speculative else None
+        
+        try:
+            # Phase 1: OBSERVE
+            await self._aobserve(result, user_input, context)
+            
+            if not result.is_safe:
+                result.decision = DecisionOutcome.REJECT.value
+                result.reason = "Prompt injection detected"
+                await self._alog_cycle(result)
+                return result
+            
+            # Phase 2: DECIDE
+            await self._adecide(result, context, speculation)
+            speculation = None
+            result.decision = result.outcome
+            result.reason = result.reasoning
+            
+            if result.outcome != DecisionOutcome.APPROVE.value:
+                if self.approval_queue is not None and result.outcome == DecisionOutcome.REQUIRE_APPROVAL.value:
+                    self._park(result)
+                await self._alog_cycle(result)
+                return result
+            
+            # Phase 3: ACT
+            await self._aact(result, action_executor)
+            
+            # Phase 4: LOG
+            await self._alog_cycle(result)
+        
+        except Exception as e:
+            self._fail_cycle(result, e)
+            await self._alog_cycle(result)
+        
+        finally:
+            if speculation is not None:
+                self._discard_speculation(speculation)
+            self._finish_cycle(result)
         
         return result
     
-    def _observe(self, user_input: str, context: Dict) -> Dict:
+    def _shed_cycle(self, reason: str) -> CycleRecord:
+        """
+        Answer a refused request with an overloaded result.
+        
+        No cycle ran: the record has no cycle ID, no phases, no trace and no
+        execution_history entry, and it is only counted under
+        decision:overloaded - never in the latency histograms or the
+        approval rate, which must describe the cycles that did run.
+        """
+        result = CycleRecord(None)
+        result.decision = DecisionOutcome.OVERLOADED.value
+        result.reason = reason
+        result.finish()
+        self._stats.add(f"decision:{result.decision}")
+        if self.metrics is not None:
+            self._m_cycles.labels(result.decision).inc()
+        return result
+    
+    @staticmethod
+    def _reusable(result: CycleRecord) -> bool:
+        """Whether a result may be replayed for its idempotency key"""
+        # System errors and shed requests are worth retrying; keep them out of the store
+        return result.error is None and result.decision != DecisionOutcome.OVERLOADED.value
+    
+    @staticmethod
+    def _fingerprint(user_input: str, context: Optional[Dict]) -> Tuple[str, str]:
+        """Identifies a request for its idempotency key: input and context alike"""
+        return user_input, json.dumps(context or {}, sort_keys=True, default=str)
+    
+    def _run_idempotent(
+        self,
+        idempotency_key: str,
+        user_input: str,
+        context: Optional[Dict],
+        action_executor: Optional[Callable]
+    ) -> CycleRecord:
+        """Run the cycle once per key; duplicates replay or join it"""
+        key = ((context or {}).get("user_id"), idempotency_key)
+        fingerprint = self._fingerprint(user_input, context)
+        store = self.idempotency_store
+        while True:
+            state, value = store.begin(key, fingerprint)
+            if state == "replay":
+                # The stored record stays as it was completed, whatever callers do to theirs
+                return copy.deepcopy(value)
+            if state == "join":
+                result = value.wait(store.wait_timeout)
+                if result is not None:
+                    return copy.deepcopy(result)
+                continue  # The running caller gave up; take over
+            
+            try:
+                result = self.run_cycle(user_input, context, action_executor)
+            except BaseException:
+                store.abandon(key, value)
+                raise
+            store.complete(key, value, result, store=self._reusable(result))
+            return result
+    
+    async def _arun_idempotent(
+        self,
+        idempotency_key: str,
+        user_input: str,
+        context: Optional[Dict],
+        action_executor: Optional[Callable]
+    ) -> CycleRecord:
+        """Async counterpart of _run_idempotent"""
+        key = ((context or {}).get("user_id"), idempotency_key)
+        fingerprint = self._fingerprint(user_input, context)
+        store = self.idempotency_store
+        while True:
+            state, value = store.begin(key, fingerprint)
+            if state == "replay":
+                return copy.deepcopy(value)
+            if state == "join":
+                result = await value.await_result(store.wait_timeout)
+                if result is not None:
+                    return copy.deepcopy(result)
+                continue
+            
+            try:
+                result = await self.arun_cycle(user_input, context, action_executor)
+            except BaseException:
+                store.abandon(key, value)
+                raise
+            store.complete(key, value, result, store=self._reusable(result))
+            return result
+    
+    def _park(self, record: CycleRecord):
+        """Checkpoint a require_approval cycle in the approval queue"""
+        guard = record.security_metadata()
+        checkpoint = {
+            "cycle_id": record.cycle_id,
+            "trace_id": record.trace_id,
+            "user_input": record.user_input,
+            "context": record.context,
+            "guard": {key: value for key, value in guard.items() if key != "context"},
+            "proposed_action": record.proposed_action,
+            "reasoning": record.reasoning,
+            "policy_details": record.policy_details or []
+        }
+        record["approval_id"] = self.approval_queue.park(checkpoint, self.policy_engine.policy_version)
+    
+    def approve(
+        self,
+        approval_id: str,
+        approver: Optional[str] = None,
+        action_executor: Optional[Callable] = None
+    ) -> CycleRecord:
+        """
+        Approve a parked cycle and resume it into ACT.
+        
+        Guard, intent parsing and policy evaluation are not repeated; policies
+        are re-evaluated only if the policy set changed since the cycle was
+        parked (a rejection then still wins). Expired approvals are rejected.
+        
+        Args:
+            approval_id: ID from the parked cycle's result["approval_id"]
+            approver: Identity of the approver (audited)
+            action_executor: Function to execute the approved action
+        
+        Returns:
+            New cycle result (resumed_from = the parked cycle's ID)
+        
+        Raises:
+            KeyError: Unknown approval ID
+            ValueError: Approval already decided
+        """
+        entry = self.approval_queue.claim(approval_id, "approved", approver)
+        checkpoint = entry["checkpoint"]
+        
+        result = self._start_cycle()
+        result["approval_id"] = approval_id
+        result["resumed_from"] = checkpoint["cycle_id"]
+        
+        try:
+            context = checkpoint["context"]
+            guard = dict(checkpoint["guard"], context=context)
+            result.set_observation(checkpoint["user_input"], context, True, guard)
+            self._set_phase(result.cycle_id, ODALPhase.DECIDE)
+            
+            proposed_action = checkpoint["proposed_action"]
+            policy_details = checkpoint["policy_details"]
+            revalidated = entry["policy_version"] != self.policy_engine.policy_version
+            
+            policy_decision = None
+            if revalidated and entry["status"] == "approved":
+                policy_decision, policy_reason, policy_details = self._evaluate(proposed_action, context)
+            
+            if entry["status"] == "expired":
+                result.set_decision(proposed_action, DecisionOutcome.REJECT.value, "Approval expired", policy_details)
+            elif policy_decision == PolicyDecision.REJECT:
+                # The current policy set forbids it; human approval cannot override
+                self._record_decision(result, proposed_action, policy_decision, policy_reason, policy_details)
+            else:
+                reasoning = f"Approved by {approver or 'unknown'}: {checkpoint['reasoning']}"
+                result.set_decision(proposed_action, DecisionOutcome.APPROVE.value, reasoning, policy_details)
+            
+            self.audit_logger.log_event(
+                EventType.POLICY_APPROVAL,
+                f"O.D.A.L. Cycle #{checkpoint['cycle_id']} approval: {result.outcome}",
+                metadata={
+                    "approval_id": approval_id,
+                    "parked_cycle_id": checkpoint["cycle_id"],
+                    "cycle_id": result.cycle_id,
+                    "approver": approver,
+                    "decision": result.outcome,
+                    "reasoning": result.reasoning,
+                    "policy_revalidated": revalidated
+                },
+                severity="info"
+            )
+            result.decision = result.outcome
+            result.reason = result.reasoning
+            
+            if result.outcome == DecisionOutcome.APPROVE.value:
+                self._act(result, action_executor)
+            self._log_cycle(result)
+        
+        except Exception as e:
+            self._fail_cycle(result, e)
+            self._log_cycle(result)
+        
+        finally:
+            self._finish_cycle(result)
+        
+        return result
+    
+    def reject(self, approval_id: str, approver: Optional[str] = None, reason: Optional[str] = None) -> Dict:
+        """
+        Reject a parked cycle (it is never resumed).
+        
+        Args:
+            approval_id: ID from the parked cycle's result["approval_id"]
+            approver: Identity of the rejecting approver (audited)
+            reason: Why it was rejected
+        
+        Returns:
+            Approval entry with its final status
+        """
+        entry = self.approval_queue.claim(approval_id, "rejected", approver, reason)
+        self.audit_logger.log_event(
+            EventType.POLICY_APPROVAL,
+            f"O.D.A.L. Cycle #{entry['cycle_id']} approval: {DecisionOutcome.REJECT.value}",
+            metadata={
+                "approval_id": approval_id,
+                "parked_cycle_id": entry["cycle_id"],
+                "approver": approver,
+                "decision": DecisionOutcome.REJECT.value,
+                "reasoning": reason
+            },
+            severity="info"
+        )
+        return entry
+    
+    def run_batch(
+        self,
+        requests,
+        workers: int = 4,
+        mode: str = "thread",
+        ordered: bool = True,
+        action_executor: Optional[Callable] = None,
+        engine_factory: Optional[Callable] = None,
+        queue_size: Optional[int] = None
+    ):
+        """
+        Run many cycles on a worker pool (see batch.py).
+        
+        Each worker builds its own engine; by default with a fresh Prompt Guard,
+        a Policy Engine on this engine's policy directory, and a multi-writer
+        Audit Logger segment in this engine's audit log directory.
+        
+        Args:
+            requests: Iterable of {"input": str, "context": dict} (or plain strings)
+            workers: Number of workers
+            mode: "thread" or "process"
+            ordered: Yield results in input order (otherwise as completed)
+            action_executor: Function to execute approved actions
+            engine_factory: Custom Callable(worker_index) -> ODALEngine
+            queue_size: Bound of the input/output queues
+        
+        Returns:
+            BatchRun to iterate; its .statistics (get_statistics() shape) are
+            set once iteration finishes
+        """
+        try:
+            from .batch import run_batch
+        except ImportError:
+            # Fallback for direct execution
+            from batch import run_batch
+        
+        return run_batch(
+            requests,
+            workers=workers,
+            mode=mode,
+            ordered=ordered,
+            action_executor=action_executor,
+            log_dir=self.audit_logger.log_dir,
+            policy_dir=self.policy_engine.policy_dir,
+            engine_factory=engine_factory,
+            queue_size=queue_size
+        )
+    
+    async def _run_in_executor(self, func: Callable, *args):
+        loop = asyncio.get_running_loop()
+        # Carry contextvars (the active span) into the worker thread
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self.executor, context.run, func, *args)
+    
+    def _observe(self, record: CycleRecord, user_input: str, context: Dict):
         """
         OBSERVE Phase: Collect and validate input
         
         Security Checkpoint 1: Prompt Guard
         """
-        self.current_phase = ODALPhase.OBSERVE
+        self._set_phase(record.cycle_id, ODALPhase.OBSERVE)
         
         # Validate input with Prompt Guard
         is_safe, guard_metadata = self.prompt_guard.validate(user_input, context)
         
-        observation = {
-            "user_input": user_input,
-            "context": context,
-            "is_safe": is_safe,
-            "security_metadata": guard_metadata,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        self._record_observation(record, user_input, context, is_safe, guard_metadata)
+    
+    async def _aobserve(self, record: CycleRecord, user_input: str, context: Dict):
+        """OBSERVE Phase (async): Prompt Guard runs in the executor"""
+        self._set_phase(record.cycle_id, ODALPhase.OBSERVE)
+        
+        is_safe, guard_metadata = await self._run_in_executor(
+            self.prompt_guard.validate, user_input, context
+        )
+        
+        self._record_observation(record, user_input, context, is_safe, guard_metadata)
+    
+    def _record_observation(
+        self,
+        record: CycleRecord,
+        user_input: str,
+        context: Dict,
+        is_safe: bool,
+        guard_metadata: Dict
+    ):
+        """Record the observation and log unsafe input"""
+        record.set_observation(user_input, context, is_safe, guard_metadata)
         
         # Log if unsafe
         if not is_safe:
             self.audit_logger.log_prompt_injection(user_input, guard_metadata)
-        
-        return observation
     
-    def _decide(self, observation: Dict, context: Dict) -> Dict:
+    def _decide(self, record: CycleRecord, context: Dict, speculation=None):
         """
         DECIDE Phase: Determine action based on observation
         
         Security Checkpoint 2: Policy Engine
         """
-        self.current_phase = ODALPhase.DECIDE
+        self._set_phase(record.cycle_id, ODALPhase.DECIDE)
+        
+        if speculation is not None:
+            # Input passed the guard: commit the speculative work
+            waited_from = time.perf_counter()
+            outcome = speculation[0].result()
+            self._commit_speculation(record, context, speculation, outcome, waited_from)
+            return
         
         # Parse user input into proposed action
         # In production, use LLM to interpret intent
-        proposed_action = self._parse_intent(observation["user_input"], context)
+        proposed_action = self._parse_intent(record.user_input, context)
         
         # Evaluate against policies
-        policy_decision, policy_reason, policy_details = self.policy_engine.evaluate(
+        policy_decision, policy_reason, policy_details = self._evaluate(
             proposed_action,
             context
         )
         
+        self._record_decision(
+            record, proposed_action, policy_decision, policy_reason, policy_details
+        )
+    
+    async def _adecide(self, record: CycleRecord, context: Dict, speculation=None):
+        """DECIDE Phase (async): Policy Engine runs in the executor"""
+        self._set_phase(record.cycle_id, ODALPhase.DECIDE)
+        
+        if speculation is not None:
+            waited_from = time.perf_counter()
+            outcome = await speculation[0]
+            self._commit_speculation(record, context, speculation, outcome, waited_from)
+            return
+        
+        proposed_action = self._parse_intent(record.user_input, context)
+        
+        policy_decision, policy_reason, policy_details = await self._run_in_executor(
+            self._evaluate, proposed_action, context
+        )
+        
+        self._record_decision(
+            record, proposed_action, policy_decision, policy_reason, policy_details
+        )
+    
+    @staticmethod
+    def _policy_subjects(proposed_action: Dict) -> List[Tuple[Optional[str], Dict]]:
+        """The action itself (step None) and the action of every plan step"""
+        subjects = [(None, proposed_action)]
+        for index, step in enumerate(proposed_action.get("plan") or []):
+            subjects.append((str(step.get("id", index)), step["action"]))
+        return subjects
+    
+    def _evaluate(self, proposed_action: Dict, context: Dict) -> Tuple[PolicyDecision, str, List[Dict]]:
+        """
+        Evaluate an action against policies, including each plan step.
+        
+        Plan steps run as actions of their own in ACT, so every step is
+        checked; the strictest outcome decides the whole cycle.
+        """
+        return self._combine_evaluations([
+            (step_id, self.policy_engine.evaluate(action, context))
+            for step_id, action in self._policy_subjects(proposed_action)
+        ])
+    
+    @staticmethod
+    def _combine_evaluations(evaluations: List[Tuple[Optional[str], Tuple]]) -> Tuple[PolicyDecision, str, List[Dict]]:
+        """Strictest of several evaluations; its details come first"""
+        if len(evaluations) == 1:
+            return evaluations[0][1]
+        deciding = max(range(len(evaluations)), key=lambda i: _POLICY_SEVERITY[evaluations[i][1][0]])
+        step_id, (decision, reason, _) = evaluations[deciding]
+        if step_id is not None:
+            reason = f"Plan step {step_id}: {reason}"
+        details = []
+        for index in [deciding] + [i for i in range(len(evaluations)) if i != deciding]:
+            step_id, (_, _, step_details) = evaluations[index]
+            details.extend(step_details if step_id is None else [dict(d, plan_step=step_id) for d in step_details])
+        return decision, reason, details
+    
+    def _worker_pool(self) -> Executor:
+        """The engine's executor, or a thread pool created on first use"""
+        if self.executor is not None:
+            return self.executor
+        if self._pool is None:
+            with self._cycle_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(thread_name_prefix="odal-worker")
+        return self._pool
+    
+    def _start_speculation(self, user_input: str, context: Dict):
+        """Start intent parsing and policy pre-evaluation on a worker thread"""
+        executor = self._worker_pool()
+        # Works on a copy: a discarded evaluation must not enrich the caller's context
+        spec_context = dict(context)
+        future = executor.submit(
+            contextvars.copy_context().run, self._speculate, user_input, spec_context
+        )
+        return future, spec_context
+    
+    def _astart_speculation(self, user_input: str, context: Dict):
+        """Start intent parsing and policy pre-evaluation as a task"""
+        spec_context = dict(context)
+        task = asyncio.ensure_future(self._run_in_executor(self._speculate, user_input, spec_context))
+        return task, spec_context
+    
+    def _speculate(self, user_input: str, context: Dict):
+        """Speculative DECIDE work; records nothing"""
+        started = time.perf_counter()
+        proposed_action = self._parse_intent(user_input, context)
+        pending = [
+            (step_id, self.policy_engine.pre_evaluate(action, context))
+            for step_id, action in self._policy_subjects(proposed_action)
+        ]
+        return proposed_action, pending, time.perf_counter() - started
+    
+    def _commit_speculation(self, record: CycleRecord, context: Dict, speculation, outcome, waited_from: float):
+        """Record speculative DECIDE work as the real decision"""
+        proposed_action, pending, work = outcome
+        waited = time.perf_counter() - waited_from
+        
+        # Same in-place context enrichment as a direct evaluate()
+        context.update(speculation[1])
+        policy_decision, policy_reason, policy_details = self._combine_evaluations([
+            (step_id, self.policy_engine.commit_evaluation(evaluation)) for step_id, evaluation in pending
+        ])
+        
+        # Serially, DECIDE would have taken the whole speculative work time
+        saved_ms = max(work - waited, 0.0) * 1000
+        record["speculation_saved_ms"] = saved_ms
+        self._stats.add("speculation:committed")
+        self._stats.observe("speculation_saved", saved_ms)
+        
+        self._record_decision(
+            record, proposed_action, policy_decision, policy_reason, policy_details
+        )
+    
+    def _discard_speculation(self, speculation):
+        """Drop speculative work (guard rejected the input or the cycle failed)"""
+        future = speculation[0]
+        if not future.cancel() and isinstance(future, asyncio.Future):
+            # Already finished: retrieve any exception so it is not reported
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._stats.add("speculation:discarded")
+    
+    def _record_decision(
+        self,
+        record: CycleRecord,
+        proposed_action: Dict,
+        policy_decision: PolicyDecision,
+        policy_reason: str,
+        policy_details: List[Dict]
+    ):
+        """Map the policy result to a decision, record and log it"""
         # Map policy decision to ODAL decision
         if policy_decision == PolicyDecision.APPROVE:
             outcome = DecisionOutcome.APPROVE
@@ -216,72 +1095,43 @@ class ODALEngine:
             outcome = DecisionOutcome.REQUIRE_APPROVAL
             reasoning = policy_reason
         
-        decision = {
-            "proposed_action": proposed_action,
-            "outcome": outcome.value,
-            "reasoning": reasoning,
-            "policy_details": policy_details,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        record.set_decision(proposed_action, outcome.value, reasoning, policy_details)
         
         # Log decision
         self.audit_logger.log_decision(
-            observation=observation,
+            observation=record.observation(),
             decision=outcome.value,
             reasoning=reasoning,
             metadata={"policy_details": policy_details}
         )
-        
-        return decision
     
     def _parse_intent(self, user_input: str, context: Dict) -> Dict:
         """
         Parse user input into structured action.
         
-        In production, use LLM to interpret natural language.
-        This is a simplified version for demonstration.
+        Uses the configured intent parser (e.g. LLM-backed, see
+        intent_parser.py), else simple keyword-based parsing.
         """
-        # Simple keyword-based parsing
-        action = {
-            "action_type": "unknown",
-            "estimated_cost": 0.0,
-            "environment": context.get("environment", "development"),
-            "user_input": user_input
-        }
-        
-        # Detect action type
-        if "deploy" in user_input.lower():
-            action["action_type"] = "deploy"
-            action["estimated_cost"] = 100.0
-        elif "scale" in user_input.lower():
-            action["action_type"] = "scale"
-            action["estimated_cost"] = 200.0
-        elif "delete" in user_input.lower() or "remove" in user_input.lower():
-            action["action_type"] = "delete"
-            action["estimated_cost"] = 0.0
-        
-        # Detect environment
-        if "production" in user_input.lower() or "prod" in user_input.lower():
-            action["environment"] = "production"
-            action["estimated_cost"] *= 2  # Production costs more
-        
-        return action
-    
-    def _act(
-        self,
-        proposed_action: Dict,
-        action_executor: Optional[Callable] = None
-    ) -> Dict:
+        if self.intent_parser is not None:
+            return self.intent_parser.parse(user_input, context)
+        return rule_intent(user_input, context)[0]
+    
+    def _act(self, record: CycleRecord, action_executor: Optional[Callable] = None):
         """
         ACT Phase: Execute approved action
         
         Note: Humans do NOT touch this phase.
         """
-        self.current_phase = ODALPhase.ACT
+        self._set_phase(record.cycle_id, ODALPhase.ACT)
         
-        action_start = time.time()
+        proposed_action = record.proposed_action
+        action_start = time.monotonic_ns()
         
-        if action_executor:
+        if "plan" in proposed_action:
+            plan = ActionPlan.from_action(proposed_action, self.plan_workers, self.step_timeout)
+            result = plan.run(action_executor or self._simulated_result, self._worker_pool())
+            status = self._plan_status(result, action_executor)
+        elif action_executor:
             # Execute with provided executor
             try:
                 result = action_executor(proposed_action)
@@ -291,37 +1141,78 @@ class ODALEngine:
                 status = "failed"
         else:
             # Simulated execution
-            result = {
-                "status": "simulated",
-                "action": proposed_action["action_type"],
-                "message": f"Would execute: {proposed_action['action_type']}"
-            }
+            result = self._simulated_result(proposed_action)
+            status = "simulated"
+        
+        self._record_action(record, result, status, action_start)
+    
+    async def _aact(self, record: CycleRecord, action_executor: Optional[Callable] = None):
+        """ACT Phase (async): coroutine executors are awaited, plain ones run in the executor"""
+        self._set_phase(record.cycle_id, ODALPhase.ACT)
+        
+        proposed_action = record.proposed_action
+        action_start = time.monotonic_ns()
+        
+        if "plan" in proposed_action:
+            plan = ActionPlan.from_action(proposed_action, self.plan_workers, self.step_timeout)
+            result = await plan.arun(action_executor or self._simulated_result, self._run_in_executor)
+            status = self._plan_status(result, action_executor)
+        elif action_executor:
+            try:
+                if inspect.iscoroutinefunction(action_executor):
+                    result = await action_executor(proposed_action)
+                else:
+                    result = await self._run_in_executor(action_executor, proposed_action)
+                    if inspect.isawaitable(result):
+                        result = await result
+                status = "success"
+            except Exception as e:
+                result = {"error": str(e)}
+                status = "failed"
+        else:
+            result = self._simulated_result(proposed_action)
             status = "simulated"
         
-        action_result = {
-            "action": proposed_action,
-            "result": result,
-            "status": status,
-            "duration_ms": (time.time() - action_start) * 1000,
-            "timestamp": datetime.utcnow().isoformat()
+        self._record_action(record, result, status, action_start)
+    
+    @staticmethod
+    def _plan_status(plan_result: Dict, action_executor: Optional[Callable]) -> str:
+        if plan_result["status"] != "success":
+            return "failed"
+        return "success" if action_executor else "simulated"
+    
+    @staticmethod
+    def _simulated_result(proposed_action: Dict) -> Dict:
+        return {
+            "status": "simulated",
+            "action": proposed_action["action_type"],
+            "message": f"Would execute: {proposed_action['action_type']}"
         }
+    
+    def _record_action(
+        self,
+        record: CycleRecord,
+        result: Any,
+        status: str,
+        action_start: int
+    ):
+        """Record the action result and log the execution"""
+        record.set_action(result, status, action_start)
         
         # Log action execution
         self.audit_logger.log_action_executed(
-            proposed_action,
+            record.proposed_action,
             result,
-            action_result["duration_ms"]
+            (record.acted_ns - action_start) / 1e6
         )
-        
-        return action_result
     
-    def _log_cycle(self, cycle_result: Dict):
+    def _log_cycle(self, cycle_result: CycleRecord):
         """
         LOG Phase: Record cycle for institutional memory
         
         This is where "Why we did X" gets embedded into the system.
         """
-        self.current_phase = ODALPhase.LOG
+        self._set_phase(cycle_result["cycle_id"], ODALPhase.LOG)
         
         # Log complete cycle
         self.audit_logger.log_event(
@@ -338,32 +1229,182 @@ class ODALEngine:
         
         # In production: Store in vector database for long-term memory
         # This enables "Why did we make this decision 6 months ago?" queries
+    
+    async def _alog_cycle(self, cycle_result: CycleRecord):
+        """
+        LOG Phase (async).
         
-        self.current_phase = ODALPhase.IDLE
+        Audit writes stay on the event loop thread so concurrent cycles
+        never interleave inside the logger; use AuditLogger(background_writer=True)
+        to keep file I/O off the loop.
+        """
+        self._log_cycle(cycle_result)
+    
+    def _snapshot_components(self) -> List:
+        components = (
+            ("prompt_guard", self.prompt_guard),
+            ("policy_engine", self.policy_engine),
+            ("cost_tracker", self.cost_tracker),
+            ("intent_parser", self.intent_parser),
+            ("admission", self.admission)
+        )
+        return [(name, c) for name, c in components if c is not None and hasattr(c, "export_state")]
+    
+    def snapshot(self, path: Path) -> Dict:
+        """
+        Atomically write engine state to a snapshot file.
+        
+        Args:
+            path: Snapshot file (replaced if it exists)
+        
+        Returns:
+            path, size in bytes, sections written and duration_ms
+        """
+        start = time.perf_counter()
+        with self._cycle_lock:
+            cycle_count = self.cycle_count
+        sections = {"engine": {"cycle_count": cycle_count, "stats": self._stats.to_dict()}}
+        for name, component in self._snapshot_components():
+            sections[name] = component.export_state()
+        size = write_snapshot(path, sections)
+        return {
+            "path": str(path),
+            "size": size,
+            "sections": list(sections),
+            "duration_ms": (time.perf_counter() - start) * 1000
+        }
+    
+    def restore(self, path: Path) -> Dict:
+        """
+        Load engine state from a snapshot file, before cycles run.
+        
+        Sections for components this engine does not have are ignored.
+        
+        Args:
+            path: Snapshot file written by snapshot()
+        
+        Returns:
+            Sections restored, snapshot age_seconds and duration_ms
+        
+        Raises:
+            ValueError: Not a snapshot, unsupported version, or corrupt
+        """
+        start = time.perf_counter()
+        header, sections = read_snapshot(path)
+        
+        restored = []
+        engine_state = sections.get("engine")
+        if engine_state is not None:
+            with self._cycle_lock:
+                self.cycle_count = engine_state["cycle_count"]
+                if self._cycle_id_source is None:
+                    # First ID of this engine's stride after the restored one
+                    next_id = self.cycle_count + 1
+                    next_id += (self.cycle_id_start - next_id) % self.cycle_id_step
+                    self._cycle_ids = itertools.count(max(next_id, self.cycle_id_start), self.cycle_id_step)
+            self._stats.load(engine_state["stats"])
+            restored.append("engine")
+        for name, component in self._snapshot_components():
+            if name in sections:
+                component.import_state(sections[name])
+                restored.append(name)
+        
+        return {
+            "sections": restored,
+            "age_seconds": time.time() - header["created"],
+            "duration_ms": (time.perf_counter() - start) * 1000
+        }
     
     def get_statistics(self) -> Dict:
         """Get engine statistics"""
-        if not self.execution_history:
+        snapshot = self.get_stats_snapshot()
+        counters = snapshot["counters"]
+        if not counters.get("total_cycles") and not counters.get("decision:overloaded"):
             return {"total_cycles": 0}
         
-        total = len(self.execution_history)
-        approved = sum(1 for c in self.execution_history if c.get("decision") == "approve")
-        rejected = sum(1 for c in self.execution_history if c.get("decision") == "reject")
-        pending = sum(1 for c in self.execution_history if c.get("decision") == "require_approval")
+        statistics = self.summarize_statistics(
+            snapshot,
+            self.prompt_guard.get_statistics(),
+            self.policy_engine.get_statistics(),
+            self.audit_logger.get_statistics()
+        )
+        if self.intent_parser is not None and hasattr(self.intent_parser, "get_statistics"):
+            statistics["intent_parser_stats"] = self.intent_parser.get_statistics()
+        idempotency = self.idempotency_store.get_statistics()
+        if idempotency["executed"]:
+            statistics["idempotency"] = idempotency
+        if self.admission is not None:
+            statistics["admission"] = self.admission.get_statistics()
+        if self.scheduler is not None:
+            statistics["scheduler"] = self.scheduler.get_statistics()
+        return statistics
+    
+    def get_stats_snapshot(self) -> Dict:
+        """
+        Get a mergeable snapshot of cycle counters and latency histograms.
         
-        avg_duration = sum(c.get("duration_ms", 0) for c in self.execution_history) / total
+        Snapshots from several engines (threads, workers, processes) can be
+        combined with stats.merge_snapshots() and passed to summarize_statistics().
+        """
+        return self._stats.to_dict()
+    
+    @staticmethod
+    def summarize_statistics(
+        snapshot: Dict,
+        prompt_guard_stats: Dict,
+        policy_engine_stats: Dict,
+        audit_logger_stats: Dict
+    ) -> Dict:
+        """
+        Build the get_statistics() result from a stats snapshot.
         
-        return {
+        Shared with batch mode, which merges the snapshots of several engines.
+        """
+        counts = snapshot["counters"]
+        total = int(counts.get("total_cycles", 0))
+        # Shed requests are not cycles: they only appear as "overloaded"
+        overloaded = int(counts.get("decision:overloaded", 0))
+        if total == 0 and overloaded == 0:
+            return {"total_cycles": 0}
+        
+        latency = {}
+        for name, data in snapshot["histograms"].items():
+            key = name.split(":", 1)[1] if name.startswith("phase:") else name
+            latency[key] = LatencyHistogram.from_dict(data).summary()
+        
+        approved = int(counts.get("decision:approve", 0))
+        rejected = int(counts.get("decision:reject", 0))
+        pending = int(counts.get("decision:require_approval", 0))
+        
+        avg_duration = counts.get("duration_ms", 0) / total if total > 0 else 0
+        saved = latency.pop("speculation_saved", None)
+        
+        statistics = {
             "total_cycles": total,
             "approved": approved,
             "rejected": rejected,
             "pending_approval": pending,
             "approval_rate": approved / total if total > 0 else 0,
             "avg_duration_ms": avg_duration,
-            "prompt_guard_stats": self.prompt_guard.get_statistics(),
-            "policy_engine_stats": self.policy_engine.get_statistics(),
-            "audit_logger_stats": self.audit_logger.get_statistics()
+            "latency_ms": latency,
+            "prompt_guard_stats": prompt_guard_stats,
+            "policy_engine_stats": policy_engine_stats,
+            "audit_logger_stats": audit_logger_stats
         }
+        
+        if overloaded:
+            statistics["overloaded"] = overloaded
+        
+        committed = int(counts.get("speculation:committed", 0))
+        discarded = int(counts.get("speculation:discarded", 0))
+        if committed or discarded:
+            statistics["speculation"] = {
+                "committed": committed,
+                "discarded": discarded,
+                "saved_ms": saved
+            }
+        
+        return statistics
 
 
 # Example usage
@@ -0,0 +1,284 @@
+"""
+Cycle Profiler: Sampled and Slow-Cycle Profiling for ODALEngine
+
+Two capture paths, both opt-in through ODALEngine(profiler=...):
+- Sampling: a configurable fraction of cycles runs under cProfile (and
+  optionally tracemalloc); written as a .pstats file (plus .alloc.txt)
+- Slow cycles: cProfile cannot be switched on after the fact, so a watchdog
+  thread stack-samples every in-flight cycle once it passes the latency
+  threshold; written as a .collapsed file (flamegraph.pl / speedscope input)
+
+Each capture gets a .json sidecar with the cycle ID, input summary, duration
+and reason. Captures live in a bounded on-disk ring (oldest deleted first).
+Unsampled cycles cost one random() call and two dict operations.
+"""
+
+import cProfile
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class _ActiveCycle:
+    __slots__ = ("cycle_id", "user_input", "thread_id", "started", "profile", "alloc_start", "stacks")
+
+    def __init__(self, cycle_id: int, user_input: str, thread_id: int):
+        self.cycle_id = cycle_id
+        self.user_input = user_input
+        self.thread_id = thread_id
+        self.started = time.monotonic()
+        self.profile: Optional[cProfile.Profile] = None
+        self.alloc_start = None
+        self.stacks: Optional[Counter] = None
+
+
+def _collapse(frame) -> str:
+    """Stack as root-first "file:function;..." (collapsed-stack format)"""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class CycleProfiler:
+    """
+    Opt-in profiler for ODALEngine.run_cycle.
+
+    Features:
+    - Random sampling of cycles under cProfile (optional tracemalloc)
+    - Watchdog stack sampling of cycles slower than a threshold
+    - pstats / collapsed-stack output with JSON metadata
+    - Bounded on-disk ring of captures
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        sample_rate: float = 0.01,
+        slow_threshold_ms: Optional[float] = 500.0,
+        trace_memory: bool = False,
+        max_captures: int = 50,
+        stack_interval: float = 0.005,
+        input_summary_chars: int = 80
+    ):
+        """
+        Initialize Cycle Profiler.
+
+        Args:
+            output_dir: Directory for capture files
+            sample_rate: Fraction of cycles to run under cProfile (0 disables)
+            slow_threshold_ms: Stack-sample cycles running longer than this
+                (None disables the watchdog)
+            trace_memory: Also record tracemalloc allocation diffs for sampled cycles
+            max_captures: Captures kept on disk (each is 2-3 files)
+            stack_interval: Seconds between watchdog stack samples
+            input_summary_chars: Characters of user input kept in metadata
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.sample_rate = sample_rate
+        self.slow_threshold = slow_threshold_ms / 1000.0 if slow_threshold_ms is not None else None
+        self.trace_memory = trace_memory
+        self.max_captures = max_captures
+        self.stack_interval = stack_interval
+        self.input_summary_chars = input_summary_chars
+
+        self._active: Dict[int, _ActiveCycle] = {}
+        self._lock = threading.Lock()
+        self._profiling_threads = set()
+        self._memory_users = 0
+        self._started_tracemalloc = False
+        self._captures = deque(sorted(p.stem for p in self.output_dir.glob("*.json")))
+        self._capture_seq = 0
+        self.stats = Counter()
+
+        self._stop = threading.Event()
+        self._watchdog = None
+        if self.slow_threshold is not None:
+            self._watchdog = threading.Thread(target=self._watch, name="cycle-watchdog", daemon=True)
+            self._watchdog.start()
+
+    def begin(self, cycle_id: int, user_input: str) -> _ActiveCycle:
+        """
+        Register a starting cycle; called on the cycle's thread.
+
+        Returns:
+            Handle to pass to end()
+        """
+        thread_id = threading.get_ident()
+        cycle = _ActiveCycle(cycle_id, user_input, thread_id)
+
+        if self.sample_rate and random.random() < self.sample_rate:
+            with self._lock:
+                # cProfile is per thread; nested cycles on one thread are not profiled twice
+                sampled = thread_id not in self._profiling_threads
+                if sampled:
+                    self._profiling_threads.add(thread_id)
+            if sampled:
+                if self.trace_memory:
+                    with self._lock:
+                        self._memory_users += 1
+                        if not tracemalloc.is_tracing():
+                            tracemalloc.start()
+                            self._started_tracemalloc = True
+                    cycle.alloc_start = tracemalloc.take_snapshot()
+                profile = cProfile.Profile()
+                try:
+                    profile.enable()
+                    cycle.profile = profile
+                except ValueError:
+                    # Python 3.12+ allows one active profiler per process: another
+                    # thread's sampled cycle (or an outside profiler) has it
+                    with self._lock:
+                        self._profiling_threads.discard(thread_id)
+                        self.stats["sample_skipped"] += 1
+                    if cycle.alloc_start is not None:
+                        cycle.alloc_start = None
+                        self._release_memory()
+
+        if self._watchdog is not None:
+            self._active[cycle_id] = cycle
+        return cycle
+
+    def end(self, cycle: _ActiveCycle, result: Dict[str, Any]):
+        """
+        Finish a cycle and write any captures.
+
+        Args:
+            cycle: Handle from begin()
+            result: Cycle result (for duration and decision)
+        """
+        duration = time.monotonic() - cycle.started
+        self._active.pop(cycle.cycle_id, None)
+        slow = self.slow_threshold is not None and duration >= self.slow_threshold
+        with self._lock:
+            self.stats["cycles"] += 1
+            if cycle.profile is not None:
+                self.stats["sampled"] += 1
+            if slow:
+                self.stats["slow"] += 1
+
+        if cycle.profile is not None:
+            cycle.profile.disable()
+            with self._lock:
+                self._profiling_threads.discard(cycle.thread_id)
+            self._write_capture(cycle, result, duration, "sampled")
+            if cycle.alloc_start is not None:
+                self._release_memory()
+
+        if slow:
+            self._write_capture(cycle, result, duration, "slow")
+
+    def _release_memory(self):
+        """Drop a sampled cycle's hold on tracemalloc"""
+        with self._lock:
+            self._memory_users -= 1
+            if self._memory_users == 0 and self._started_tracemalloc:
+                # Tracing slows every allocation; only keep it on while needed
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+
+    def _watch(self):
+        """
+        Watchdog: sleep until a cycle could cross the threshold, then sample stacks.
+
+        Starting cycles never wake this thread (that would cost a thread switch
+        per cycle); when idle it polls at half the threshold instead, so a slow
+        cycle is sampled from at most 1.5x the threshold on.
+        """
+        while not self._stop.is_set():
+            now = time.monotonic()
+            active = list(self._active.values())
+            if not active:
+                self._stop.wait(self.slow_threshold / 2)
+                continue
+
+            slow = [c for c in active if now - c.started >= self.slow_threshold]
+            if slow:
+                frames = sys._current_frames()
+                for cycle in slow:
+                    frame = frames.get(cycle.thread_id)
+                    if frame is None:
+                        continue
+                    if cycle.stacks is None:
+                        cycle.stacks = Counter()
+                    cycle.stacks[_collapse(frame)] += 1
+                del frames
+                self._stop.wait(self.stack_interval)
+            else:
+                oldest = min(c.started for c in active)
+                self._stop.wait(max(oldest + self.slow_threshold - now, self.stack_interval))
+
+    def _write_capture(self, cycle: _ActiveCycle, result: Dict, duration: float, reason: str):
+        with self._lock:
+            self._capture_seq += 1
+            base = (
+                f"{datetime.utcnow().strftime('%Y%m%dT%H%M%S')}-{self._capture_seq:04d}"
+                f"_cycle{cycle.cycle_id}_{reason}"
+            )
+
+        files = []
+        if reason == "sampled":
+            cycle.profile.dump_stats(str(self.output_dir / f"{base}.pstats"))
+            files.append(f"{base}.pstats")
+            if cycle.alloc_start is not None:
+                diff = tracemalloc.take_snapshot().compare_to(cycle.alloc_start, "lineno")
+                with open(self.output_dir / f"{base}.alloc.txt", "w", encoding="utf-8") as f:
+                    f.write("\n".join(str(stat) for stat in diff[:25]) + "\n")
+                files.append(f"{base}.alloc.txt")
+        else:
+            stacks = cycle.stacks or Counter()
+            with open(self.output_dir / f"{base}.collapsed", "w", encoding="utf-8") as f:
+                for stack, count in stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+            files.append(f"{base}.collapsed")
+
+        metadata = {
+            "cycle_id": cycle.cycle_id,
+            "reason": reason,
+            "input_summary": re.sub(r"\s+", " ", cycle.user_input)[:self.input_summary_chars],
+            "duration_ms": duration * 1000,
+            "decision": result.get("decision"),
+            "trace_id": result.get("trace_id"),
+            "stack_samples": sum(cycle.stacks.values()) if cycle.stacks else 0,
+            "files": files,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        with open(self.output_dir / f"{base}.json", "w", encoding="utf-8") as f:
+            json.dump(metadata, f, indent=2)
+
+        with self._lock:
+            self._captures.append(base)
+            expired = []
+            while len(self._captures) > self.max_captures:
+                expired.append(self._captures.popleft())
+        for old in expired:
+            for path in self.output_dir.glob(f"{old}.*"):
+                path.unlink(missing_ok=True)
+
+    def close(self):
+        """Stop the watchdog thread"""
+        self._stop.set()
+        if self._watchdog is not None:
+            self._watchdog.join()
+
+    def get_statistics(self) -> Dict:
+        return {
+            "cycles": self.stats["cycles"],
+            "sampled": self.stats["sampled"],
+            "sample_skipped": self.stats["sample_skipped"],
+            "slow": self.stats["slow"],
+            "captures_on_disk": len(self._captures),
+            "output_dir": str(self.output_dir)
+        }
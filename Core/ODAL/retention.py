@@ -0,0 +1,350 @@
+"""
+Retention: Bounded In-Memory Histories with Spill-to-Disk
+
+Long-running agents kept every cycle, evaluation, detection, audit event
+and cost entry in plain lists. A RetentionBuffer keeps the newest items in
+memory (bounded by count and/or age); evicted items are appended to a JSONL
+spill file, or dropped when no spill file is configured. Iteration, len()
+and indexing cover spilled and in-memory items alike, so code that scans a
+history keeps working while resident memory stays flat. Indexes and slices
+that fall in the in-memory window never touch the spill file, and the
+spill file is capped in size (its oldest half is dropped when full).
+
+A RetentionPolicy hands out one buffer per history, so a single setting
+(passed as retention=... to ODALEngine, PromptGuard, PolicyEngine,
+AuditLogger or CostTracker) governs all of them.
+"""
+
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+# json.dumps(default=...) builds a new encoder per call; spills reuse one
+_json_encoder = json.JSONEncoder(default=str)
+
+DEFAULT_MAX_SPILL_BYTES = 64 * 1024 * 1024
+
+# Newest history items carried in a component's export_state()
+SNAPSHOT_HISTORY_TAIL = 1000
+
+
+def _default_encode(item: Any) -> Any:
+    return item.to_dict() if hasattr(item, "to_dict") else item
+
+
+class RetentionBuffer:
+    """
+    Bounded, list-like history.
+
+    Features:
+    - Size and age limits on the in-memory part
+    - Evicted items spill to a size-capped JSONL file (optional)
+    - Iteration / len() / indexing span spilled and in-memory items;
+      recent indexes and slices are served from memory
+    - Thread-safe appends
+    """
+
+    def __init__(
+        self,
+        max_items: Optional[int] = 10000,
+        max_age_seconds: Optional[float] = None,
+        spill_path: Optional[Path] = None,
+        encode: Optional[Callable[[Any], Any]] = None,
+        decode: Optional[Callable[[Any], Any]] = None,
+        max_spill_bytes: Optional[int] = DEFAULT_MAX_SPILL_BYTES
+    ):
+        """
+        Initialize Retention Buffer.
+
+        Args:
+            max_items: Items kept in memory (None = no count limit)
+            max_age_seconds: Items older than this are evicted (None = no age limit)
+            spill_path: JSONL file for evicted items (None = drop them)
+            encode: Item -> JSON-serialisable value (default: item.to_dict() if present)
+            decode: Inverse of encode, applied when reading spilled items
+                (default: items come back as decoded JSON)
+            max_spill_bytes: Spill file size cap; when exceeded, the oldest
+                spilled items are dropped until half of it is used
+                (None = no cap)
+        """
+        self.max_items = max_items
+        self.max_age_seconds = max_age_seconds
+        self.spill_path = Path(spill_path) if spill_path else None
+        self.encode = encode or _default_encode
+        self.decode = decode
+        self.max_spill_bytes = max_spill_bytes
+
+        self._items: deque = deque()
+        self._added: deque = deque()  # Monotonic insert times (only with an age limit)
+        self._lock = threading.RLock()
+        self._spill_file = None
+        self._spill_start = 0
+        self.spilled = 0
+        self.dropped = 0
+
+        if self.spill_path is not None:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            self._spill_file = open(self.spill_path, "ab")
+            # The file is append-only; this buffer only covers what it wrote itself
+            self._spill_start = self._spill_file.tell()
+
+    def append(self, item: Any):
+        with self._lock:
+            self._items.append(item)
+            if self.max_age_seconds is not None:
+                self._added.append(time.monotonic())
+            self._evict()
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def _evict(self):
+        overflow = len(self._items) - self.max_items if self.max_items is not None else 0
+        if self.max_age_seconds is not None:
+            cutoff = time.monotonic() - self.max_age_seconds
+            expired = 0
+            for added in self._added:
+                if added >= cutoff:
+                    break
+                expired += 1
+            overflow = max(overflow, expired)
+        if overflow <= 0:
+            return
+
+        evicted = [self._items.popleft() for _ in range(overflow)]
+        if self.max_age_seconds is not None:
+            for _ in range(overflow):
+                self._added.popleft()
+
+        if self._spill_file is None:
+            self.dropped += overflow
+            return
+        lines = [
+            (_json_encoder.encode(self.encode(item)) + "\n").encode("utf-8")
+            for item in evicted
+        ]
+        self._spill_file.write(b"".join(lines))
+        self.spilled += overflow
+        if self.max_spill_bytes is not None and self._spill_file.tell() - self._spill_start > self.max_spill_bytes:
+            self._compact_spill()
+
+    def _compact_spill(self):
+        """Keep the newest spilled items in at most half the cap (lock held)"""
+        self._spill_file.flush()
+        with open(self.spill_path, "rb") as f:
+            f.seek(max(self._spill_start, self._spill_file.tell() - self.max_spill_bytes // 2))
+            if f.tell() > self._spill_start:
+                f.readline()  # Skip to the next whole line
+            kept = f.read()
+        kept_items = kept.count(b"\n")
+        tmp_path = self.spill_path.with_name(self.spill_path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(kept)
+        # Open iterators keep reading the replaced file through their own handle
+        os.replace(tmp_path, self.spill_path)
+        self._spill_file.close()
+        self._spill_file = open(self.spill_path, "ab")
+        self._spill_start = 0
+        self.dropped += self.spilled - kept_items
+        self.spilled = kept_items
+
+    def _spill_cut(self):
+        """(open file, start, end) of the spilled items, or None (lock held)"""
+        if self._spill_file is None or not self.spilled:
+            return None
+        self._spill_file.flush()
+        return open(self.spill_path, "rb"), self._spill_start, self._spill_file.tell()
+
+    def _iter_spilled(self, cut) -> Iterator[Any]:
+        """Spilled items of a cut taken by _spill_cut()"""
+        if cut is None:
+            return
+        f, start, end = cut
+        with f:
+            f.seek(start)
+            while f.tell() < end:
+                line = f.readline()
+                if not line:
+                    break
+                value = json.loads(line)
+                yield self.decode(value) if self.decode is not None else value
+
+    def __iter__(self) -> Iterator[Any]:
+        """Oldest first: spilled items, then in-memory items"""
+        with self._lock:
+            self._evict()
+            # One consistent cut: items spilled while we iterate are already
+            # in the in-memory copy, so they must not be read from the file
+            # too; the file is opened now, so a compaction cannot move it
+            in_memory = list(self._items)
+            cut = self._spill_cut()
+        yield from self._iter_spilled(cut)
+        yield from in_memory
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._evict()
+            return self.spilled + len(self._items)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __getitem__(self, index):
+        with self._lock:
+            self._evict()
+            spilled = self.spilled
+            total = spilled + len(self._items)
+            if isinstance(index, slice):
+                start, stop, step = index.indices(total)
+                selected = range(start, stop, step)
+                if not selected or min(selected[0], selected[-1]) >= spilled:
+                    # Fast path: only recent items, all in memory
+                    items = list(self._items)
+                    return [items[i - spilled] for i in selected]
+                in_memory = list(self._items)
+                cut = self._spill_cut()
+            else:
+                if index < 0:
+                    index += total
+                if not 0 <= index < total:
+                    raise IndexError("RetentionBuffer index out of range")
+                if index >= spilled:
+                    return self._items[index - spilled]
+                cut = self._spill_cut()
+        if isinstance(index, int):
+            # Reads the spill file only up to the wanted item
+            spilled_items = self._iter_spilled(cut)
+            item = next(itertools.islice(spilled_items, index, None))
+            spilled_items.close()
+            return item
+        items = itertools.chain(self._iter_spilled(cut), in_memory)
+        if step > 0:
+            return list(itertools.islice(items, start, stop, step))
+        return list(items)[index]
+
+    def clear(self):
+        """Forget all items, truncating the spill file back to where this buffer started it"""
+        with self._lock:
+            self._items.clear()
+            self._added.clear()
+            if self._spill_file is not None:
+                self._spill_file.flush()
+                self._spill_file.truncate(self._spill_start)
+                self._spill_file.seek(self._spill_start)
+            self.spilled = 0
+            self.dropped = 0
+
+    def close(self):
+        with self._lock:
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
+
+    def get_statistics(self) -> Dict:
+        with self._lock:
+            self._evict()
+            return {
+                "in_memory": len(self._items),
+                "spilled": self.spilled,
+                "dropped": self.dropped,
+                "spill_path": str(self.spill_path) if self.spill_path else None
+            }
+
+    def __repr__(self) -> str:
+        return f"RetentionBuffer(in_memory={len(self._items)}, spilled={self.spilled}, dropped={self.dropped})"
+
+
+def export_history(
+    counters: Dict[str, Any],
+    key: str,
+    history,
+    encode: Optional[Callable[[Any], Any]] = None,
+    tail: int = SNAPSHOT_HISTORY_TAIL
+) -> Dict[str, Any]:
+    """
+    Snapshot state for a component: its counters plus the newest items of
+    its history (a list or RetentionBuffer) under key.
+
+    Snapshot size stays bounded however long the history grew, so older
+    items survive only in the counters; get_statistics() must read those
+    counters rather than scan the history.
+    """
+    items = history[-tail:]
+    state = dict(counters)
+    state[key] = [encode(item) for item in items] if encode is not None else list(items)
+    return state
+
+
+class RetentionPolicy:
+    """
+    Shared retention settings; creates one buffer per named history.
+
+    Features:
+    - Same size/age limits for every history it is given to
+    - Spill files named <spill_dir>/<history>-<pid>.jsonl (safe for
+      several processes sharing a directory)
+    """
+
+    def __init__(
+        self,
+        max_items: Optional[int] = 10000,
+        max_age_seconds: Optional[float] = None,
+        spill_dir: Optional[Path] = None,
+        max_spill_bytes: Optional[int] = DEFAULT_MAX_SPILL_BYTES
+    ):
+        """
+        Initialize Retention Policy.
+
+        Args:
+            max_items: In-memory items per history
+            max_age_seconds: Maximum in-memory age per item
+            spill_dir: Directory for spill files (None = evicted items are dropped)
+            max_spill_bytes: Spill file size cap per history (None = no cap)
+        """
+        self.max_items = max_items
+        self.max_age_seconds = max_age_seconds
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        self.max_spill_bytes = max_spill_bytes
+        self.buffers: Dict[str, RetentionBuffer] = {}
+
+    def buffer(
+        self,
+        name: str,
+        encode: Optional[Callable[[Any], Any]] = None,
+        decode: Optional[Callable[[Any], Any]] = None
+    ) -> RetentionBuffer:
+        """
+        Create the buffer for one history.
+
+        Args:
+            name: History name (spill file stem)
+            encode: See RetentionBuffer
+            decode: See RetentionBuffer
+
+        Returns:
+            New RetentionBuffer
+        """
+        spill_path = None
+        if self.spill_dir is not None:
+            spill_path = self.spill_dir / f"{name}-{os.getpid()}.jsonl"
+            if name in self.buffers:
+                spill_path = spill_path.with_name(f"{name}-{os.getpid()}-{len(self.buffers)}.jsonl")
+        buffer = RetentionBuffer(
+            self.max_items, self.max_age_seconds, spill_path, encode, decode, self.max_spill_bytes
+        )
+        self.buffers[name if name not in self.buffers else f"{name}#{len(self.buffers)}"] = buffer
+        return buffer
+
+    def get_statistics(self) -> Dict[str, Dict]:
+        return {name: buffer.get_statistics() for name, buffer in self.buffers.items()}
+
+    def close(self):
+        for buffer in self.buffers.values():
+            buffer.close()
@@ -0,0 +1,279 @@
+"""
+Fair Scheduler: Priority Classes and Weighted Fair Queueing for Cycles
+
+With first-come-first-served access to the engine's cycle slots, one
+team's batch job can fill every slot and queue ahead of an on-call
+engineer's incident request. FairScheduler hands out a fixed number of
+slots in weighted-fair order instead:
+
+- every request belongs to a flow: (priority class, tenant), where the
+  tenant is context["tenant_id"], else context["user_id"]
+- a flow's weight is its class weight (interactive 16, batch 4,
+  background 1 by default) times an optional tenant weight
+- start-time fair queueing: a request is tagged with
+  start = max(virtual time, previous finish of its flow) and
+  finish = start + cost / weight; the waiter with the smallest start tag
+  gets the next free slot, and virtual time advances to it
+
+A newly active flow starts at the current virtual time, so an incident
+request jumps ahead of a deep batch backlog, while a busy flow cannot
+exceed its weighted share. Waiters sit in a heap: O(log n) to queue and
+to dispatch. Sync callers block on an Event, asyncio callers await a
+future; both share the same slots.
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+try:
+    from .admission import PRIORITY_CLASSES, priority_of
+    from .stats import LatencyHistogram
+except ImportError:
+    # Fallback for direct execution
+    from admission import PRIORITY_CLASSES, priority_of
+    from stats import LatencyHistogram
+
+
+_PRUNE_EVERY = 1024
+
+
+def _grant(future: asyncio.Future):
+    if not future.done():
+        future.set_result(True)
+
+
+class _Waiter:
+    """A queued slot request"""
+
+    __slots__ = ("start", "seq", "priority", "enqueued", "event", "loop", "future", "granted", "cancelled")
+
+    def __init__(self, start: float, seq: int, priority: str):
+        self.start = start
+        self.seq = seq
+        self.priority = priority
+        self.enqueued = time.perf_counter()
+        self.event: Optional[threading.Event] = None
+        self.loop = None
+        self.future: Optional[asyncio.Future] = None
+        self.granted = False
+        self.cancelled = False
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.start, self.seq) < (other.start, other.seq)
+
+
+class FairScheduler:
+    """
+    Weighted fair, priority-aware gate in front of cycle execution.
+
+    Features:
+    - Fixed number of slots (cycles running at once)
+    - Priority classes and per-tenant flows with configurable weights
+    - O(log n) start-time fair queueing
+    - Thread and asyncio waiters with timeouts/cancellation
+    - Per-class queue depth, wait-time histograms and grant counts
+    """
+
+    def __init__(
+        self,
+        slots: int = 8,
+        class_weights: Optional[Dict[str, float]] = None,
+        tenant_weights: Optional[Dict[Hashable, float]] = None,
+        metrics=None
+    ):
+        """
+        Initialize Fair Scheduler.
+
+        Args:
+            slots: Cycles allowed to run at once
+            class_weights: Weight per priority class
+                (default: interactive 16, batch 4, background 1)
+            tenant_weights: Extra weight per tenant (default 1)
+            metrics: Metrics registry (see Core/Observability); None disables metrics
+        """
+        if slots < 1:
+            raise ValueError("slots must be >= 1")
+        weights = {"interactive": 16.0, "batch": 4.0, "background": 1.0}
+        weights.update(class_weights or {})
+        self.slots = slots
+        self.class_weights = weights
+        self.tenant_weights = dict(tenant_weights or {})
+
+        self._lock = threading.Lock()
+        self._heap = []
+        self._seq = itertools.count()
+        self._virtual_time = 0.0
+        self._finish: Dict[Tuple[str, Hashable], float] = {}
+        self.in_use = 0
+        self._depth = {priority: 0 for priority in PRIORITY_CLASSES}
+        self._waits = {priority: LatencyHistogram() for priority in PRIORITY_CLASSES}
+        self._granted = {priority: 0 for priority in PRIORITY_CLASSES}
+        self._abandoned = {priority: 0 for priority in PRIORITY_CLASSES}
+
+        self.metrics = metrics
+        if metrics is not None:
+            depth = metrics.gauge("odal_scheduler_queue_depth", "Requests waiting for a slot", ["priority"])
+            for priority in PRIORITY_CLASSES:
+                depth.labels(priority).set_function(
+                    lambda scheduler, p=priority: scheduler._depth[p], owner=self
+                )
+            wait = metrics.histogram(
+                "odal_scheduler_wait_seconds", "Time spent waiting for a slot", ["priority"]
+            )
+            self._m_wait = {priority: wait.labels(priority) for priority in PRIORITY_CLASSES}
+
+    @staticmethod
+    def tenant_of(context: Dict) -> Hashable:
+        tenant = context.get("tenant_id")
+        return tenant if tenant is not None else context.get("user_id")
+
+    # Scheduling (called with the lock held)
+
+    def _tag(self, priority: str, tenant: Hashable, cost: float) -> float:
+        """Start tag of a new request; advances its flow's finish tag"""
+        flow = (priority, tenant)
+        weight = self.class_weights[priority] * self.tenant_weights.get(tenant, 1.0)
+        start = max(self._virtual_time, self._finish.get(flow, 0.0))
+        self._finish[flow] = start + cost / weight
+        return start
+
+    def _record_grant(self, waiter: _Waiter):
+        waiter.granted = True
+        self._virtual_time = max(self._virtual_time, waiter.start)
+        self._granted[waiter.priority] += 1
+        waited = time.perf_counter() - waiter.enqueued
+        self._waits[waiter.priority].record(waited * 1000)
+        if self.metrics is not None:
+            self._m_wait[waiter.priority].observe(waited)
+        if self._granted[waiter.priority] % _PRUNE_EVERY == 0:
+            # Idle flows behind virtual time carry no state worth keeping
+            self._finish = {flow: f for flow, f in self._finish.items() if f > self._virtual_time}
+
+    def _enqueue(self, context: Dict, cost: float) -> _Waiter:
+        priority = priority_of(context)
+        waiter = _Waiter(self._tag(priority, self.tenant_of(context), cost), next(self._seq), priority)
+        # Live waiters exist only while every slot is taken (release hands slots over)
+        if self.in_use < self.slots:
+            self.in_use += 1
+            self._record_grant(waiter)
+        else:
+            heapq.heappush(self._heap, waiter)
+            self._depth[priority] += 1
+        return waiter
+
+    def _abandon(self, waiter: _Waiter) -> bool:
+        """Leave the queue after a timeout; False if a slot was granted meanwhile"""
+        with self._lock:
+            if waiter.granted:
+                return False
+            waiter.cancelled = True  # Removed lazily when it reaches the heap top
+            self._depth[waiter.priority] -= 1
+            self._abandoned[waiter.priority] += 1
+            return True
+
+    # Public API
+
+    def acquire(self, context: Dict, cost: float = 1.0, timeout: Optional[float] = None):
+        """
+        Wait for a slot in fair order.
+
+        Args:
+            context: Cycle context (priority, tenant_id / user_id)
+            cost: Relative cost of the request (e.g. expected duration)
+            timeout: Seconds to wait (None = as long as it takes)
+
+        Raises:
+            TimeoutError: No slot within timeout
+        """
+        with self._lock:
+            waiter = self._enqueue(context, cost)
+            if waiter.granted:
+                return
+            waiter.event = threading.Event()
+        if not waiter.event.wait(timeout) and self._abandon(waiter):
+            raise TimeoutError("Timed out waiting for a scheduler slot")
+
+    async def aacquire(self, context: Dict, cost: float = 1.0, timeout: Optional[float] = None):
+        """acquire() for the event loop"""
+        with self._lock:
+            waiter = self._enqueue(context, cost)
+            if waiter.granted:
+                return
+            waiter.loop = asyncio.get_running_loop()
+            waiter.future = waiter.loop.create_future()
+        try:
+            await asyncio.wait_for(waiter.future, timeout)
+        except BaseException:
+            if not self._abandon(waiter):
+                self.release()  # Granted while being cancelled: pass it on
+            raise
+
+    def release(self):
+        """Free a slot, handing it straight to the next waiter in fair order"""
+        with self._lock:
+            while self._heap:
+                waiter = heapq.heappop(self._heap)
+                if waiter.cancelled:
+                    continue
+                self._depth[waiter.priority] -= 1
+                self._record_grant(waiter)
+                break
+            else:
+                self.in_use -= 1
+                return
+        if waiter.event is not None:
+            waiter.event.set()
+        else:
+            waiter.loop.call_soon_threadsafe(_grant, waiter.future)
+
+    def slot(self, context: Dict, cost: float = 1.0, timeout: Optional[float] = None) -> "_Slot":
+        """Context manager: with scheduler.slot(context): ..."""
+        return _Slot(self, context, cost, timeout)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "slots": self.slots,
+                "in_use": self.in_use,
+                "virtual_time": self._virtual_time,
+                "active_flows": len(self._finish),
+                "classes": {
+                    priority: {
+                        "queue_depth": self._depth[priority],
+                        "granted": self._granted[priority],
+                        "abandoned": self._abandoned[priority],
+                        "wait_ms": self._waits[priority].summary()
+                    }
+                    for priority in PRIORITY_CLASSES
+                }
+            }
+
+
+class _Slot:
+    """Sync and async context manager around acquire/release"""
+
+    __slots__ = ("scheduler", "context", "cost", "timeout")
+
+    def __init__(self, scheduler: FairScheduler, context: Dict, cost: float, timeout: Optional[float]):
+        self.scheduler = scheduler
+        self.context = context
+        self.cost = cost
+        self.timeout = timeout
+
+    def __enter__(self):
+        self.scheduler.acquire(self.context, self.cost, self.timeout)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.scheduler.release()
+
+    async def __aenter__(self):
+        await self.scheduler.aacquire(self.context, self.cost, self.timeout)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.scheduler.release()
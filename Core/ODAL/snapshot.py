@@ -0,0 +1,203 @@
+"""
+Engine Snapshots: Warm Restart of O.D.A.L. State
+
+A restarted engine starts from zero: cycle IDs begin at 1 again,
+statistics are empty, the intent parser's caches are cold, admission
+token buckets are full and the guard/policy/cost counters behind
+get_statistics() are gone. ODALEngine.snapshot(path) writes that state
+to a single file; ODALEngine.restore(path) loads it back. Histories are
+snapshotted as counters plus a bounded tail of the newest entries, so
+snapshot size does not grow with uptime.
+
+File format (little-endian):
+
+    header   magic b"ODALSNAP" | format version u16 | section count u16 |
+             created f64
+    section  name length u16 | name (utf-8) | raw length u32 | crc32 u32 |
+             compressed length u32 | zlib(JSON)
+
+Each component contributes one section (its export_state()); sections a
+reader does not know are skipped, and a file from a newer format version
+is refused. Files are written to a temporary sibling, fsynced and renamed
+over the target, so a crash leaves the previous snapshot intact.
+
+PeriodicSnapshot writes snapshots from a background thread.
+"""
+
+import json
+import os
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+MAGIC = b"ODALSNAP"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sHHd")
+_NAME = struct.Struct("<H")
+_SECTION = struct.Struct("<III")
+
+
+def write_snapshot(path: Path, sections: Dict[str, Any], compress_level: int = 6) -> int:
+    """
+    Atomically write sections to a snapshot file.
+
+    Args:
+        path: Target file
+        sections: Section name -> JSON-serialisable state
+        compress_level: zlib level (1 = fastest, 9 = smallest)
+
+    Returns:
+        File size in bytes
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    parts = [_HEADER.pack(MAGIC, FORMAT_VERSION, len(sections), time.time())]
+    for name, state in sections.items():
+        raw = json.dumps(state, separators=(",", ":"), default=str).encode("utf-8")
+        compressed = zlib.compress(raw, compress_level)
+        encoded_name = name.encode("utf-8")
+        parts.append(_NAME.pack(len(encoded_name)))
+        parts.append(encoded_name)
+        parts.append(_SECTION.pack(len(raw), zlib.crc32(raw), len(compressed)))
+        parts.append(compressed)
+    data = b"".join(parts)
+
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    if hasattr(os, "O_DIRECTORY"):
+        # Persist the rename itself
+        dir_fd = os.open(str(path.parent), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    return len(data)
+
+
+def read_snapshot(path: Path) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Read and verify a snapshot file.
+
+    Args:
+        path: Snapshot file
+
+    Returns:
+        (header, sections): header has format_version and created (epoch seconds)
+
+    Raises:
+        ValueError: Not a snapshot, newer format version, or corrupt section
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < _HEADER.size:
+        raise ValueError(f"{path} is not an O.D.A.L. snapshot")
+    magic, version, count, created = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not an O.D.A.L. snapshot")
+    if version > FORMAT_VERSION:
+        raise ValueError(f"Snapshot format {version} is newer than supported ({FORMAT_VERSION})")
+
+    sections = {}
+    offset = _HEADER.size
+    try:
+        for _ in range(count):
+            (name_length,) = _NAME.unpack_from(data, offset)
+            offset += _NAME.size
+            name = data[offset:offset + name_length].decode("utf-8")
+            offset += name_length
+            raw_length, crc, compressed_length = _SECTION.unpack_from(data, offset)
+            offset += _SECTION.size
+            raw = zlib.decompress(data[offset:offset + compressed_length])
+            offset += compressed_length
+            if len(raw) != raw_length or zlib.crc32(raw) != crc:
+                raise ValueError(f"Snapshot section {name} is corrupt")
+            sections[name] = json.loads(raw)
+    except (struct.error, zlib.error) as e:
+        raise ValueError(f"Snapshot {path} is truncated or corrupt: {e}") from e
+
+    return {"format_version": version, "created": created}, sections
+
+
+class PeriodicSnapshot:
+    """
+    Background thread writing engine snapshots at a fixed interval.
+
+    Features:
+    - Atomic writes (see write_snapshot); readers never see a partial file
+    - Final snapshot on stop()
+    - Last duration, size and error kept for inspection
+    """
+
+    def __init__(self, engine, path: Path, interval_seconds: float = 60.0,
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        """
+        Initialize Periodic Snapshot.
+
+        Args:
+            engine: ODALEngine to snapshot
+            path: Snapshot file (overwritten each time)
+            interval_seconds: Seconds between snapshots
+            on_error: Called with the exception when a snapshot fails
+                (default: print and keep going)
+        """
+        self.engine = engine
+        self.path = Path(path)
+        self.interval_seconds = interval_seconds
+        self.on_error = on_error
+
+        self.snapshots = 0
+        self.last_duration_ms: Optional[float] = None
+        self.last_size: Optional[int] = None
+        self.last_error: Optional[Exception] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def snapshot_now(self):
+        start = time.perf_counter()
+        try:
+            self.last_size = self.engine.snapshot(self.path)["size"]
+        except Exception as e:
+            self.last_error = e
+            if self.on_error is not None:
+                self.on_error(e)
+            else:
+                print(f"[SNAPSHOT] Failed to write {self.path}: {e}")
+            return
+        self.last_duration_ms = (time.perf_counter() - start) * 1000
+        self.snapshots += 1
+
+    def _run(self):
+        while not self._stop.wait(self.interval_seconds):
+            self.snapshot_now()
+
+    def start(self) -> "PeriodicSnapshot":
+        if self._thread is not None:
+            raise RuntimeError("PeriodicSnapshot already started")
+        self._thread = threading.Thread(target=self._run, name="odal-snapshot", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, final: bool = True):
+        """Stop the thread; write one last snapshot unless final=False"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        if final:
+            self.snapshot_now()
@@ -0,0 +1,352 @@
+"""
+Sharded Statistics: Contention-Free Counters and Latency Histograms
+
+Each thread updates its own shard (plain dicts) without locking; readers
+merge all shards on demand. Updates never contend, reads cost
+O(live threads x metrics) and are independent of how many cycles ran:
+shards of threads that have exited are folded into one retired shard.
+
+Latencies go into fixed-memory log-linear histograms (HDR style): exact
+below 64us, then 32 sub-buckets per power of two (<= ~3% relative error),
+so p50/p95/p99 can be read at any time and histograms from different
+threads, workers or processes merge by adding bucket counts.
+"""
+
+import math
+import threading
+import weakref
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class LatencyHistogram:
+    """
+    Fixed-memory, mergeable latency histogram.
+
+    Features:
+    - Log-linear buckets over 1us .. ~19h (1,024 buckets)
+    - Exact count, sum, min and max
+    - Percentiles with bounded relative error
+    - Sparse dict snapshots for merging across processes
+    """
+
+    SUB_BUCKET_BITS = 5
+    SUB_BUCKETS = 1 << SUB_BUCKET_BITS  # 32
+    MAX_EXPONENT = 30
+    BUCKETS = 2 * SUB_BUCKETS + MAX_EXPONENT * SUB_BUCKETS
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        """Initialize Latency Histogram."""
+        self.counts = [0] * self.BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    @classmethod
+    def _index(cls, micros: int) -> int:
+        if micros < 2 * cls.SUB_BUCKETS:
+            return micros
+        exponent = micros.bit_length() - (cls.SUB_BUCKET_BITS + 1)
+        if exponent > cls.MAX_EXPONENT:
+            return cls.BUCKETS - 1
+        mantissa = micros >> exponent
+        return 2 * cls.SUB_BUCKETS + (exponent - 1) * cls.SUB_BUCKETS + (mantissa - cls.SUB_BUCKETS)
+
+    @classmethod
+    def _bucket_bounds(cls, index: int) -> Tuple[int, int]:
+        """Lower bound and width of a bucket in microseconds"""
+        if index < 2 * cls.SUB_BUCKETS:
+            return index, 1
+        exponent = (index - 2 * cls.SUB_BUCKETS) // cls.SUB_BUCKETS + 1
+        mantissa = (index - 2 * cls.SUB_BUCKETS) % cls.SUB_BUCKETS + cls.SUB_BUCKETS
+        return mantissa << exponent, 1 << exponent
+
+    def record(self, value_ms: float):
+        """
+        Record one latency.
+
+        Args:
+            value_ms: Latency in milliseconds
+        """
+        if value_ms < 0:
+            value_ms = 0.0
+        self.counts[self._index(int(value_ms * 1000))] += 1
+        self.count += 1
+        self.total += value_ms
+        if self.min is None or value_ms < self.min:
+            self.min = value_ms
+        if self.max is None or value_ms > self.max:
+            self.max = value_ms
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Add another histogram's observations into this one"""
+        counts = self.counts
+        for i, n in enumerate(other.counts):
+            if n:
+                counts[i] += n
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+        return self
+
+    def copy(self) -> "LatencyHistogram":
+        histogram = LatencyHistogram()
+        histogram.counts = list(self.counts)
+        histogram.count = self.count
+        histogram.total = self.total
+        histogram.min = self.min
+        histogram.max = self.max
+        return histogram
+
+    def percentile(self, p: float) -> float:
+        """
+        Estimate a percentile.
+
+        Args:
+            p: Percentile in [0, 100]
+
+        Returns:
+            Latency in milliseconds (0.0 if empty)
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(p / 100.0 * self.count))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            if not n:
+                continue
+            seen += n
+            if seen >= rank:
+                lower, width = self._bucket_bounds(index)
+                value = (lower + width / 2.0) / 1000.0
+                # Never report outside the observed range
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """Get count, mean and p50/p95/p99/max"""
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max
+        }
+
+    def to_dict(self) -> Dict:
+        """Sparse, JSON-serialisable snapshot"""
+        return {
+            "buckets": {str(i): n for i, n in enumerate(self.counts) if n},
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min,
+            "max": self.max
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LatencyHistogram":
+        histogram = cls()
+        for index, n in data.get("buckets", {}).items():
+            histogram.counts[int(index)] = n
+        histogram.count = data.get("count", 0)
+        histogram.total = data.get("sum", 0.0)
+        histogram.min = data.get("min")
+        histogram.max = data.get("max")
+        return histogram
+
+
+class _Shard:
+    __slots__ = ("counters", "histograms")
+
+    def __init__(self):
+        self.counters: Dict[str, float] = {}
+        self.histograms: Dict[str, LatencyHistogram] = {}
+
+
+class _ShardOwner:
+    """Held only by its thread's local storage, so it dies with the thread"""
+    __slots__ = ("__weakref__",)
+
+
+_SWEEP_MIN_SHARDS = 64
+
+
+class ShardedStats:
+    """
+    Per-thread counters and histograms merged on read.
+
+    Features:
+    - Lock-free updates (one shard per thread)
+    - Shards of finished threads are folded into a retired shard, so totals
+      never go backwards and memory follows the live thread count
+    - Snapshot merges all shards
+    """
+
+    def __init__(self):
+        """Initialize Sharded Stats."""
+        self._local = threading.local()
+        self._shards: List[Tuple[weakref.ref, _Shard]] = []
+        self._retired = _Shard()
+        self._sweep_at = _SWEEP_MIN_SHARDS
+        self._lock = threading.Lock()  # Only taken to register a new shard and on reads
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _Shard()
+            owner = _ShardOwner()
+            with self._lock:
+                self._shards.append((weakref.ref(owner), shard))
+                if len(self._shards) >= self._sweep_at:
+                    # Thread-per-request servers: retire exited threads without waiting for a read
+                    self._sweep()
+            self._local.shard = shard
+            self._local.owner = owner
+        return shard
+
+    def _sweep(self):
+        """Fold shards of exited threads into the retired shard (lock held)"""
+        live = [entry for entry in self._shards if entry[0]() is not None]
+        if len(live) < len(self._shards):
+            # Copy on write: readers may be merging the current retired shard
+            retired = _Shard()
+            retired.counters = dict(self._retired.counters)
+            retired.histograms = {name: h.copy() for name, h in self._retired.histograms.items()}
+            for owner, shard in self._shards:
+                if owner() is not None:
+                    continue
+                for name, value in shard.counters.items():
+                    retired.counters[name] = retired.counters.get(name, 0) + value
+                for name, histogram in shard.histograms.items():
+                    if name in retired.histograms:
+                        retired.histograms[name].merge(histogram)
+                    else:
+                        retired.histograms[name] = histogram.copy()
+            self._retired = retired
+            self._shards = live
+        self._sweep_at = max(_SWEEP_MIN_SHARDS, 2 * len(live))
+
+    def add(self, name: str, value: float = 1):
+        """
+        Add to a counter in the calling thread's shard.
+
+        Args:
+            name: Counter name
+            value: Amount to add
+        """
+        counters = self._shard().counters
+        counters[name] = counters.get(name, 0) + value
+
+    def observe(self, name: str, value_ms: float):
+        """
+        Record a latency in the calling thread's histogram.
+
+        Args:
+            name: Histogram name
+            value_ms: Latency in milliseconds
+        """
+        histograms = self._shard().histograms
+        histogram = histograms.get(name)
+        if histogram is None:
+            histogram = histograms[name] = LatencyHistogram()
+        histogram.record(value_ms)
+
+    def _all_shards(self) -> List[_Shard]:
+        with self._lock:
+            self._sweep()
+            return [self._retired] + [shard for _, shard in self._shards]
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Merge all counter shards.
+
+        Returns:
+            Counter name -> total across threads
+        """
+        merged: Dict[str, float] = {}
+        for shard in self._all_shards():
+            # dict.copy() is atomic with respect to the owning thread's updates
+            for name, value in shard.counters.copy().items():
+                merged[name] = merged.get(name, 0) + value
+        return merged
+
+    def histograms(self) -> Dict[str, LatencyHistogram]:
+        """
+        Merge all histogram shards.
+
+        Returns:
+            Histogram name -> merged histogram
+        """
+        merged: Dict[str, LatencyHistogram] = {}
+        for shard in self._all_shards():
+            for name, histogram in shard.histograms.copy().items():
+                if name in merged:
+                    merged[name].merge(histogram)
+                else:
+                    merged[name] = histogram.copy()
+        return merged
+
+    def load(self, data: Dict):
+        """
+        Replace all shards with a to_dict() snapshot (e.g. read back on restart).
+
+        Call before other threads record into these stats.
+        """
+        shard = _Shard()
+        shard.counters = dict(data.get("counters", {}))
+        shard.histograms = {
+            name: LatencyHistogram.from_dict(h) for name, h in data.get("histograms", {}).items()
+        }
+        with self._lock:
+            self._retired = shard
+            self._shards = []
+        self._local = threading.local()
+
+    def to_dict(self) -> Dict:
+        """Mergeable, JSON-serialisable snapshot of counters and histograms"""
+        return {
+            "counters": self.snapshot(),
+            "histograms": {name: h.to_dict() for name, h in self.histograms().items()}
+        }
+
+    def reset(self):
+        """Drop all shards"""
+        with self._lock:
+            self._retired = _Shard()
+            self._shards = []
+            self._local = threading.local()
+
+
+def merge_snapshots(snapshots: Iterable[Dict]) -> Dict:
+    """
+    Merge ShardedStats.to_dict() snapshots (e.g. from several workers).
+
+    Args:
+        snapshots: Snapshots to merge
+
+    Returns:
+        Merged snapshot in the same format
+    """
+    counters: Dict[str, float] = {}
+    histograms: Dict[str, LatencyHistogram] = {}
+    for snapshot in snapshots:
+        for name, value in snapshot.get("counters", {}).items():
+            counters[name] = counters.get(name, 0) + value
+        for name, data in snapshot.get("histograms", {}).items():
+            histogram = LatencyHistogram.from_dict(data)
+            if name in histograms:
+                histograms[name].merge(histogram)
+            else:
+                histograms[name] = histogram
+    return {
+        "counters": counters,
+        "histograms": {name: h.to_dict() for name, h in histograms.items()}
+    }
@@ -0,0 +1,24 @@
+"""
+Observability Package
+
+Metrics and tracing shared by the ODAL, security and LLM layers.
+"""
+
+from .metrics import MetricsRegistry, MetricsServer, Counter, Gauge, Histogram, get_registry
+from .tracing import Tracer, Span, JsonlSpanExporter, current_span, current_trace_id, propagate, load_spans
+
+__all__ = [
+    "MetricsRegistry",
+    "MetricsServer",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "get_registry",
+    "Tracer",
+    "Span",
+    "JsonlSpanExporter",
+    "current_span",
+    "current_trace_id",
+    "propagate",
+    "load_spans",
+]
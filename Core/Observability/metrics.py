@@ -0,0 +1,393 @@
+"""
+Metrics Registry: Counters, Gauges and Histograms in Prometheus Format
+
+A small in-process registry (stdlib only) shared by the ODAL, security and
+LLM layers. Components receive a registry through a `metrics=` argument and
+create their metric families from it; with no registry they skip all
+instrumentation. The registry renders the Prometheus text exposition format
+and can serve it from an optional http.server endpoint.
+"""
+
+import bisect
+import math
+import threading
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values)) + "}"
+
+
+class _CounterChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1):
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("value", "_function", "_sources", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+        # (weakref to owner, function(owner)) per registered instance
+        self._sources: List[Tuple[weakref.ref, Callable[[Any], float]]] = []
+        self._lock = threading.Lock()
+
+    def set(self, value: float):
+        self.value = value
+
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1):
+        with self._lock:
+            self.value -= amount
+
+    def set_function(self, function: Callable, owner: Any = None):
+        """
+        Compute the value at scrape time.
+
+        Without an owner, function() replaces any previous function. With
+        an owner, function(owner) is added to the instances already
+        registered and the gauge reads their sum; the owner is held weakly
+        (function must not close over it), so a collected instance drops out.
+        """
+        if owner is None:
+            self._function = function
+            return
+        with self._lock:
+            self._sources.append((weakref.ref(owner), function))
+
+    def get(self) -> float:
+        if self._sources:
+            with self._lock:
+                live = [(ref(), function) for ref, function in self._sources]
+                self._sources = [source for source, (owner, _) in zip(self._sources, live) if owner is not None]
+            total = sum(function(owner) for owner, function in live if owner is not None)
+            return total + (self._function() if self._function is not None else 0)
+        if self._function is not None:
+            return self._function()
+        return self.value
+
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum", "count", "_lock")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+
+class _Metric:
+    """Metric family: one child per label-value combination"""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._children[()] = self._new_child()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values, **kwargs):
+        """
+        Get the child for one label-value combination.
+
+        Children are cached; hot paths should keep the returned child.
+        """
+        if kwargs:
+            values = tuple(kwargs[name] for name in self.labelnames)
+        child = self._children.get(values)  # Fast path: already-string values
+        if child is not None:
+            return child
+        key = tuple(str(v) for v in values)
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _unlabeled(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels {self.labelnames}; use .labels()")
+        return self._children[()]
+
+    def _samples(self) -> List[Tuple[str, str, float]]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.type_name}"
+        ]
+        for suffix, labels, value in self._samples():
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter"""
+
+    type_name = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1):
+        self._unlabeled().inc(amount)
+
+    def _samples(self):
+        return [
+            ("_total" if not self.name.endswith("_total") else "", _format_labels(self.labelnames, key), child.value)
+            for key, child in list(self._children.items())
+        ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down (or be computed at scrape time)"""
+
+    type_name = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float):
+        self._unlabeled().set(value)
+
+    def inc(self, amount: float = 1):
+        self._unlabeled().inc(amount)
+
+    def dec(self, amount: float = 1):
+        self._unlabeled().dec(amount)
+
+    def set_function(self, function: Callable, owner: Any = None):
+        self._unlabeled().set_function(function, owner)
+
+    def _samples(self):
+        return [
+            ("", _format_labels(self.labelnames, key), child.get())
+            for key, child in list(self._children.items())
+        ]
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram (seconds by default)"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.bounds = tuple(sorted(float(b) for b in buckets if b != math.inf))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.bounds)
+
+    def observe(self, value: float):
+        self._unlabeled().observe(value)
+
+    def _samples(self):
+        samples = []
+        for key, child in list(self._children.items()):
+            with child._lock:
+                counts, total, count = list(child.counts), child.sum, child.count
+            cumulative = 0
+            for bound, n in zip(self.bounds + (math.inf,), counts):
+                cumulative += n
+                labels = _format_labels(self.labelnames + ("le",), key + (_format_value(bound),))
+                samples.append(("_bucket", labels, cumulative))
+            labels = _format_labels(self.labelnames, key)
+            samples.append(("_sum", labels, total))
+            samples.append(("_count", labels, count))
+        return samples
+
+
+class MetricsServer:
+    """Serves a registry's Prometheus text on GET /metrics"""
+
+    def __init__(self, registry: "MetricsRegistry", host: str = "127.0.0.1", port: int = 0):
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.url = f"http://{host}:{self.server.server_address[1]}/metrics"
+        self._thread = threading.Thread(target=self.server.serve_forever, name="metrics-http", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class MetricsRegistry:
+    """
+    In-process metrics registry.
+
+    Features:
+    - Counters, gauges and histograms with labels
+    - Get-or-create by name (components can share families)
+    - Prometheus text exposition
+    - Optional HTTP endpoint
+    """
+
+    def __init__(self):
+        """Initialize Metrics Registry."""
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, documentation, labelnames, **kwargs)
+                self._metrics[name] = metric
+            elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} already registered as {metric.type_name} {metric.labelnames}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter"""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge"""
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Get or create a histogram"""
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        """Render all metrics in Prometheus text format"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def get_sample_value(self, name: str, labels: Optional[Dict[str, str]] = None) -> Optional[float]:
+        """
+        Read one sample (as it would be scraped).
+
+        Args:
+            name: Sample name (e.g. "odal_cycles_total", "x_seconds_count")
+            labels: Label values of the sample
+
+        Returns:
+            Value or None if absent
+        """
+        labels = labels or {}
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            if not name.startswith(metric.name):
+                continue
+            for suffix, label_text, value in metric._samples():
+                if metric.name + suffix != name:
+                    continue
+                names = metric.labelnames + (("le",) if suffix == "_bucket" else ())
+                if set(labels) != set(names):
+                    continue
+                if label_text == _format_labels(names, tuple(labels[n] for n in names)):
+                    return value
+        return None
+
+    def start_http_server(self, port: int = 0, host: str = "127.0.0.1") -> MetricsServer:
+        """
+        Serve /metrics in a background thread.
+
+        Args:
+            port: TCP port (0 = pick a free port; see .url)
+            host: Bind address
+
+        Returns:
+            Running MetricsServer
+        """
+        return MetricsServer(self, host, port)
+
+
+_registry: Optional[MetricsRegistry] = None
+
+
+def get_registry() -> MetricsRegistry:
+    """Get the process-wide default registry"""
+    global _registry
+    if _registry is None:
+        _registry = MetricsRegistry()
+    return _registry
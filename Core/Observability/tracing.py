@@ -0,0 +1,414 @@
+"""
+Tracing: Span-Based Tracing with a Local JSONL Exporter
+
+Spans form a tree per trace (one trace per O.D.A.L. cycle by default). The
+active span is held in a contextvar, so nesting follows the code path in
+threads and asyncio tasks alike; use propagate() when handing work to a
+thread pool yourself. Finished spans are exported in batches, off the
+caller's thread, as OTLP/JSON lines (one ExportTraceServiceRequest per line,
+the shape written by the OpenTelemetry Collector file exporter) to a
+size-rotated file.
+"""
+
+import contextvars
+import functools
+import json
+import queue
+import random
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "sdm_current_span", default=None
+)
+
+# OTLP enums
+SPAN_KIND = {"internal": 1, "server": 2, "client": 3, "producer": 4, "consumer": 5}
+STATUS_CODE = {"unset": 0, "ok": 1, "error": 2}
+
+
+def current_span() -> Optional["Span"]:
+    """Get the active span of the calling context"""
+    return _current_span.get()
+
+
+def current_trace_id() -> Optional[str]:
+    """Get the active trace ID (None outside a trace)"""
+    span = _current_span.get()
+    return span.trace_id if span is not None else None
+
+
+def propagate(func: Callable) -> Callable:
+    """
+    Bind func to the caller's context (active span included).
+
+    Use when submitting work to threads or executors, which do not inherit
+    contextvars on their own.
+    """
+    context = contextvars.copy_context()
+    return functools.partial(context.run, func)
+
+
+def _attribute(key: str, value: Any) -> Dict:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class Span:
+    """One timed operation within a trace"""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_span_id", "kind", "attributes",
+        "events", "status", "status_message", "start_ns", "end_ns", "_tracer"
+    )
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        trace_id: str,
+        parent_span_id: Optional[str],
+        kind: str = "internal",
+        attributes: Optional[Dict[str, Any]] = None
+    ):
+        self._tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = "%016x" % random.getrandbits(64)
+        self.parent_span_id = parent_span_id
+        self.kind = kind
+        self.attributes = dict(attributes) if attributes else {}
+        self.events: List[Dict] = []
+        self.status = "unset"
+        self.status_message = ""
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        """Record a point-in-time event (e.g. a fallback)"""
+        self.events.append({"name": name, "time_ns": time.time_ns(), "attributes": attributes or {}})
+
+    def set_status(self, status: str, message: str = ""):
+        """Set status ("unset", "ok" or "error")"""
+        self.status = status
+        self.status_message = message
+
+    def record_exception(self, error: BaseException):
+        """Add an exception event and mark the span as failed"""
+        self.add_event("exception", {
+            "exception.type": type(error).__name__,
+            "exception.message": str(error)
+        })
+        self.set_status("error", str(error))
+
+    def end(self):
+        """Finish the span and hand it to the exporter (idempotent)"""
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        self._tracer._on_end(self)
+
+    def to_otlp(self) -> Dict:
+        """OTLP/JSON representation"""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": SPAN_KIND.get(self.kind, 1),
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": STATUS_CODE.get(self.status, 0)}
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        if self.events:
+            span["events"] = [
+                {
+                    "name": e["name"],
+                    "timeUnixNano": str(e["time_ns"]),
+                    "attributes": [_attribute(k, v) for k, v in e["attributes"].items()]
+                }
+                for e in self.events
+            ]
+        return span
+
+
+class Tracer:
+    """
+    Span factory bound to an exporter.
+
+    Features:
+    - New trace per root span; children join the active span's trace
+    - contextvars propagation (threads via propagate(), asyncio natively)
+    - Context-manager and manual (start/activate/end) APIs
+    """
+
+    def __init__(self, exporter=None, service_name: str = "sdm-agent"):
+        """
+        Initialize Tracer.
+
+        Args:
+            exporter: Receives finished spans via export(span); None keeps
+                them only in memory until dropped
+            service_name: service.name resource attribute
+        """
+        self.exporter = exporter
+        self.service_name = service_name
+
+    def start_span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        parent: Optional[Span] = None,
+        kind: str = "internal",
+        new_trace: bool = False
+    ) -> Span:
+        """
+        Start a span without activating it.
+
+        Args:
+            name: Span name
+            attributes: Initial attributes
+            parent: Parent span (default: the active span)
+            kind: internal, server, client, producer or consumer
+            new_trace: Start a new trace even if a span is active
+
+        Returns:
+            Started span (call end() when done)
+        """
+        if parent is None and not new_trace:
+            parent = _current_span.get()
+        if parent is None:
+            return Span(self, name, "%032x" % random.getrandbits(128), None, kind, attributes)
+        return Span(self, name, parent.trace_id, parent.span_id, kind, attributes)
+
+    @staticmethod
+    def activate(span: Optional[Span]) -> contextvars.Token:
+        """Make span the active span; returns a token for deactivate()"""
+        return _current_span.set(span)
+
+    @staticmethod
+    def deactivate(token: contextvars.Token):
+        """Restore the active span from before the matching activate()"""
+        _current_span.reset(token)
+
+    @staticmethod
+    def current_span() -> Optional[Span]:
+        return _current_span.get()
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: str = "internal"
+    ) -> Iterator[Span]:
+        """
+        Run a block inside a new active span.
+
+        Exceptions are recorded on the span and re-raised.
+        """
+        span = self.start_span(name, attributes, kind=kind)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    def _on_end(self, span: Span):
+        if self.exporter is not None:
+            self.exporter.export(span)
+
+    def flush(self):
+        if self.exporter is not None:
+            self.exporter.flush()
+
+    def shutdown(self):
+        if self.exporter is not None:
+            self.exporter.shutdown()
+
+
+_STOP = object()
+_FLUSH = object()
+
+
+class JsonlSpanExporter:
+    """
+    Batched, size-rotated OTLP/JSON file exporter.
+
+    Features:
+    - export() only enqueues; a writer thread serialises and writes
+    - One line per batch (up to batch_size spans or flush_interval seconds)
+    - Rotation: traces.jsonl -> traces.1.jsonl ... traces.<backup_count>.jsonl
+    - Bounded queue: spans are dropped (and counted) rather than blocking
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        service_name: str = "sdm-agent",
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+        batch_size: int = 512,
+        flush_interval: float = 1.0,
+        max_queue: int = 10000
+    ):
+        """
+        Initialize JSONL Span Exporter.
+
+        Args:
+            path: Output file (directory is created)
+            service_name: service.name resource attribute
+            max_bytes: Rotate before the file would exceed this size
+            backup_count: Rotated files to keep
+            batch_size: Max spans per written line
+            flush_interval: Max seconds a span waits before being written
+            max_queue: Spans buffered before new ones are dropped
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.resource = {"attributes": [_attribute("service.name", service_name)]}
+
+        self.exported = 0
+        self.dropped = 0
+        self.batches = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def export(self, span: Span):
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self):
+        while True:
+            batch, markers = [], []
+            deadline = None
+            while len(batch) < self.batch_size:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is _STOP or item is _FLUSH:
+                    markers.append(item)
+                    break
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            try:
+                if batch:
+                    self._write(batch)
+            except Exception as e:
+                print(f"[TRACE] Export error: {e}")
+            finally:
+                for _ in range(len(batch) + len(markers)):
+                    self._queue.task_done()
+
+            if _STOP in markers:
+                return
+
+    def _write(self, spans: List[Span]):
+        line = json.dumps({
+            "resourceSpans": [{
+                "resource": self.resource,
+                "scopeSpans": [{
+                    "scope": {"name": "sdm.odal"},
+                    "spans": [span.to_otlp() for span in spans]
+                }]
+            }]
+        }) + "\n"
+        data = line.encode("utf-8")
+
+        if self.path.exists() and self.path.stat().st_size + len(data) > self.max_bytes:
+            self._rotate()
+        with open(self.path, "ab") as f:
+            f.write(data)
+        self.exported += len(spans)
+        self.batches += 1
+
+    def _rotate(self):
+        if self.backup_count <= 0:
+            self.path.unlink()
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self._backup_path(index)
+            if source.exists():
+                source.replace(self._backup_path(index + 1))
+        self.path.replace(self._backup_path(1))
+
+    def _backup_path(self, index: int) -> Path:
+        return self.path.with_name(f"{self.path.stem}.{index}{self.path.suffix}")
+
+    def flush(self):
+        """Block until every span exported so far is written"""
+        if self._thread.is_alive():
+            self._queue.put(_FLUSH)
+            self._queue.join()
+
+    def shutdown(self):
+        """Write pending spans and stop the writer thread"""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def get_statistics(self) -> Dict:
+        return {
+            "exported": self.exported,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "queued": self._queue.qsize()
+        }
+
+
+def load_spans(path: Path) -> List[Dict]:
+    """
+    Read spans back from an exporter file.
+
+    Args:
+        path: JSONL file written by JsonlSpanExporter
+
+    Returns:
+        OTLP span dicts in file order
+    """
+    spans = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            for resource_spans in json.loads(line).get("resourceSpans", []):
+                for scope_spans in resource_spans.get("scopeSpans", []):
+                    spans.extend(scope_spans.get("spans", []))
+    return spans
@@ -0,0 +1,362 @@
+"""
+Anomaly Detector: Constant-Memory Streaming Detection on Audit Events
+
+Fed from AuditLogger.log_event, the detector tracks event rates in fixed
+time windows and compares them to Holt (level + trend) baselines:
+- Per event type: e.g. a prompt_injection spike or policy_violation burst
+- Per user: a count-min sketch estimates each user's count in the current
+  window and a small heavy-hitter table keeps the busiest users
+
+Memory is fixed by configuration (number of tracked event types, sketch
+size, heavy-hitter table size) and each event costs a few dict/array
+operations. The same detector can replay historical segments for tuning.
+"""
+
+import math
+from typing import Dict, List, Optional, Any, Iterator
+from pathlib import Path
+from datetime import datetime
+
+try:
+    from .segments import iter_merged_events
+except ImportError:
+    # Fallback for direct execution
+    from segments import iter_merged_events
+
+
+EPOCH = datetime(1970, 1, 1)
+
+# Gaps longer than this many windows reset the baseline trend instead of
+# replaying every empty window
+MAX_GAP_WINDOWS = 64
+
+
+def to_epoch_seconds(timestamp: datetime) -> float:
+    """Convert a naive UTC datetime to seconds since the epoch"""
+    return (timestamp - EPOCH).total_seconds()
+
+
+class RateBaseline:
+    """
+    Holt-style baseline of per-window event counts.
+
+    Level and trend are smoothed with alpha/beta; the variance of forecast
+    errors is tracked as an exponentially weighted average.
+    """
+
+    __slots__ = ("level", "trend", "variance", "windows_seen")
+
+    def __init__(self):
+        self.level = 0.0
+        self.trend = 0.0
+        self.variance = 0.0
+        self.windows_seen = 0
+
+    def forecast(self) -> float:
+        """Expected count for the next window"""
+        return max(self.level + self.trend, 0.0)
+
+    def sigma(self) -> float:
+        """Standard deviation of forecast errors (never below 1 event)"""
+        return max(math.sqrt(self.variance), 1.0)
+
+    def update(self, count: float, alpha: float, beta: float):
+        """Fold a completed window's count into the baseline"""
+        if self.windows_seen == 0:
+            self.level = count
+            self.trend = 0.0
+        else:
+            forecast = self.level + self.trend
+            error = count - forecast
+            previous_level = self.level
+            self.level = alpha * count + (1 - alpha) * forecast
+            self.trend = beta * (self.level - previous_level) + (1 - beta) * self.trend
+            self.variance = (1 - alpha) * (self.variance + alpha * error * error)
+        self.windows_seen += 1
+
+    def to_dict(self) -> Dict:
+        return {
+            "level": self.level,
+            "trend": self.trend,
+            "sigma": self.sigma(),
+            "windows_seen": self.windows_seen
+        }
+
+
+class CountMinSketch:
+    """Fixed-size frequency estimator (never underestimates)"""
+
+    def __init__(self, width: int = 1024, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        self.rows = [[0] * width for _ in range(depth)]
+
+    def add(self, key: str, count: int = 1) -> int:
+        """Add to a key and return its new estimated count"""
+        h = hash(key)
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        width = self.width
+        estimate = None
+        for i, row in enumerate(self.rows):
+            index = (h1 + i * h2) % width
+            row[index] += count
+            if estimate is None or row[index] < estimate:
+                estimate = row[index]
+        return estimate
+
+    def clear(self):
+        for row in self.rows:
+            for i in range(self.width):
+                row[i] = 0
+
+
+class AnomalyDetector:
+    """
+    Online rate anomaly detector for audit events.
+
+    Features:
+    - Per-event-type Holt baselines over fixed windows
+    - Per-user rates via count-min sketch with heavy-hitter tracking
+    - Fixed memory, O(1) work per event
+    - Replay over historical segments for tuning
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 60.0,
+        alpha: float = 0.3,
+        beta: float = 0.1,
+        threshold_sigma: float = 4.0,
+        min_count: int = 5,
+        warmup_windows: int = 3,
+        max_event_types: int = 64,
+        sketch_width: int = 1024,
+        sketch_depth: int = 4,
+        top_k: int = 10
+    ):
+        """
+        Initialize Anomaly Detector.
+
+        Args:
+            window_seconds: Rate window length
+            alpha: Level smoothing factor
+            beta: Trend smoothing factor
+            threshold_sigma: Deviations above forecast that count as anomalous
+            min_count: Minimum events in a window before alerting
+            warmup_windows: Windows of history required before alerting
+            max_event_types: Upper bound on tracked event types
+            sketch_width: Count-min sketch width
+            sketch_depth: Count-min sketch depth
+            top_k: Heavy hitters tracked per window
+        """
+        self.window_seconds = window_seconds
+        self.alpha = alpha
+        self.beta = beta
+        self.threshold_sigma = threshold_sigma
+        self.min_count = min_count
+        self.warmup_windows = warmup_windows
+        self.max_event_types = max_event_types
+        self.top_k = top_k
+
+        self.window_index: Optional[int] = None
+        self.type_baselines: Dict[str, RateBaseline] = {}
+        self.type_counts: Dict[str, int] = {}
+        self.type_alerted = set()
+
+        self.user_sketch = CountMinSketch(sketch_width, sketch_depth)
+        self.user_baseline = RateBaseline()
+        self.heavy_hitters: Dict[str, int] = {}
+        self.last_heavy_hitters: Dict[str, int] = {}
+        self.user_alerted = set()
+
+        self.windows_closed = 0
+        self.events_observed = 0
+        self.anomalies_detected = 0
+
+    def reset(self):
+        """Clear all learned state"""
+        self.__init__(
+            self.window_seconds, self.alpha, self.beta, self.threshold_sigma,
+            self.min_count, self.warmup_windows, self.max_event_types,
+            self.user_sketch.width, self.user_sketch.depth, self.top_k
+        )
+
+    @staticmethod
+    def _user_of(event: Dict) -> Optional[str]:
+        """Extract the acting user from an event, if recorded"""
+        metadata = event.get("metadata") or {}
+        user = metadata.get("user_id")
+        if user is None:
+            context = metadata.get("context") or (metadata.get("observation") or {}).get("context") or {}
+            user = context.get("user_id")
+        return user
+
+    def observe(self, event: Dict, now: Optional[float] = None) -> List[Dict]:
+        """
+        Observe one audit event.
+
+        Args:
+            event: Audit event dict
+            now: Event time in epoch seconds (parsed from the event if omitted)
+
+        Returns:
+            List of anomalies raised by this event (usually empty)
+        """
+        if now is None:
+            now = to_epoch_seconds(datetime.fromisoformat(event["timestamp"]))
+
+        window = int(now // self.window_seconds)
+        if self.window_index is None or window > self.window_index:
+            self._roll(window)
+
+        self.events_observed += 1
+        anomalies = []
+
+        # Per-event-type rate
+        event_type = event.get("event_type", "unknown")
+        count = self.type_counts.get(event_type)
+        if count is not None or self._can_track(event_type):
+            count = (count or 0) + 1
+            self.type_counts[event_type] = count
+
+            if count >= self.min_count and event_type not in self.type_alerted:
+                baseline = self.type_baselines.get(event_type)
+                if baseline is not None:
+                    ready = baseline.windows_seen >= self.warmup_windows
+                    expected, sigma = baseline.forecast(), baseline.sigma()
+                else:
+                    # Never seen before: every earlier window had zero events
+                    ready = self.windows_closed >= self.warmup_windows
+                    expected, sigma = 0.0, 1.0
+                threshold = expected + self.threshold_sigma * sigma
+                if ready and count > threshold:
+                    self.type_alerted.add(event_type)
+                    anomalies.append(self._anomaly("event_rate", event_type, count, expected, threshold))
+
+        # Per-user rate
+        user = self._user_of(event)
+        if user is not None:
+            estimate = self.user_sketch.add(str(user))
+            self._track_heavy_hitter(str(user), estimate)
+
+            if (
+                estimate >= self.min_count
+                and user not in self.user_alerted
+                and self.user_baseline.windows_seen >= self.warmup_windows
+            ):
+                expected = self.user_baseline.forecast()
+                threshold = expected + self.threshold_sigma * self.user_baseline.sigma()
+                if estimate > threshold:
+                    self.user_alerted.add(user)
+                    anomalies.append(self._anomaly("user_rate", user, estimate, expected, threshold))
+
+        self.anomalies_detected += len(anomalies)
+        return anomalies
+
+    def _can_track(self, event_type: str) -> bool:
+        """Whether a new event type fits within max_event_types"""
+        if event_type in self.type_baselines:
+            return True
+        untracked = sum(1 for t in self.type_counts if t not in self.type_baselines)
+        return len(self.type_baselines) + untracked < self.max_event_types
+
+    def _track_heavy_hitter(self, user: str, estimate: int):
+        """Keep the top-k users of the current window"""
+        hitters = self.heavy_hitters
+        if user in hitters or len(hitters) < self.top_k:
+            hitters[user] = estimate
+            return
+        smallest = min(hitters, key=hitters.get)
+        if estimate > hitters[smallest]:
+            del hitters[smallest]
+            hitters[user] = estimate
+
+    def _roll(self, window: int):
+        """Close the current window and fold its counts into the baselines"""
+        if self.window_index is not None:
+            gap = window - self.window_index
+            self._close_window()
+            # Empty windows between events still count as observations
+            for _ in range(min(gap - 1, MAX_GAP_WINDOWS)):
+                for baseline in self.type_baselines.values():
+                    baseline.update(0, self.alpha, self.beta)
+                self.user_baseline.update(0, self.alpha, self.beta)
+                self.windows_closed += 1
+            if gap - 1 > MAX_GAP_WINDOWS:
+                for baseline in self.type_baselines.values():
+                    baseline.trend = 0.0
+                self.user_baseline.trend = 0.0
+
+        self.window_index = window
+        self.type_counts = {}
+        self.type_alerted = set()
+        self.user_sketch.clear()
+        self.last_heavy_hitters = self.heavy_hitters
+        self.heavy_hitters = {}
+        self.user_alerted = set()
+
+    def _close_window(self):
+        for event_type, baseline in self.type_baselines.items():
+            baseline.update(self.type_counts.get(event_type, 0), self.alpha, self.beta)
+        for event_type, count in self.type_counts.items():
+            if event_type not in self.type_baselines:
+                # Earlier windows had zero events of this type
+                baseline = RateBaseline()
+                baseline.windows_seen = self.windows_closed
+                baseline.update(count, self.alpha, self.beta)
+                self.type_baselines[event_type] = baseline
+
+        busiest = max(self.heavy_hitters.values(), default=0)
+        self.user_baseline.update(busiest, self.alpha, self.beta)
+        self.windows_closed += 1
+
+    def _anomaly(self, kind: str, key: str, observed: int, expected: float, threshold: float) -> Dict[str, Any]:
+        window_start = datetime.utcfromtimestamp(self.window_index * self.window_seconds)
+        label = "event" if kind == "event_rate" else "user"
+        return {
+            "kind": kind,
+            "key": key,
+            "window_start": window_start.isoformat(),
+            "window_seconds": self.window_seconds,
+            "observed": observed,
+            "expected": round(expected, 3),
+            "threshold": round(threshold, 3),
+            "description": (
+                f"Anomalous {label} rate for {key}: {observed} in {self.window_seconds:g}s "
+                f"(expected {expected:.1f})"
+            )
+        }
+
+    def replay(
+        self,
+        log_dir: Path,
+        start_date=None,
+        end_date=None
+    ) -> Iterator[Dict]:
+        """
+        Replay historical audit segments through the detector.
+
+        Args:
+            log_dir: Audit log directory
+            start_date: First day (inclusive)
+            end_date: Last day (inclusive)
+
+        Yields:
+            Anomalies in the order they would have been raised
+        """
+        for event in iter_merged_events(log_dir, start_date, end_date):
+            if event.get("event_type") in ("anomaly", "sampling_summary"):
+                continue
+            for anomaly in self.observe(event):
+                yield anomaly
+
+    def get_statistics(self) -> Dict:
+        """Get detector statistics"""
+        return {
+            "events_observed": self.events_observed,
+            "anomalies_detected": self.anomalies_detected,
+            "event_type_baselines": {k: b.to_dict() for k, b in self.type_baselines.items()},
+            "user_baseline": self.user_baseline.to_dict(),
+            "heavy_hitters": dict(self.heavy_hitters or self.last_heavy_hitters)
+        }
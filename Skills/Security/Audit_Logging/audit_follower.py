@@ -0,0 +1,385 @@
+"""
+Audit Follower: Incremental `tail -f` over Audit Segments
+
+Lets dashboards, anomaly tooling and the shipper consume new audit events
+without re-reading whole JSONL files. Each consumer has its own cursor (a
+byte offset per segment) persisted as JSON, so resuming costs only the
+new data. New segments (daily rotation, new writer processes) are picked
+up automatically and truncated segments are re-read from the start.
+
+Waiting for new data uses inotify on Linux when available and adaptive
+polling (backing off while idle) otherwise. Tailing cost follows new data,
+not the number of segments ever written: the directory is listed only on
+start, when inotify reports a new segment, or after a poll timeout; in
+between only segments reported as modified are read.
+"""
+
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import sys
+import time
+from typing import Dict, List, Optional, Iterator, Set, Tuple
+from pathlib import Path
+
+try:
+    from .segments import list_segments, parse_segment_name
+except ImportError:
+    # Fallback for direct execution
+    from segments import list_segments, parse_segment_name
+
+
+class _Inotify:
+    """Minimal inotify watch on one directory (Linux only)"""
+
+    IN_MODIFY = 0x00000002
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_Q_OVERFLOW = 0x00004000
+
+    _EVENT = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+    def __init__(self, directory: Path):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = self.IN_MODIFY | self.IN_CREATE | self.IN_MOVED_TO
+        if libc.inotify_add_watch(self.fd, str(directory).encode(), mask) < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+
+    def wait(self, timeout: float) -> bool:
+        """Block until an event is queued or the timeout expires"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        return bool(ready)
+
+    def read_events(self) -> List[Tuple[int, str]]:
+        """Drain queued events without blocking, as (mask, file name)"""
+        events = []
+        try:
+            while True:
+                data = os.read(self.fd, 65536)
+                if not data:
+                    break
+                pos = 0
+                while pos < len(data):
+                    _, mask, _, length = self._EVENT.unpack_from(data, pos)
+                    pos += self._EVENT.size
+                    name = data[pos:pos + length].rstrip(b"\0").decode(errors="replace")
+                    pos += length
+                    events.append((mask, name))
+        except BlockingIOError:
+            pass
+        return events
+
+    def close(self):
+        os.close(self.fd)
+
+
+class AuditFollower:
+    """
+    Incremental reader of an audit log directory.
+
+    Features:
+    - Persisted per-segment byte offsets, one cursor per consumer
+    - Rotation and truncation handling
+    - inotify wake-ups with adaptive polling fallback
+    - Read positions separate from committed positions (at-least-once)
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        consumer_id: str = "default",
+        cursor_path: Optional[Path] = None,
+        start_at_end: bool = False,
+        auto_commit: bool = True,
+        min_poll_interval: float = 0.05,
+        max_poll_interval: float = 2.0,
+        use_inotify: bool = True
+    ):
+        """
+        Initialize Audit Follower.
+
+        Args:
+            log_dir: Audit log directory to follow
+            consumer_id: Independent cursor name for this consumer
+            cursor_path: Cursor file (default: log_dir/.cursors/<consumer_id>.json)
+            start_at_end: With no saved cursor, skip existing data
+            auto_commit: Persist the cursor after every poll()
+            min_poll_interval: First idle wait when polling
+            max_poll_interval: Longest idle wait when polling
+            use_inotify: Use inotify wake-ups when available
+        """
+        self.log_dir = Path(log_dir)
+        self.consumer_id = consumer_id
+        self.cursor_path = Path(cursor_path) if cursor_path else self.log_dir / ".cursors" / f"{consumer_id}.json"
+        self.auto_commit = auto_commit
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self._poll_interval = min_poll_interval
+
+        self.committed: Dict[str, int] = self._load_cursor()
+        if not self.committed and start_at_end and not self.cursor_path.exists():
+            self.committed = {s.name: s.stat().st_size for s in list_segments(self.log_dir)}
+        self.positions: Dict[str, int] = dict(self.committed)
+
+        # Known segments in list_segments() order, their last seen sizes,
+        # and the ones that may hold unread data
+        self._segments: List[Path] = []
+        self._sizes: Dict[str, int] = {}
+        self._pending: Set[str] = set()
+        self._needs_scan = True
+
+        self._inotify = None
+        if use_inotify and sys.platform.startswith("linux"):
+            try:
+                self._inotify = _Inotify(self.log_dir)
+            except (OSError, AttributeError):
+                self._inotify = None
+
+    def _load_cursor(self) -> Dict[str, int]:
+        try:
+            with open(self.cursor_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get("offsets", {})
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cursor(self):
+        self.cursor_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cursor_path.with_name(self.cursor_path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"offsets": self.committed}, f)
+        os.replace(tmp_path, self.cursor_path)
+
+    def _scan(self):
+        """List the directory and mark every segment with unread data"""
+        self._needs_scan = False
+        self._segments = list_segments(self.log_dir)
+        names = {segment.name for segment in self._segments}
+        for name in [n for n in self.positions if n not in names]:
+            # Segment removed (e.g. by retention)
+            del self.positions[name]
+            self.committed.pop(name, None)
+        self._sizes = {name: size for name, size in self._sizes.items() if name in names}
+        self._pending = set()
+        for segment in self._segments:
+            try:
+                self._sizes[segment.name] = segment.stat().st_size
+            except OSError:
+                continue
+            if self._sizes[segment.name] != self.positions.get(segment.name, 0):
+                self._pending.add(segment.name)
+
+    def _apply_events(self, events: List[Tuple[int, str]]):
+        """Mark modified segments; a new segment or lost events force a rescan"""
+        for mask, name in events:
+            if mask & _Inotify.IN_Q_OVERFLOW:
+                self._needs_scan = True
+            elif parse_segment_name(name) is None:
+                continue
+            elif mask & (_Inotify.IN_CREATE | _Inotify.IN_MOVED_TO) or name not in self._sizes:
+                self._needs_scan = True
+            else:
+                self._pending.add(name)
+
+    def read_batch(self, max_records: int = 500, max_bytes: int = 1024 * 1024) -> Optional[Dict]:
+        """
+        Read the next batch of complete records from one segment.
+
+        Advances the read position but not the committed cursor. Only
+        segments with unread data are touched (see the module docstring).
+
+        Returns:
+            {"segment": name, "offset": start, "end": end, "records": [line bytes]}
+            or None if there is no new data
+        """
+        if self._inotify is not None:
+            self._apply_events(self._inotify.read_events())
+        if self._needs_scan:
+            self._scan()
+
+        for segment in [s for s in self._segments if s.name in self._pending]:
+            offset = self.positions.get(segment.name, 0)
+            try:
+                size = self._sizes[segment.name] = segment.stat().st_size
+            except OSError:
+                self._needs_scan = True  # Removed; forget it on the next scan
+                self._pending.discard(segment.name)
+                continue
+            if size < offset:
+                offset = 0  # Truncated or replaced
+            if size == offset:
+                self._pending.discard(segment.name)
+                continue
+
+            records = []
+            end = offset
+            with open(segment, 'rb') as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break  # Record still being written
+                    records.append(line)
+                    end += len(line)
+                    if len(records) >= max_records or end - offset >= max_bytes:
+                        break
+            if not records:
+                # Only a partial record; its completing write is a new modification
+                self._pending.discard(segment.name)
+                continue
+
+            self.positions[segment.name] = end
+            if end == size:
+                self._pending.discard(segment.name)
+            return {"segment": segment.name, "offset": offset, "end": end, "records": records}
+
+        if self._inotify is None:
+            # Nothing tells a polling follower what changed; list again next time
+            self._needs_scan = True
+        return None
+
+    def poll(self, max_records: int = 1000) -> List[Dict]:
+        """
+        Return new events since the last poll (without blocking).
+
+        Args:
+            max_records: Upper bound on events returned
+
+        Returns:
+            Parsed events in per-segment file order
+        """
+        events = []
+        while len(events) < max_records:
+            batch = self.read_batch(max_records - len(events))
+            if batch is None:
+                break
+            for line in batch["records"]:
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    continue
+
+        if events and self.auto_commit:
+            self.commit()
+        return events
+
+    def commit(self, segment: Optional[str] = None, offset: Optional[int] = None):
+        """
+        Persist the cursor.
+
+        Args:
+            segment: Commit only this segment (default: all read positions)
+            offset: Offset to commit for that segment (default: its read position)
+        """
+        if segment is None:
+            self.committed = dict(self.positions)
+        else:
+            self.committed[segment] = offset if offset is not None else self.positions[segment]
+        self._save_cursor()
+
+    def rewind(self):
+        """Move read positions back to the committed cursor"""
+        self.positions = dict(self.committed)
+        # Rewound segments hold unread data again
+        self._pending.update(name for name, size in self._sizes.items() if size != self.positions.get(name, 0))
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for new data.
+
+        Uses inotify when available; otherwise sleeps for an adaptive
+        interval that doubles while idle.
+
+        Returns:
+            True if woken by a change notification
+        """
+        if self._inotify is not None:
+            woken = self._inotify.wait(self.max_poll_interval if timeout is None else timeout)
+            if woken:
+                self._apply_events(self._inotify.read_events())
+            else:
+                self._needs_scan = True  # Poll timeout: list the directory again
+            return woken
+
+        interval = self._poll_interval if timeout is None else min(self._poll_interval, timeout)
+        time.sleep(interval)
+        self._poll_interval = min(self._poll_interval * 2, self.max_poll_interval)
+        return False
+
+    def follow(self, timeout: Optional[float] = None) -> Iterator[Dict]:
+        """
+        Yield events as they are appended.
+
+        Args:
+            timeout: Stop after this many seconds without new events (None = forever)
+        """
+        idle_since = time.monotonic()
+        while True:
+            events = self.poll()
+            if events:
+                self._poll_interval = self.min_poll_interval
+                idle_since = time.monotonic()
+                yield from events
+                continue
+
+            if timeout is not None:
+                remaining = timeout - (time.monotonic() - idle_since)
+                if remaining <= 0:
+                    return
+                self.wait(min(remaining, self.max_poll_interval))
+            else:
+                self.wait()
+
+    def close(self):
+        """Release the inotify watch"""
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def get_statistics(self) -> Dict:
+        """Get cursor statistics (lag as of the sizes last seen by read_batch)"""
+        if self._needs_scan:
+            self._scan()
+        lag = sum(max(size - self.committed.get(name, 0), 0) for name, size in self._sizes.items())
+        return {
+            "consumer_id": self.consumer_id,
+            "segments_tracked": len(self.committed),
+            "lag_bytes": lag,
+            "inotify": self._inotify is not None
+        }
+
+
+# Example usage
+if __name__ == "__main__":
+    import tempfile
+    import threading
+
+    try:
+        from .audit_logger import AuditLogger, EventType
+    except ImportError:
+        from audit_logger import AuditLogger, EventType
+
+    log_dir = Path(tempfile.mkdtemp())
+    logger = AuditLogger(log_dir)
+    for i in range(100):
+        logger.log_event(EventType.DECISION_MADE, f"Backlog {i}", {"i": i})
+
+    follower = AuditFollower(log_dir, consumer_id="dashboard")
+    print(f"Caught up on {len(follower.poll())} existing events")
+
+    def produce():
+        for i in range(5):
+            time.sleep(0.2)
+            logger.log_event(EventType.ACTION_EXECUTED, f"Live {i}", {"i": i})
+
+    threading.Thread(target=produce).start()
+    for event in follower.follow(timeout=1.0):
+        print(f"[FOLLOW] {event['timestamp']} {event['description']}")
+
+    print(f"Follower stats: {follower.get_statistics()}")
+    follower.close()
@@ -5,12 +5,31 @@ Records all security-relevant events for compliance and forensics.
 Integrates with O.D.A.L. Log phase.
 """
 
+import atexit
 import json
-from typing import Dict, List, Optional, Any
+import os
+import queue
+import re
+import socket
+import threading
+import time
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 from datetime import datetime
 from enum import Enum
 
+try:
+    from .audit_report import AuditReportEngine, ReportAggregate, render_markdown
+    from .sampling import AuditSampler
+    from .anomaly_detector import AnomalyDetector, to_epoch_seconds
+    from .integrity import SegmentSealer
+except ImportError:
+    # Fallback for direct execution
+    from audit_report import AuditReportEngine, ReportAggregate, render_markdown
+    from sampling import AuditSampler
+    from anomaly_detector import AnomalyDetector, to_epoch_seconds
+    from integrity import SegmentSealer
+
 
 class EventType(Enum):
     """Types of security events"""
@@ -21,6 +40,64 @@ class EventType(Enum):
     HIGH_COST_ACTION = "high_cost_action"
     DECISION_MADE = "decision_made"
     ACTION_EXECUTED = "action_executed"
+    ANOMALY = "anomaly"
+    SAMPLING_SUMMARY = "sampling_summary"
+
+
+_STOP = object()
+
+# Loggers with a background writer, flushed and sealed at interpreter exit
+_open_loggers = set()
+
+
+@atexit.register
+def _close_open_loggers():
+    for audit_logger in list(_open_loggers):
+        audit_logger.close()
+
+
+class _BackgroundWriter:
+    """Writer thread that drains queued events in batches"""
+    
+    def __init__(self, write_batch, max_batch: int = 512):
+        self.write_batch = write_batch
+        self.max_batch = max_batch
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self.thread.start()
+    
+    def submit(self, event: Dict):
+        self.queue.put(event)
+    
+    def _run(self):
+        while True:
+            batch = [self.queue.get()]
+            try:
+                while len(batch) < self.max_batch:
+                    batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                pass
+            
+            events = [e for e in batch if e is not _STOP]
+            try:
+                if events:
+                    self.write_batch(events)
+            except Exception as e:
+                print(f"[AUDIT] Writer error: {e}")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+            
+            if len(events) != len(batch):
+                return
+    
+    def flush(self):
+        """Block until every submitted event is written"""
+        self.queue.join()
+    
+    def stop(self):
+        self.queue.put(_STOP)
+        self.thread.join()
 
 
 class AuditLogger:
@@ -34,22 +111,100 @@ class AuditLogger:
     - Anomaly detection
     """
     
-    def __init__(self, log_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        log_dir: Optional[Path] = None,
+        anomaly_detector: Optional[AnomalyDetector] = None,
+        multi_writer: bool = False,
+        writer_id: Optional[str] = None,
+        background_writer: bool = False,
+        seal: bool = False,
+        sampler: Optional[AuditSampler] = None,
+        metrics=None,
+        tracer=None,
+        retention=None
+    ):
         """
         Initialize Audit Logger.
         
         Args:
             log_dir: Directory to store audit logs
+            anomaly_detector: Online detector fed with every logged event
+            multi_writer: Write a per-process segment with sequence numbers,
+                for several processes sharing one log directory
+            writer_id: Segment writer ID (default: <hostname>-<pid>)
+            background_writer: Write events on a background thread in batches
+            seal: Maintain Merkle index/seal sidecars for tamper evidence
+                (implies background_writer; see integrity.py)
+            sampler: Sampling policy for high-volume events; dropped events
+                are still counted in statistics and reports
+            metrics: Metrics registry (counter/gauge/histogram factory);
+                None disables metrics
+            tracer: Tracer (current_span() provider); when set, events logged
+                inside a span carry its trace_id and span_id
+            retention: Retention policy (buffer factory, see Core/ODAL/retention.py)
+                bounding the in-memory events searched by search_events();
+                None keeps every event in memory
         """
         self.log_dir = log_dir or Path(__file__).parent / "logs"
         self.log_dir.mkdir(parents=True, exist_ok=True)
         
+        self.multi_writer = multi_writer
+        self._fixed_writer_id = writer_id
+        self.seal = seal
+        self.background_writer = background_writer or seal
+        self._init_writer()
+        
         self.current_log_file = self._get_log_file()
-        self.events = []
+        self.events = retention.buffer("audit_events") if retention is not None else []
+        self.anomaly_detector = anomaly_detector
+        self.sampler = sampler
+        
+        # Exact totals over every event, including sampled-out ones
+        self.totals = ReportAggregate()
+        
+        self.tracer = tracer
+        self.metrics = metrics
+        if metrics is not None:
+            self._m_events = metrics.counter(
+                "audit_events_total", "Audit events logged (before sampling)", ["event_type", "severity"]
+            )
+            self._m_write_duration = metrics.histogram(
+                "audit_write_seconds", "Time per audit segment write"
+            )
+            self._m_bytes = metrics.counter("audit_bytes_written_total", "Bytes appended to audit segments")
+            self._m_records = metrics.counter("audit_records_written_total", "Records appended to audit segments")
+            metrics.gauge(
+                "audit_writer_queue_depth", "Events waiting for the background writer"
+            ).set_function(
+                lambda logger: logger._writer.queue.qsize() if logger._writer is not None else 0,
+                owner=self
+            )
+    
+    def _init_writer(self):
+        """Reset writer identity and file handle (also used after fork)"""
+        self._writer_pid = os.getpid()
+        self.writer_id = self._fixed_writer_id or re.sub(
+            r"[^A-Za-z0-9_-]", "_", f"{socket.gethostname()}-{self._writer_pid}"
+        )
+        self._seq = 0
+        self._last_timestamp = datetime.min
+        self._file = None
+        self._file_day = None
+        self._file_size = 0
+        self._sealer = SegmentSealer(self.log_dir) if self.seal else None
+        # Guards totals, sampler, sequence numbers and direct writes across threads
+        self._lock = threading.Lock()
+        self._writer = None
+        if self.background_writer:
+            self._writer = _BackgroundWriter(self._write_batch)
+            _open_loggers.add(self)
     
-    def _get_log_file(self) -> Path:
-        """Get current log file path (daily rotation)"""
-        date_str = datetime.utcnow().strftime("%Y-%m-%d")
+    def _get_log_file(self, date_str: Optional[str] = None) -> Path:
+        """Get log file path (daily rotation, one segment per writer in multi-writer mode)"""
+        date_str = date_str or datetime.utcnow().strftime("%Y-%m-%d")
+        if self.multi_writer:
+            return self.log_dir / f"audit_{date_str}.{self.writer_id}.jsonl"
         return self.log_dir / f"audit_{date_str}.jsonl"
     
     def log_event(
@@ -69,27 +224,182 @@ class AuditLogger:
             severity: Event severity (info, warning, error, critical)
         """
         event = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": None,  # Assigned under the lock, in write order
             "event_type": event_type.value,
             "description": description,
             "severity": severity,
             "metadata": metadata or {}
         }
         
-        # Store in memory
-        self.events.append(event)
+        if self.tracer is not None:
+            span = self.tracer.current_span()
+            if span is not None:
+                event["trace_id"] = span.trace_id
+                event["span_id"] = span.span_id
+        
+        if os.getpid() != self._writer_pid:
+            # Forked child: the parent's lock may have been held at fork time
+            self._init_writer()
         
-        # Write to file
-        self._write_event(event)
+        if self.metrics is not None:
+            self._m_events.labels(event["event_type"], severity).inc()
+        
+        anomalies = []
+        with self._lock:
+            now = self._next_timestamp()
+            event["timestamp"] = now.isoformat()
+            self.totals.add(event)
+            
+            keep = True
+            if self.sampler is not None:
+                summary = self.sampler.take_summary(event["timestamp"])
+                if summary:
+                    # Written just before this event, so it shares its timestamp
+                    self._write_sampling_summary(summary, event["timestamp"])
+                keep = self.sampler.should_keep(event)
+            
+            if keep:
+                # Store in memory
+                self.events.append(event)
+                
+                # Write to file
+                self._write_event(event)
+            
+            # Anomaly detection (anomalies themselves are not fed back)
+            if self.anomaly_detector is not None and event_type is not EventType.ANOMALY:
+                anomalies = self.anomaly_detector.observe(event, to_epoch_seconds(now))
         
         # Console output for critical events
         if severity in ["error", "critical"]:
             print(f"[AUDIT:{severity.upper()}] {event_type.value}: {description}")
+        
+        for anomaly in anomalies:
+            self.log_event(
+                EventType.ANOMALY,
+                anomaly["description"],
+                metadata=anomaly,
+                severity="warning"
+            )
+    
+    def _next_timestamp(self) -> datetime:
+        """
+        Timestamp for the next record (call with the lock held).
+        
+        Taken in write order and never going backwards, even if the wall
+        clock is stepped back, so each segment stays sorted by timestamp
+        (iter_merged_events() relies on it).
+        """
+        self._last_timestamp = max(datetime.utcnow(), self._last_timestamp)
+        return self._last_timestamp
+    
+    def _write_sampling_summary(self, summary: Dict, timestamp: Optional[str] = None):
+        """Record what the sampler dropped so on-disk reports stay exact"""
+        self._write_event({
+            "timestamp": timestamp or self._next_timestamp().isoformat(),
+            "event_type": EventType.SAMPLING_SUMMARY.value,
+            "description": f"Sampled out {summary['total']} events",
+            "severity": "info",
+            "metadata": summary
+        })
+    
+    def reload_sampling_config(self, config: Optional[Dict] = None):
+        """Reload the sampling configuration at runtime"""
+        if self.sampler is not None:
+            with self._lock:
+                self.sampler.reload(config)
     
     def _write_event(self, event: Dict):
-        """Write event to log file"""
-        with open(self.current_log_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(event) + '\n')
+        """Write event to log file (directly, or via the writer thread)"""
+        if os.getpid() != self._writer_pid:
+            # Forked child: never share the parent's segment, sequence or writer thread
+            self._init_writer()
+        
+        if self.multi_writer:
+            self._seq += 1
+            event["writer"] = self.writer_id
+            event["seq"] = self._seq
+        
+        if self._writer is not None:
+            self._writer.submit(event)
+        else:
+            self._write_batch([event])
+    
+    def _write_batch(self, events: List[Dict]):
+        """
+        Append events to their day's segment.
+        
+        Each contiguous run is a single write() on an O_APPEND descriptor,
+        so records from different processes never interleave within a line.
+        """
+        records = []
+        for event in events:
+            day = event["timestamp"][:10]
+            if self._file is None or day != self._file_day:
+                self._append(records)
+                records = []
+                self._open_log_file(day)
+            records.append((json.dumps(event) + '\n').encode('utf-8'))
+        self._append(records)
+    
+    def _append(self, records: List[bytes]):
+        if not records:
+            return
+        data = b"".join(records)
+        offset = self._file_size
+        start = time.perf_counter()
+        written = self._file.write(data)
+        while written < len(data):
+            written += self._file.write(data[written:])
+        self._file_size += len(data)
+        
+        if self.metrics is not None:
+            self._m_write_duration.observe(time.perf_counter() - start)
+            self._m_bytes.inc(len(data))
+            self._m_records.inc(len(records))
+        
+        # Hashing happens here, off the log_event path when a writer thread is used
+        if self._sealer is not None:
+            self._sealer.add_batch(records, offset)
+    
+    def _open_log_file(self, date_str: str):
+        """Open (or rotate to) the segment for the given day"""
+        self._close_log_file()
+        self.current_log_file = self._get_log_file(date_str)
+        # Unbuffered append mode: one os.write() per batch on an O_APPEND file
+        self._file = open(self.current_log_file, 'ab', buffering=0)
+        self._file_day = date_str
+        self._file_size = os.fstat(self._file.fileno()).st_size
+        if self._sealer is not None:
+            self._sealer.open_segment(self.current_log_file, self._file_size)
+    
+    def _close_log_file(self):
+        """Close the current segment, sealing it if enabled"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._file_day = None
+            if self._sealer is not None:
+                self._sealer.seal()
+                self._sealer.close_segment()
+    
+    def flush(self):
+        """Wait until all logged events are written to disk"""
+        if self._writer is not None:
+            self._writer.flush()
+    
+    def close(self):
+        """Flush pending events and close (and seal) the current log file"""
+        if self.sampler is not None:
+            with self._lock:
+                summary = self.sampler.take_summary()
+                if summary:
+                    self._write_sampling_summary(summary)
+        if self._writer is not None and os.getpid() == self._writer_pid:
+            self._writer.stop()
+            self._writer = None
+            _open_loggers.discard(self)
+        with self._lock:
+            self._close_log_file()
     
     def log_prompt_injection(
         self,
@@ -101,6 +411,7 @@ class AuditLogger:
             EventType.PROMPT_INJECTION,
             f"Prompt injection detected (severity: {detection_metadata['severity_level']})",
             metadata={
+                "user_id": detection_metadata.get("context", {}).get("user_id"),
                 "input_preview": user_input[:100],
                 "severity_score": detection_metadata["severity_score"],
                 "detected_patterns": detection_metadata["detected_patterns"]
@@ -199,30 +510,15 @@ class AuditLogger:
             end_iso = end_time.isoformat()
             results = [e for e in results if e["timestamp"] <= end_iso]
         
-        return results
+        return list(results)
     
     def get_statistics(self) -> Dict:
-        """Get audit statistics"""
-        if not self.events:
-            return {"total_events": 0}
-        
-        event_type_counts = {}
-        severity_counts = {}
-        
-        for event in self.events:
-            event_type = event["event_type"]
-            severity = event["severity"]
-            
-            event_type_counts[event_type] = event_type_counts.get(event_type, 0) + 1
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
-        
-        return {
-            "total_events": len(self.events),
-            "event_type_distribution": event_type_counts,
-            "severity_distribution": severity_counts,
-            "first_event": self.events[0]["timestamp"],
-            "last_event": self.events[-1]["timestamp"]
-        }
+        """Get audit statistics (exact, including sampled-out events)"""
+        with self._lock:
+            stats = self.totals.to_statistics()
+            if self.sampler is not None:
+                stats["sampling"] = self.sampler.get_statistics()
+        return stats
     
     def generate_report(self, output_path: Optional[Path] = None) -> str:
         """
@@ -234,37 +530,42 @@ class AuditLogger:
         Returns:
             Report as string
         """
-        stats = self.get_statistics()
-        
-        report = f"""
-# Security Audit Report
-Generated: {datetime.utcnow().isoformat()}
-
-## Summary
-- Total Events: {stats['total_events']}
-- Time Range: {stats.get('first_event', 'N/A')} to {stats.get('last_event', 'N/A')}
-
-## Event Type Distribution
-"""
-        for event_type, count in stats.get('event_type_distribution', {}).items():
-            report += f"- {event_type}: {count}\n"
-        
-        report += "\n## Severity Distribution\n"
-        for severity, count in stats.get('severity_distribution', {}).items():
-            report += f"- {severity}: {count}\n"
-        
-        # Critical events
-        critical_events = [e for e in self.events if e["severity"] in ["error", "critical"]]
-        if critical_events:
-            report += f"\n## Critical Events ({len(critical_events)})\n"
-            for event in critical_events[:10]:  # Top 10
-                report += f"- [{event['timestamp']}] {event['event_type']}: {event['description']}\n"
+        # Running totals cover every event, including sampled-out ones
+        with self._lock:
+            report = render_markdown(self.totals)
         
         if output_path:
             with open(output_path, 'w', encoding='utf-8') as f:
                 f.write(report)
         
         return report
+    
+    def generate_history_report(
+        self,
+        start_date=None,
+        end_date=None,
+        output_path: Optional[Path] = None,
+        json_output_path: Optional[Path] = None,
+        max_workers: Optional[int] = None
+    ) -> Tuple[str, Dict]:
+        """
+        Generate audit report from on-disk logs for a date range.
+        
+        Streams the daily log files instead of using in-memory events,
+        so it covers history from previous processes as well.
+        
+        Args:
+            start_date: First day to include (inclusive)
+            end_date: Last day to include (inclusive)
+            output_path: Path to save Markdown report (optional)
+            json_output_path: Path to save JSON report (optional)
+            max_workers: Worker processes for per-day aggregation
+        
+        Returns:
+            (markdown_report, json_report)
+        """
+        engine = AuditReportEngine(self.log_dir, max_workers=max_workers)
+        return engine.generate_report(start_date, end_date, output_path, json_output_path)
 
 
 # Example usage
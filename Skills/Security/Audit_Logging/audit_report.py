@@ -0,0 +1,414 @@
+"""
+Audit Report Engine: Streaming Reports over Historical Audit Logs
+
+Generates compliance reports for any date range of on-disk audit segments.
+Each day is aggregated independently (in parallel worker processes when
+several days need work) and the partial aggregates are merged, so memory
+is bounded by the number of days rather than the number of events.
+Aggregates for closed days are cached on disk, making repeated reports
+over past days effectively free.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional, Any, Iterable, Tuple
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from .segments import list_segments, group_segments_by_day
+except ImportError:
+    # Fallback for direct execution
+    from segments import list_segments, group_segments_by_day
+
+
+CRITICAL_SEVERITIES = ("error", "critical")
+SAMPLING_SUMMARY = "sampling_summary"
+CACHE_VERSION = 2
+
+
+class ReportAggregate:
+    """
+    Mergeable summary of a stream of audit events.
+
+    Holds only counters, the time range and the first few critical events,
+    so its size does not depend on how many events were added.
+    """
+
+    def __init__(self, max_critical_events: int = 10):
+        """
+        Initialize an empty aggregate.
+
+        Args:
+            max_critical_events: Number of earliest critical events to keep
+        """
+        self.max_critical_events = max_critical_events
+        self.total_events = 0
+        self.event_type_counts: Dict[str, int] = {}
+        self.severity_counts: Dict[str, int] = {}
+        self.first_event: Optional[str] = None
+        self.last_event: Optional[str] = None
+        self.critical_count = 0
+        self.critical_events: List[Dict] = []
+        self.malformed_lines = 0
+
+    def add(self, event: Dict):
+        """Add a single event"""
+        event_type = event.get("event_type", "unknown")
+        if event_type == SAMPLING_SUMMARY:
+            self._add_sampled_out(event)
+            return
+        severity = event.get("severity", "info")
+        timestamp = event.get("timestamp")
+
+        self.total_events += 1
+        self.event_type_counts[event_type] = self.event_type_counts.get(event_type, 0) + 1
+        self.severity_counts[severity] = self.severity_counts.get(severity, 0) + 1
+
+        if timestamp:
+            if self.first_event is None or timestamp < self.first_event:
+                self.first_event = timestamp
+            if self.last_event is None or timestamp > self.last_event:
+                self.last_event = timestamp
+
+        if severity in CRITICAL_SEVERITIES:
+            self.critical_count += 1
+            self._keep_critical([{
+                "timestamp": timestamp,
+                "event_type": event_type,
+                "description": event.get("description", "")
+            }])
+
+    def _add_sampled_out(self, summary: Dict):
+        """Count events that a sampler dropped, as recorded in its summary"""
+        dropped = (summary.get("metadata") or {}).get("dropped", {})
+        for event_type, counts in dropped.items():
+            for severity, count in counts.items():
+                self.total_events += count
+                self.event_type_counts[event_type] = self.event_type_counts.get(event_type, 0) + count
+                self.severity_counts[severity] = self.severity_counts.get(severity, 0) + count
+
+    def merge(self, other: "ReportAggregate") -> "ReportAggregate":
+        """Merge another aggregate into this one (in place)"""
+        self.total_events += other.total_events
+        for key, count in other.event_type_counts.items():
+            self.event_type_counts[key] = self.event_type_counts.get(key, 0) + count
+        for key, count in other.severity_counts.items():
+            self.severity_counts[key] = self.severity_counts.get(key, 0) + count
+
+        if other.first_event and (self.first_event is None or other.first_event < self.first_event):
+            self.first_event = other.first_event
+        if other.last_event and (self.last_event is None or other.last_event > self.last_event):
+            self.last_event = other.last_event
+
+        self.critical_count += other.critical_count
+        self._keep_critical(other.critical_events)
+        self.malformed_lines += other.malformed_lines
+        return self
+
+    def _keep_critical(self, events: List[Dict]):
+        """Keep only the earliest critical events"""
+        self.critical_events.extend(events)
+        if len(self.critical_events) > self.max_critical_events:
+            self.critical_events.sort(key=lambda e: e["timestamp"] or "")
+            del self.critical_events[self.max_critical_events:]
+
+    def to_statistics(self) -> Dict:
+        """Summary in the shape returned by AuditLogger.get_statistics()"""
+        if not self.total_events:
+            return {"total_events": 0}
+
+        return {
+            "total_events": self.total_events,
+            "event_type_distribution": dict(self.event_type_counts),
+            "severity_distribution": dict(self.severity_counts),
+            "first_event": self.first_event,
+            "last_event": self.last_event
+        }
+
+    def to_dict(self) -> Dict:
+        """Serialize for caching or transfer between processes"""
+        return {
+            "total_events": self.total_events,
+            "event_type_counts": self.event_type_counts,
+            "severity_counts": self.severity_counts,
+            "first_event": self.first_event,
+            "last_event": self.last_event,
+            "critical_count": self.critical_count,
+            "critical_events": self.critical_events,
+            "malformed_lines": self.malformed_lines
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict, max_critical_events: int = 10) -> "ReportAggregate":
+        """Rebuild an aggregate from to_dict() output"""
+        aggregate = cls(max_critical_events)
+        aggregate.total_events = data["total_events"]
+        aggregate.event_type_counts = dict(data["event_type_counts"])
+        aggregate.severity_counts = dict(data["severity_counts"])
+        aggregate.first_event = data["first_event"]
+        aggregate.last_event = data["last_event"]
+        aggregate.critical_count = data["critical_count"]
+        aggregate.critical_events = list(data["critical_events"])
+        aggregate.malformed_lines = data.get("malformed_lines", 0)
+        return aggregate
+
+
+def aggregate_events(events: Iterable[Dict], max_critical_events: int = 10) -> ReportAggregate:
+    """Aggregate an iterable of events in a single pass"""
+    aggregate = ReportAggregate(max_critical_events)
+    for event in events:
+        aggregate.add(event)
+    return aggregate
+
+
+def aggregate_segments(paths: List[Path], max_critical_events: int = 10) -> Dict:
+    """
+    Stream segment files line by line into one aggregate.
+
+    Module-level so it can run in a worker process.
+
+    Returns:
+        ReportAggregate.to_dict() output
+    """
+    aggregate = ReportAggregate(max_critical_events)
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    aggregate.malformed_lines += 1
+                    continue
+                aggregate.add(event)
+    return aggregate.to_dict()
+
+
+def render_markdown(aggregate: ReportAggregate, generated: Optional[str] = None) -> str:
+    """Render an aggregate in the standard Markdown audit report format"""
+    stats = aggregate.to_statistics()
+    generated = generated or datetime.utcnow().isoformat()
+
+    report = f"""
+# Security Audit Report
+Generated: {generated}
+
+## Summary
+- Total Events: {stats['total_events']}
+- Time Range: {stats.get('first_event', 'N/A')} to {stats.get('last_event', 'N/A')}
+
+## Event Type Distribution
+"""
+    for event_type, count in stats.get('event_type_distribution', {}).items():
+        report += f"- {event_type}: {count}\n"
+
+    report += "\n## Severity Distribution\n"
+    for severity, count in stats.get('severity_distribution', {}).items():
+        report += f"- {severity}: {count}\n"
+
+    # Critical events
+    if aggregate.critical_count:
+        report += f"\n## Critical Events ({aggregate.critical_count})\n"
+        for event in aggregate.critical_events:
+            report += f"- [{event['timestamp']}] {event['event_type']}: {event['description']}\n"
+
+    return report
+
+
+def render_json(
+    aggregate: ReportAggregate,
+    generated: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    days: Optional[Dict[str, Dict]] = None
+) -> Dict[str, Any]:
+    """Render an aggregate as a machine-readable report"""
+    stats = aggregate.to_statistics()
+    return {
+        "generated": generated or datetime.utcnow().isoformat(),
+        "start_date": start_date,
+        "end_date": end_date,
+        "summary": {
+            "total_events": stats["total_events"],
+            "first_event": stats.get("first_event"),
+            "last_event": stats.get("last_event"),
+            "malformed_lines": aggregate.malformed_lines
+        },
+        "event_type_distribution": stats.get("event_type_distribution", {}),
+        "severity_distribution": stats.get("severity_distribution", {}),
+        "critical_event_count": aggregate.critical_count,
+        "critical_events": aggregate.critical_events,
+        "days": days or {}
+    }
+
+
+class AuditReportEngine:
+    """
+    Report engine over on-disk audit segments.
+
+    Features:
+    - Bounded memory: events are streamed, never loaded as a whole
+    - Parallel per-day aggregation in worker processes
+    - Cached per-day aggregates for closed days
+    - Markdown and JSON output
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        cache_dir: Optional[Path] = None,
+        max_workers: Optional[int] = None,
+        max_critical_events: int = 10
+    ):
+        """
+        Initialize Report Engine.
+
+        Args:
+            log_dir: Directory containing audit segments
+            cache_dir: Directory for cached day aggregates (default: log_dir/.report_cache)
+            max_workers: Worker processes for aggregation (default: CPU count)
+            max_critical_events: Critical events listed in reports
+        """
+        self.log_dir = Path(log_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.log_dir / ".report_cache"
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_critical_events = max_critical_events
+
+    def _fingerprint(self, paths: List[Path]) -> Dict[str, List[int]]:
+        """Size and mtime of each segment, used to validate cache entries"""
+        fingerprint = {}
+        for path in paths:
+            stat = path.stat()
+            fingerprint[path.name] = [stat.st_size, stat.st_mtime_ns]
+        return fingerprint
+
+    def _cache_path(self, day: str) -> Path:
+        return self.cache_dir / f"day_{day}.json"
+
+    def _load_cached(self, day: str, fingerprint: Dict) -> Optional[ReportAggregate]:
+        """Load a cached day aggregate if it matches the current segments"""
+        cache_path = self._cache_path(day)
+        if not cache_path.exists():
+            return None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if cached.get("version") != CACHE_VERSION or cached.get("segments") != fingerprint:
+            return None
+        return ReportAggregate.from_dict(cached["aggregate"], self.max_critical_events)
+
+    def _store_cached(self, day: str, fingerprint: Dict, aggregate: Dict):
+        """Atomically write a day aggregate to the cache"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_path = self._cache_path(day)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "version": CACHE_VERSION,
+                "segments": fingerprint,
+                "aggregate": aggregate
+            }, f)
+        os.replace(tmp_path, cache_path)
+
+    def aggregate_days(self, start_date=None, end_date=None) -> Dict[str, ReportAggregate]:
+        """
+        Aggregate each day in the range.
+
+        Args:
+            start_date: First day (inclusive, default: earliest segment)
+            end_date: Last day (inclusive, default: latest segment)
+
+        Returns:
+            {day: ReportAggregate} in chronological order
+        """
+        days = group_segments_by_day(list_segments(self.log_dir, start_date, end_date))
+        today = datetime.utcnow().strftime("%Y-%m-%d")
+
+        results: Dict[str, ReportAggregate] = {}
+        pending: Dict[str, Tuple[List[Path], Dict]] = {}
+
+        for day, paths in days.items():
+            fingerprint = self._fingerprint(paths)
+            cached = self._load_cached(day, fingerprint) if day < today else None
+            if cached is not None:
+                results[day] = cached
+            else:
+                pending[day] = (paths, fingerprint)
+
+        if len(pending) > 1 and self.max_workers > 1:
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(pending))) as pool:
+                futures = {
+                    day: pool.submit(aggregate_segments, paths, self.max_critical_events)
+                    for day, (paths, _) in pending.items()
+                }
+                computed = {day: future.result() for day, future in futures.items()}
+        else:
+            computed = {
+                day: aggregate_segments(paths, self.max_critical_events)
+                for day, (paths, _) in pending.items()
+            }
+
+        for day, data in computed.items():
+            # Only closed days are stable enough to cache
+            if day < today:
+                self._store_cached(day, pending[day][1], data)
+            results[day] = ReportAggregate.from_dict(data, self.max_critical_events)
+
+        return {day: results[day] for day in sorted(results)}
+
+    def aggregate(self, start_date=None, end_date=None) -> ReportAggregate:
+        """Aggregate the whole range into a single summary"""
+        total = ReportAggregate(self.max_critical_events)
+        for aggregate in self.aggregate_days(start_date, end_date).values():
+            total.merge(aggregate)
+        return total
+
+    def generate_report(
+        self,
+        start_date=None,
+        end_date=None,
+        output_path: Optional[Path] = None,
+        json_output_path: Optional[Path] = None
+    ) -> Tuple[str, Dict]:
+        """
+        Generate audit report for a date range.
+
+        Args:
+            start_date: First day (inclusive)
+            end_date: Last day (inclusive)
+            output_path: Path to save Markdown report (optional)
+            json_output_path: Path to save JSON report (optional)
+
+        Returns:
+            (markdown_report, json_report)
+        """
+        days = self.aggregate_days(start_date, end_date)
+        total = ReportAggregate(self.max_critical_events)
+        for aggregate in days.values():
+            total.merge(aggregate)
+
+        generated = datetime.utcnow().isoformat()
+        markdown = render_markdown(total, generated)
+        report_json = render_json(
+            total,
+            generated,
+            start_date=str(start_date)[:10] if start_date else None,
+            end_date=str(end_date)[:10] if end_date else None,
+            days={day: agg.to_statistics() for day, agg in days.items()}
+        )
+
+        if output_path:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(markdown)
+
+        if json_output_path:
+            with open(json_output_path, 'w', encoding='utf-8') as f:
+                json.dump(report_json, f, indent=2)
+
+        return markdown, report_json
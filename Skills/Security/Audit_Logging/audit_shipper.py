@@ -0,0 +1,309 @@
+"""
+Audit Shipper: Batched Delivery of Audit Segments to a Central Collector
+
+Runs on its own thread, reading committed (newline-terminated) records of
+the on-disk audit segments through an AuditFollower, and POSTs them in
+gzip-compressed JSONL batches to an HTTP collector. log_event never waits
+on the network: if the collector is down, records simply stay on disk
+until it comes back.
+
+Delivery is at-least-once. The follower cursor (byte offset per segment)
+is only committed after the collector acknowledges a batch, so a
+restarted shipper resumes exactly after the last acknowledged batch. Each
+batch carries its segment name and start offset (X-Audit-Segment /
+X-Audit-Offset headers) so the collector can drop duplicates.
+
+CollectorServer is a local stand-in collector for tests and demos.
+"""
+
+import gzip
+import json
+import threading
+import time
+import urllib.request
+from typing import Dict, List, Optional
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    from .audit_follower import AuditFollower
+except ImportError:
+    # Fallback for direct execution
+    from audit_follower import AuditFollower
+
+
+class AuditShipper:
+    """
+    Asynchronous audit log shipper.
+
+    Features:
+    - Follows committed records of all segments in a log directory
+    - Batches and gzip-compresses records
+    - Persists acknowledged offsets (resume after restart)
+    - Bounded retry with exponential backoff
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        endpoint: str,
+        state_path: Optional[Path] = None,
+        batch_size: int = 500,
+        max_batch_bytes: int = 1024 * 1024,
+        poll_interval: float = 1.0,
+        max_retries: int = 5,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        timeout: float = 10.0,
+        headers: Optional[Dict[str, str]] = None
+    ):
+        """
+        Initialize Audit Shipper.
+
+        Args:
+            log_dir: Audit log directory to ship
+            endpoint: Collector URL receiving POSTed batches
+            state_path: Acknowledged-offset file (default: log_dir/.shipper_state.json)
+            batch_size: Maximum records per batch
+            max_batch_bytes: Maximum uncompressed bytes per batch
+            poll_interval: Longest idle wait between scans (inotify wakes earlier)
+            max_retries: Attempts per batch before backing off for a full cycle
+            backoff_base: First retry delay in seconds (doubles per attempt)
+            backoff_max: Upper bound on any delay
+            timeout: HTTP request timeout
+            headers: Extra HTTP headers (e.g. authorization)
+        """
+        self.log_dir = Path(log_dir)
+        self.endpoint = endpoint
+        self.state_path = Path(state_path) if state_path else self.log_dir / ".shipper_state.json"
+        self.batch_size = batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.poll_interval = poll_interval
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.headers = headers or {}
+
+        self.follower = self._new_follower()
+        self._follower_closed = False
+        self.stats = {
+            "batches_sent": 0,
+            "records_sent": 0,
+            "bytes_sent": 0,
+            "failed_attempts": 0,
+            "last_error": None
+        }
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _new_follower(self) -> AuditFollower:
+        # Resumes from the acknowledged offsets persisted at state_path
+        return AuditFollower(
+            self.log_dir,
+            consumer_id="shipper",
+            cursor_path=self.state_path,
+            auto_commit=False,
+            max_poll_interval=self.poll_interval
+        )
+
+    def _post(self, segment: str, offset: int, records: List[bytes]):
+        body = gzip.compress(b"".join(records))
+        request = urllib.request.Request(
+            self.endpoint,
+            data=body,
+            method="POST",
+            headers={
+                "Content-Type": "application/x-ndjson",
+                "Content-Encoding": "gzip",
+                "X-Audit-Segment": segment,
+                "X-Audit-Offset": str(offset),
+                "X-Audit-Records": str(len(records)),
+                **self.headers
+            }
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+        self.stats["bytes_sent"] += len(body)
+
+    def _send_with_retry(self, segment: str, offset: int, records: List[bytes]) -> bool:
+        """POST one batch with bounded exponential backoff"""
+        delay = self.backoff_base
+        for attempt in range(self.max_retries):
+            try:
+                self._post(segment, offset, records)
+                return True
+            except Exception as e:
+                self.stats["failed_attempts"] += 1
+                self.stats["last_error"] = str(e)
+                if attempt + 1 < self.max_retries and self._stop.wait(delay):
+                    return False
+                delay = min(delay * 2, self.backoff_max)
+        return False
+
+    def run_once(self) -> int:
+        """
+        Ship everything currently committed on disk.
+
+        Returns:
+            Number of records acknowledged by the collector
+        """
+        shipped = 0
+        while not self._stop.is_set():
+            batch = self.follower.read_batch(self.batch_size, self.max_batch_bytes)
+            if batch is None:
+                break
+            records = batch["records"]
+            if not self._send_with_retry(batch["segment"], batch["offset"], records):
+                # Re-read unacknowledged records on the next cycle
+                self.follower.rewind()
+                return shipped
+            self.follower.commit(batch["segment"], batch["end"])
+            self.stats["batches_sent"] += 1
+            self.stats["records_sent"] += len(records)
+            shipped += len(records)
+
+        self.follower.rewind()
+        return shipped
+
+    def _run(self):
+        try:
+            while not self._stop.is_set():
+                failures = self.stats["failed_attempts"]
+                try:
+                    self.run_once()
+                except Exception as e:
+                    self.stats["last_error"] = str(e)
+                if self.stats["failed_attempts"] > failures:
+                    # After a failed cycle wait out the full backoff before trying again
+                    self._stop.wait(self.backoff_max)
+                else:
+                    self.follower.wait(self.poll_interval)
+        finally:
+            # The thread owns the follower while it runs, so it closes it on exit
+            self._close_follower()
+
+    def _close_follower(self):
+        self.follower.close()
+        self._follower_closed = True
+
+    def start(self):
+        """Start shipping in a background thread"""
+        if self._thread is not None and self._thread.is_alive():
+            if not self._stop.is_set():
+                return
+            # A stop() that timed out: let that thread finish before replacing it
+            self._thread.join()
+        self._thread = None
+        if self._follower_closed:
+            self.follower = self._new_follower()
+            self._follower_closed = False
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-shipper", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Stop the background thread.
+
+        Returns:
+            False if the thread was still running after timeout (it closes
+            the follower itself when it exits), True otherwise
+        """
+        self._stop.set()
+        if self._thread is None:
+            self._close_follower()
+            return True
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            return False
+        self._thread = None
+        return True
+
+    def get_statistics(self) -> Dict:
+        """Get shipping statistics"""
+        return {**self.stats, "backlog_bytes": self.follower.get_statistics()["lag_bytes"]}
+
+
+class CollectorServer:
+    """
+    Local stand-in for the central audit collector.
+
+    Accepts batches from AuditShipper, drops duplicates by
+    (segment, offset), and can simulate an outage.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.records: List[Dict] = []
+        self.batches = 0
+        self.duplicates = 0
+        self.available = True
+        self._seen = set()
+        self._lock = threading.Lock()
+
+        collector = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if not collector.available:
+                    self.send_error(503, "Collector unavailable")
+                    return
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if self.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                key = (self.headers.get("X-Audit-Segment"), self.headers.get("X-Audit-Offset"))
+                with collector._lock:
+                    if key in collector._seen:
+                        collector.duplicates += 1
+                    else:
+                        collector._seen.add(key)
+                        collector.batches += 1
+                        collector.records.extend(json.loads(line) for line in body.splitlines() if line)
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.url = f"http://{host}:{self.server.server_address[1]}/audit"
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "CollectorServer":
+        self._thread = threading.Thread(target=self.server.serve_forever, name="audit-collector", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+# Example usage
+if __name__ == "__main__":
+    import tempfile
+
+    try:
+        from .audit_logger import AuditLogger, EventType
+    except ImportError:
+        from audit_logger import AuditLogger, EventType
+
+    log_dir = Path(tempfile.mkdtemp())
+    collector = CollectorServer().start()
+    logger = AuditLogger(log_dir)
+    shipper = AuditShipper(log_dir, collector.url, poll_interval=0.1, backoff_base=0.05, backoff_max=0.2)
+    shipper.start()
+
+    collector.available = False
+    start = time.perf_counter()
+    for i in range(1000):
+        logger.log_event(EventType.DECISION_MADE, f"Decision {i}", {"i": i})
+    print(f"Logged 1000 events with collector down in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    collector.available = True
+    time.sleep(1.0)
+    shipper.stop()
+    collector.stop()
+    print(f"Collector received {len(collector.records)} records in {collector.batches} batches")
+    print(f"Shipper stats: {shipper.get_statistics()}")
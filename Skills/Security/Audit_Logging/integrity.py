@@ -0,0 +1,444 @@
+"""
+Audit Integrity: Merkle Sealing and Verification of Audit Segments
+
+Provides tamper evidence for audit logs without hashing on the log_event
+hot path. The audit writer thread hashes records in batches as it writes
+them and appends them to a per-segment index sidecar:
+
+    audit_<date>[.<writer>].jsonl        records
+    audit_<date>[.<writer>].jsonl.idx    44 bytes per record: offset, length, leaf hash
+    audit_<date>[.<writer>].jsonl.seal   Merkle root, chained to the previous seal
+
+When a segment is sealed (on rotation or close) its Merkle root is chained
+to the previously sealed segment of the same writer:
+chain = sha256(prev_chain || root). Each writer keeps its own chain head
+(.seal_head, or .seal_head.<writer> for per-writer segments), updated under
+a file lock. Only the head segment may be resealed after appends; once a
+later seal chains to a segment it is frozen, and records appended to it
+are reported as an unsealed tail.
+
+The verifier checks many segments in parallel and can prove that a single
+record is included in a sealed segment using only the index sidecar and
+that one record.
+
+Usage:
+    python integrity.py verify <log_dir> [--workers N]
+    python integrity.py prove <segment> <record_index>
+"""
+
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import struct
+import sys
+from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows; chain heads are then per-writer only
+    fcntl = None
+
+try:
+    from .segments import list_segments, parse_segment_name
+except ImportError:
+    # Fallback for direct execution
+    from segments import list_segments, parse_segment_name
+
+
+INDEX_ENTRY = struct.Struct(">QI32s")  # offset, length, leaf hash
+GENESIS_CHAIN = "0" * 64
+HEAD_FILE = ".seal_head"
+
+
+def leaf_hash(record: bytes) -> bytes:
+    """Hash of one record line (including its newline)"""
+    return hashlib.sha256(b"\x00" + record).digest()
+
+
+def _node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def merkle_root(leaves: List[bytes]) -> bytes:
+    """Merkle root over leaf hashes (an odd node is promoted unchanged)"""
+    if not leaves:
+        return hashlib.sha256(b"").digest()
+    level = list(leaves)
+    while len(level) > 1:
+        next_level = [_node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            next_level.append(level[-1])
+        level = next_level
+    return level[0]
+
+
+def merkle_proof(leaves: List[bytes], index: int) -> List[Tuple[str, str]]:
+    """
+    Audit path for one leaf.
+
+    Returns:
+        [(side, sibling_hash_hex)] from the leaf upwards, side being
+        "L" or "R" for where the sibling sits
+    """
+    proof = []
+    level = list(leaves)
+    while len(level) > 1:
+        sibling = index ^ 1
+        if sibling < len(level):
+            proof.append(("L" if sibling < index else "R", level[sibling].hex()))
+        next_level = [_node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            next_level.append(level[-1])
+        level = next_level
+        index //= 2
+    return proof
+
+
+def verify_proof(leaf: bytes, proof: List[Tuple[str, str]], root_hex: str) -> bool:
+    """Check an audit path against a Merkle root"""
+    node = leaf
+    for side, sibling_hex in proof:
+        sibling = bytes.fromhex(sibling_hex)
+        node = _node_hash(sibling, node) if side == "L" else _node_hash(node, sibling)
+    return node.hex() == root_hex
+
+
+def chain_hash(prev_chain: str, root_hex: str) -> str:
+    return hashlib.sha256(bytes.fromhex(prev_chain) + bytes.fromhex(root_hex)).hexdigest()
+
+
+def _sidecar(segment: Path, suffix: str) -> Path:
+    return segment.with_name(segment.name + suffix)
+
+
+def _write_json_atomic(path: Path, data: Dict):
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+@contextlib.contextmanager
+def _file_lock(path: Path):
+    """Exclusive cross-process lock on a sidecar lock file"""
+    with open(path.with_name(path.name + ".lock"), 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def head_file(log_dir: Path, segment: Path) -> Path:
+    """Chain head for a segment's writer (one chain per writer)"""
+    info = parse_segment_name(segment)
+    writer = info["writer"] if info else None
+    return Path(log_dir) / (f"{HEAD_FILE}.{writer}" if writer else HEAD_FILE)
+
+
+def read_index(segment: Path) -> List[Tuple[int, int, bytes]]:
+    """Read all (offset, length, leaf_hash) entries of a segment index"""
+    data = _sidecar(segment, ".idx").read_bytes()
+    usable = len(data) - len(data) % INDEX_ENTRY.size
+    return [INDEX_ENTRY.unpack_from(data, pos) for pos in range(0, usable, INDEX_ENTRY.size)]
+
+
+class SegmentSealer:
+    """
+    Incremental sealer used by the audit writer thread.
+
+    Assumes this process is the only writer of the segments it seals
+    (single-process logging or AuditLogger(multi_writer=True)). Chain
+    heads are still read and updated under a file lock, so loggers
+    sharing a writer ID cannot fork a chain.
+    """
+
+    def __init__(self, log_dir: Path):
+        self.log_dir = Path(log_dir)
+        self.segment: Optional[Path] = None
+        self.leaves: List[bytes] = []
+        self._index_file = None
+        self._previous_seal: Optional[Dict] = None
+
+    def open_segment(self, segment: Path, size: int):
+        """
+        Start tracking a segment.
+
+        Re-opening a previously sealed segment (e.g. after a restart)
+        reloads its index so the new seal covers old and new records.
+        """
+        self.close_segment()
+        self.segment = Path(segment)
+        self.leaves = []
+        self._previous_seal = None
+
+        index_path = _sidecar(self.segment, ".idx")
+        if index_path.exists():
+            entries = read_index(self.segment)
+            indexed_end = entries[-1][0] + entries[-1][1] if entries else 0
+            if indexed_end == size:
+                self.leaves = [entry[2] for entry in entries]
+                seal_path = _sidecar(self.segment, ".seal")
+                if seal_path.exists():
+                    with open(seal_path, 'r', encoding='utf-8') as f:
+                        self._previous_seal = json.load(f)
+            else:
+                # Index does not describe the file; start a fresh one
+                index_path.unlink()
+        elif size:
+            # Records written before sealing was enabled
+            self._index_existing(size)
+
+        self._index_file = open(index_path, 'ab', buffering=0)
+
+    def _index_existing(self, size: int):
+        entries = bytearray()
+        offset = 0
+        with open(self.segment, 'rb') as f:
+            for line in f:
+                if offset + len(line) > size:
+                    break
+                leaf = leaf_hash(line)
+                self.leaves.append(leaf)
+                entries += INDEX_ENTRY.pack(offset, len(line), leaf)
+                offset += len(line)
+        _sidecar(self.segment, ".idx").write_bytes(bytes(entries))
+
+    def add_batch(self, records: List[bytes], start_offset: int):
+        """Hash a batch of records written contiguously at start_offset"""
+        entries = bytearray()
+        offset = start_offset
+        for record in records:
+            leaf = leaf_hash(record)
+            self.leaves.append(leaf)
+            entries += INDEX_ENTRY.pack(offset, len(record), leaf)
+            offset += len(record)
+        self._index_file.write(bytes(entries))
+
+    def seal(self) -> Optional[Dict]:
+        """
+        Compute the Merkle root of the current segment and chain it.
+
+        Returns:
+            The seal, or None if there is no segment or the segment is
+            frozen (a later seal already chains to it)
+        """
+        if self.segment is None:
+            return None
+
+        root = merkle_root(self.leaves).hex()
+        head_path = head_file(self.log_dir, self.segment)
+        with _file_lock(head_path):
+            head = self._read_head(head_path)
+            if self._previous_seal:
+                if head.get("segment") not in (None, self.segment.name):
+                    # Frozen: resealing would change the chain value the
+                    # later seal was built on; the appended records stay
+                    # unsealed and verification reports them
+                    return None
+                # Resealing the head after appends keeps its chain position
+                prev_segment = self._previous_seal["prev_segment"]
+                prev_chain = self._previous_seal["prev_chain"]
+            else:
+                prev_segment = head.get("segment")
+                prev_chain = head.get("chain", GENESIS_CHAIN)
+                if prev_segment == self.segment.name:
+                    prev_segment, prev_chain = None, GENESIS_CHAIN
+
+            seal = {
+                "segment": self.segment.name,
+                "records": len(self.leaves),
+                "root": root,
+                "prev_segment": prev_segment,
+                "prev_chain": prev_chain,
+                "chain": chain_hash(prev_chain, root),
+                "sealed_at": datetime.utcnow().isoformat()
+            }
+            _write_json_atomic(_sidecar(self.segment, ".seal"), seal)
+            _write_json_atomic(head_path, {"segment": seal["segment"], "chain": seal["chain"]})
+        self._previous_seal = seal
+        return seal
+
+    @staticmethod
+    def _read_head(head_path: Path) -> Dict:
+        try:
+            with open(head_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def close_segment(self):
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
+
+
+def verify_segment(segment: Path) -> Dict:
+    """
+    Verify one segment against its index and seal.
+
+    Module-level so it can run in a worker process.
+    """
+    segment = Path(segment)
+    result = {"segment": segment.name, "ok": False, "status": "", "seal": None}
+
+    seal_path = _sidecar(segment, ".seal")
+    if not seal_path.exists():
+        result["status"] = "unsealed"
+        return result
+    with open(seal_path, 'r', encoding='utf-8') as f:
+        seal = json.load(f)
+    result["seal"] = seal
+
+    leaves = []
+    unsealed = 0
+    with open(segment, 'rb') as f:
+        for line in f:
+            if len(leaves) < seal["records"]:
+                leaves.append(leaf_hash(line))
+            else:
+                unsealed += 1
+
+    if len(leaves) < seal["records"]:
+        result["status"] = f"truncated: {len(leaves)} of {seal['records']} records"
+        return result
+
+    if merkle_root(leaves).hex() != seal["root"]:
+        result["status"] = "root mismatch: records modified"
+        return result
+
+    if chain_hash(seal["prev_chain"], seal["root"]) != seal["chain"]:
+        result["status"] = "chain hash mismatch"
+        return result
+
+    if unsealed:
+        # Appended after the seal: nothing vouches for these records
+        result["status"] = f"unsealed tail: {unsealed} records after the seal"
+        return result
+
+    result["ok"] = True
+    result["status"] = "ok"
+    return result
+
+
+def verify_directory(
+    log_dir: Path,
+    start_date=None,
+    end_date=None,
+    max_workers: Optional[int] = None
+) -> Dict:
+    """
+    Verify all segments in a directory (in parallel) and their chain links.
+
+    Returns:
+        {"ok": bool, "segments": [per-segment results]}
+    """
+    segments = list_segments(log_dir, start_date, end_date)
+    workers = max_workers or os.cpu_count() or 1
+
+    if len(segments) > 1 and workers > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(segments))) as pool:
+            results = list(pool.map(verify_segment, segments))
+    else:
+        results = [verify_segment(segment) for segment in segments]
+
+    # Chain links: each seal must point at an existing seal with a matching chain hash
+    for result in results:
+        seal = result["seal"]
+        if not result["ok"] or not seal["prev_segment"]:
+            continue
+        prev_path = Path(log_dir) / (seal["prev_segment"] + ".seal")
+        try:
+            with open(prev_path, 'r', encoding='utf-8') as f:
+                prev_seal = json.load(f)
+        except (OSError, ValueError):
+            result["ok"] = False
+            result["status"] = f"chain broken: missing seal for {seal['prev_segment']}"
+            continue
+        if prev_seal["chain"] != seal["prev_chain"]:
+            result["ok"] = False
+            result["status"] = f"chain broken: {seal['prev_segment']} was altered"
+
+    sealed = [r for r in results if r["status"] != "unsealed"]
+    return {
+        "ok": all(r["ok"] for r in sealed),
+        "verified": sum(1 for r in sealed if r["ok"]),
+        "failed": sum(1 for r in sealed if not r["ok"]),
+        "unsealed": len(results) - len(sealed),
+        "segments": results
+    }
+
+
+def prove_record(segment: Path, index: int) -> Dict:
+    """
+    Prove that one record is included in a sealed segment.
+
+    Reads only the seal, the index sidecar and the record itself.
+    """
+    segment = Path(segment)
+    with open(_sidecar(segment, ".seal"), 'r', encoding='utf-8') as f:
+        seal = json.load(f)
+    if not 0 <= index < seal["records"]:
+        raise IndexError(f"record {index} not in sealed range 0..{seal['records'] - 1}")
+
+    entries = read_index(segment)[:seal["records"]]
+    offset, length, indexed_leaf = entries[index]
+
+    with open(segment, 'rb') as f:
+        f.seek(offset)
+        record = f.read(length)
+
+    leaf = leaf_hash(record)
+    proof = merkle_proof([entry[2] for entry in entries], index)
+    return {
+        "segment": segment.name,
+        "index": index,
+        "record": record.decode('utf-8').rstrip('\n'),
+        "leaf": leaf.hex(),
+        "root": seal["root"],
+        "proof": proof,
+        "included": leaf == indexed_leaf and verify_proof(leaf, proof, seal["root"])
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Verify sealed audit segments")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    verify_cmd = commands.add_parser("verify", help="Verify all segments in a log directory")
+    verify_cmd.add_argument("log_dir", type=Path)
+    verify_cmd.add_argument("--start", help="First day (YYYY-MM-DD)")
+    verify_cmd.add_argument("--end", help="Last day (YYYY-MM-DD)")
+    verify_cmd.add_argument("--workers", type=int, default=None)
+
+    prove_cmd = commands.add_parser("prove", help="Prove inclusion of one record")
+    prove_cmd.add_argument("segment", type=Path)
+    prove_cmd.add_argument("index", type=int)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "verify":
+        report = verify_directory(args.log_dir, args.start, args.end, args.workers)
+        for result in report["segments"]:
+            if result["ok"] or result["status"] == "unsealed":
+                print(f"{result['status']:>10}  {result['segment']}")
+            else:
+                print(f"    FAILED  {result['segment']}: {result['status']}")
+        print(f"\nVerified: {report['verified']}  Failed: {report['failed']}  Unsealed: {report['unsealed']}")
+        return 0 if report["ok"] else 1
+
+    proof = prove_record(args.segment, args.index)
+    print(json.dumps(proof, indent=2))
+    return 0 if proof["included"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
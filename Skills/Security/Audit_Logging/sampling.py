@@ -0,0 +1,227 @@
+"""
+Audit Sampler: Severity-Aware Sampling of High-Volume Audit Events
+
+Reduces audit volume from repetitive info events (decision_made,
+action_executed) while keeping everything that matters:
+- Warning/error/critical events are always kept
+- The first N events per key per minute are always kept
+- Beyond that, 1 in N events is kept per event type
+
+Dropped events are still counted exactly. The sampler hands out per-minute
+summaries of what it dropped; AuditLogger writes them as sampling_summary
+records so on-disk reports stay exact too.
+
+Configuration is JSON and can be reloaded at runtime.
+"""
+
+import json
+import os
+import time
+from typing import Dict, Optional, Any
+from pathlib import Path
+
+
+DEFAULT_SAMPLING_CONFIG = {
+    "enabled": True,
+    "always_keep_severities": ["warning", "error", "critical"],
+    "max_keys_per_minute": 10000,
+    "reload_interval_seconds": 5.0,
+    "default": {"keep_every": 1},
+    "event_types": {
+        "decision_made": {
+            "keep_every": 10,
+            "first_per_key_per_minute": 5,
+            "key_fields": ["description"]
+        },
+        "action_executed": {
+            "keep_every": 10,
+            "first_per_key_per_minute": 5,
+            "key_fields": ["description"]
+        }
+    }
+}
+
+
+class AuditSampler:
+    """
+    Per-event-type sampling policies with exact drop accounting.
+
+    Features:
+    - Always keep selected severities
+    - Keep the first N per key per minute
+    - Keep 1 in N of the rest
+    - Runtime-reloadable JSON configuration
+    """
+
+    def __init__(self, config_path: Optional[Path] = None, config: Optional[Dict] = None):
+        """
+        Initialize Audit Sampler.
+
+        Args:
+            config_path: JSON configuration file (re-read when it changes)
+            config: Configuration dict (used when no file is given)
+        """
+        self.config_path = Path(config_path) if config_path else None
+        self._config_mtime = None
+        self._next_reload_check = 0.0
+        self.config = self._load_config(config)
+
+        self.type_counters: Dict[str, int] = {}
+        self.minute: Optional[str] = None
+        self.minute_key_counts: Dict[Any, int] = {}
+
+        self.kept = 0
+        self.dropped = 0
+        self.dropped_by_type: Dict[str, Dict[str, int]] = {}
+        self._pending: Dict[str, Dict[str, int]] = {}
+        self._pending_minute: Optional[str] = None
+
+    def _load_config(self, config: Optional[Dict] = None) -> Dict:
+        """Load configuration from file or dict over the defaults"""
+        merged = json.loads(json.dumps(DEFAULT_SAMPLING_CONFIG))
+
+        if self.config_path and self.config_path.exists():
+            with open(self.config_path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+            self._config_mtime = os.stat(self.config_path).st_mtime_ns
+
+        if config:
+            if "event_types" in config:
+                # Replace the per-type table rather than merging it
+                merged["event_types"] = {}
+            merged.update(config)
+
+        merged["always_keep_severities"] = set(merged["always_keep_severities"])
+        return merged
+
+    def reload(self, config: Optional[Dict] = None):
+        """
+        Reload configuration.
+
+        Args:
+            config: New configuration dict (default: re-read config_path)
+        """
+        self.config = self._load_config(config)
+        self.type_counters = {}
+
+    def maybe_reload(self):
+        """Reload if the configuration file changed (checked at most every few seconds)"""
+        if self.config_path is None:
+            return
+        now = time.monotonic()
+        if now < self._next_reload_check:
+            return
+        self._next_reload_check = now + self.config["reload_interval_seconds"]
+        try:
+            mtime = os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return
+        if mtime != self._config_mtime:
+            self.reload()
+
+    def _policy(self, event_type: str) -> Dict:
+        return self.config["event_types"].get(event_type, self.config["default"])
+
+    def should_keep(self, event: Dict) -> bool:
+        """
+        Decide whether to keep an event, counting it if dropped.
+
+        Args:
+            event: Audit event dict
+
+        Returns:
+            True to keep (store and write) the event
+        """
+        self.maybe_reload()
+
+        if not self.config["enabled"] or event["severity"] in self.config["always_keep_severities"]:
+            self.kept += 1
+            return True
+
+        event_type = event["event_type"]
+        policy = self._policy(event_type)
+        keep_every = policy.get("keep_every", 1)
+        if keep_every <= 1:
+            self.kept += 1
+            return True
+
+        # First N per key per minute
+        first_n = policy.get("first_per_key_per_minute", 0)
+        if first_n:
+            minute = event["timestamp"][:16]
+            if minute != self.minute:
+                self.minute = minute
+                self.minute_key_counts = {}
+            key = (event_type,) + tuple(self._key_value(event, f) for f in policy.get("key_fields", ["description"]))
+            count = self.minute_key_counts.get(key, 0)
+            if count < first_n and (count or len(self.minute_key_counts) < self.config["max_keys_per_minute"]):
+                self.minute_key_counts[key] = count + 1
+                self.kept += 1
+                return True
+
+        # 1 in N of the rest
+        counter = self.type_counters.get(event_type, 0) + 1
+        self.type_counters[event_type] = counter
+        if counter % keep_every == 0:
+            self.kept += 1
+            return True
+
+        self._count_dropped(event)
+        return False
+
+    @staticmethod
+    def _key_value(event: Dict, field: str):
+        """Resolve a key field ("description" or "metadata.<name>")"""
+        if field.startswith("metadata."):
+            value = event.get("metadata", {}).get(field[len("metadata."):])
+        else:
+            value = event.get(field)
+        return value if isinstance(value, (str, int, float, bool, type(None))) else str(value)
+
+    def _count_dropped(self, event: Dict):
+        event_type = event["event_type"]
+        severity = event["severity"]
+
+        self.dropped += 1
+        by_severity = self.dropped_by_type.setdefault(event_type, {})
+        by_severity[severity] = by_severity.get(severity, 0) + 1
+
+        if self._pending_minute is None:
+            self._pending_minute = event["timestamp"][:16]
+        pending = self._pending.setdefault(event_type, {})
+        pending[severity] = pending.get(severity, 0) + 1
+
+    def take_summary(self, timestamp: Optional[str] = None) -> Optional[Dict]:
+        """
+        Hand out the pending drop summary.
+
+        Args:
+            timestamp: Current event time; the summary is only released
+                once the minute it started in has passed (None = release now)
+
+        Returns:
+            {"window_start": ..., "dropped": {event_type: {severity: n}}, "total": n}
+            or None if nothing is due
+        """
+        if not self._pending:
+            return None
+        if timestamp is not None and timestamp[:16] == self._pending_minute:
+            return None
+
+        summary = {
+            "window_start": self._pending_minute,
+            "dropped": self._pending,
+            "total": sum(n for counts in self._pending.values() for n in counts.values())
+        }
+        self._pending = {}
+        self._pending_minute = None
+        return summary
+
+    def get_statistics(self) -> Dict:
+        """Get sampling statistics"""
+        return {
+            "kept": self.kept,
+            "dropped": self.dropped,
+            "dropped_by_type": {k: dict(v) for k, v in self.dropped_by_type.items()}
+        }
+
@@ -0,0 +1,137 @@
+"""
+Audit Segments: On-disk Layout of Audit Logs
+
+An audit log directory holds one or more JSONL "segments" per UTC day:
+
+    audit_2026-02-02.jsonl            (single-writer segment)
+    audit_2026-02-02.<writer>.jsonl   (per-writer segment)
+
+Helpers here locate and group segments so that readers (reports, replay,
+verification) share one definition of the layout.
+
+Per-writer segments are written by AuditLogger(multi_writer=True): each
+process appends only to its own file and stamps records with its writer
+ID and a sequence number. iter_merged_events() merges them back into one
+time-ordered stream without any cross-process locking on the write path.
+"""
+
+import heapq
+import json
+import re
+from typing import Dict, List, Optional, Iterator
+from pathlib import Path
+from datetime import date
+
+
+SEGMENT_GLOB = "audit_*.jsonl"
+SEGMENT_PATTERN = re.compile(r"^audit_(\d{4}-\d{2}-\d{2})(?:\.([A-Za-z0-9_-]+))?\.jsonl$")
+
+
+def parse_segment_name(path: Path) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Parse a segment file name.
+
+    Returns:
+        {"day": "YYYY-MM-DD", "writer": writer_id or None}, or None if
+        the name is not an audit segment
+    """
+    match = SEGMENT_PATTERN.match(Path(path).name)
+    if not match:
+        return None
+    return {"day": match.group(1), "writer": match.group(2)}
+
+
+def _as_day(value) -> Optional[str]:
+    """Normalize a date/datetime/ISO string to YYYY-MM-DD"""
+    if value is None:
+        return None
+    if isinstance(value, date):
+        return value.isoformat()[:10]
+    return str(value)[:10]
+
+
+def list_segments(
+    log_dir: Path,
+    start_date=None,
+    end_date=None
+) -> List[Path]:
+    """
+    List audit segments, optionally restricted to an inclusive date range.
+
+    Args:
+        log_dir: Audit log directory
+        start_date: First day to include (date, datetime or ISO string)
+        end_date: Last day to include (date, datetime or ISO string)
+
+    Returns:
+        Segment paths sorted by (day, writer)
+    """
+    start_day = _as_day(start_date)
+    end_day = _as_day(end_date)
+
+    segments = []
+    for path in Path(log_dir).glob(SEGMENT_GLOB):
+        info = parse_segment_name(path)
+        if info is None:
+            continue
+        if start_day and info["day"] < start_day:
+            continue
+        if end_day and info["day"] > end_day:
+            continue
+        segments.append((info["day"], info["writer"] or "", path))
+
+    segments.sort(key=lambda s: (s[0], s[1]))
+    return [path for _, _, path in segments]
+
+
+def group_segments_by_day(segments: List[Path]) -> Dict[str, List[Path]]:
+    """Group segment paths by their UTC day, preserving order"""
+    days: Dict[str, List[Path]] = {}
+    for path in segments:
+        info = parse_segment_name(path)
+        if info is None:
+            continue
+        days.setdefault(info["day"], []).append(path)
+    return days
+
+
+def iter_segment_events(path: Path) -> Iterator[Dict]:
+    """
+    Yield parsed events from one segment.
+
+    A trailing line without a newline is a record still being written and
+    is skipped; lines that fail to parse are skipped as well.
+    """
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def _merge_key(event: Dict):
+    return (event.get("timestamp", ""), event.get("writer") or "", event.get("seq", 0))
+
+
+def iter_merged_events(
+    log_dir: Path,
+    start_date=None,
+    end_date=None
+) -> Iterator[Dict]:
+    """
+    Yield events from all segments in a date range as one stream ordered by
+    (timestamp, writer, seq).
+
+    Each segment is already ordered (writers assign timestamps under their
+    write lock, never going backwards), so this is a k-way merge that holds
+    one pending event per open segment of the current day.
+    """
+    for paths in group_segments_by_day(list_segments(log_dir, start_date, end_date)).values():
+        streams = [iter_segment_events(path) for path in paths]
+        if len(streams) == 1:
+            yield from streams[0]
+        else:
+            yield from heapq.merge(*streams, key=_merge_key)
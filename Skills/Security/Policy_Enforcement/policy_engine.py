@@ -5,7 +5,10 @@ Validates proposed actions against organizational policies.
 Integrates with Cost Tracker and Access Control systems.
 """
 
+import hashlib
 import json
+import threading
+import time
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 from datetime import datetime
@@ -31,18 +34,41 @@ class PolicyEngine:
     - Custom policies
     """
     
-    def __init__(self, policy_dir: Optional[Path] = None, cost_tracker=None):
+    def __init__(
+        self,
+        policy_dir: Optional[Path] = None,
+        cost_tracker=None,
+        metrics=None,
+        tracer=None,
+        retention=None
+    ):
         """
         Initialize Policy Engine.
         
         Args:
             policy_dir: Directory containing policy JSON files
             cost_tracker: CostTracker instance for budget checks
+            metrics: Metrics registry (counter/histogram factory); None disables metrics
+            tracer: Tracer (span factory); with one, each rule is traced as a span
+            retention: Retention policy (buffer factory, see Core/ODAL/retention.py)
+                bounding evaluation_history; None keeps every evaluation in memory
         """
         self.policy_dir = policy_dir or Path(__file__).parent / "policies"
         self.cost_tracker = cost_tracker
         self.policies = self._load_policies()
-        self.evaluation_history = []
+        self.evaluation_history = retention.buffer("policy_evaluations") if retention is not None else []
+        self._lock = threading.Lock()
+        self._evaluations = 0
+        self._rejections = 0
+        self.tracer = tracer
+        self.metrics = metrics
+        if metrics is not None:
+            self._m_evaluations = metrics.counter(
+                "policy_evaluations_total", "Policy evaluations by decision", ["decision"]
+            )
+            self._m_duration = metrics.histogram(
+                "policy_evaluate_seconds", "Policy evaluation time"
+            )
     
     def _load_policies(self) -> Dict[str, Dict]:
         """Load all policy files from policy directory"""
@@ -59,6 +85,16 @@ class PolicyEngine:
         
         return policies
     
+    def reload_policies(self):
+        """Re-read policy files (changes policy_version if they changed)"""
+        self.policies = self._load_policies()
+    
+    @property
+    def policy_version(self) -> str:
+        """Content hash of the active policy set"""
+        canonical = json.dumps(self.policies, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+    
     def _create_default_policies(self):
         """Create default policy files"""
         # Budget Policy
@@ -167,6 +203,72 @@ class PolicyEngine:
         Returns:
             (decision, reason, violated_rules)
         """
+        if self.metrics is None:
+            return self._evaluate_policies(proposed_action, context)
+        
+        start = time.perf_counter()
+        decision, reason, details = self._evaluate_policies(proposed_action, context)
+        self._m_evaluations.labels(decision.value).inc()
+        self._m_duration.observe(time.perf_counter() - start)
+        return decision, reason, details
+    
+    def pre_evaluate(
+        self,
+        proposed_action: Dict[str, Any],
+        context: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """
+        Evaluate without recording anything (no history entry, no metrics).
+        
+        For speculative evaluation: the result only counts once passed to
+        commit_evaluation(); a discarded pre-evaluation leaves no trace.
+        
+        Args:
+            proposed_action: Action to evaluate (see evaluate)
+            context: Additional context (see evaluate); enriched in place
+        
+        Returns:
+            Pending evaluation for commit_evaluation()
+        """
+        start = time.perf_counter()
+        deferred = []
+        result = self._evaluate_policies(proposed_action, context, deferred)
+        return {
+            "result": result,
+            "log": deferred[0] if deferred else None,
+            "duration": time.perf_counter() - start
+        }
+    
+    def commit_evaluation(self, pending: Dict[str, Any]) -> Tuple[PolicyDecision, str, List[Dict]]:
+        """
+        Record a pre-evaluation as if evaluate() had just run.
+        
+        Args:
+            pending: Result of pre_evaluate()
+        
+        Returns:
+            (decision, reason, violated_rules)
+        """
+        decision, reason, details = pending["result"]
+        if pending["log"] is not None:
+            self._log_evaluation(*pending["log"])
+        if self.metrics is not None:
+            self._m_evaluations.labels(decision.value).inc()
+            self._m_duration.observe(pending["duration"])
+        return decision, reason, details
+    
+    def _evaluate_policies(
+        self,
+        proposed_action: Dict[str, Any],
+        context: Optional[Dict] = None,
+        deferred: Optional[List] = None
+    ) -> Tuple[PolicyDecision, str, List[Dict]]:
+        """
+        Evaluate all active policies (see evaluate).
+        
+        With a deferred list, the evaluation log entry is appended there
+        instead of being written to evaluation_history.
+        """
         context = context or {}
         violated_rules = []
         warnings = []
@@ -182,7 +284,14 @@ class PolicyEngine:
                 continue
             
             for rule in policy.get("rules", []):
-                decision = self._evaluate_rule(rule, proposed_action, context)
+                if self.tracer is None:
+                    decision = self._evaluate_rule(rule, proposed_action, context)
+                else:
+                    with self.tracer.span(
+                        "policy.rule", {"policy.id": policy_id, "policy.rule_id": rule["id"]}
+                    ) as span:
+                        decision = self._evaluate_rule(rule, proposed_action, context)
+                        span.set_attribute("policy.decision", decision.value)
                 
                 if decision == PolicyDecision.REJECT:
                     violated_rules.append({
@@ -213,7 +322,10 @@ class PolicyEngine:
                     })
         
         # Log evaluation
-        self._log_evaluation(proposed_action, context, violated_rules, warnings)
+        if deferred is None:
+            self._log_evaluation(proposed_action, context, violated_rules, warnings)
+        else:
+            deferred.append((proposed_action, context, violated_rules, warnings))
         
         # Determine final decision
         if violated_rules:
@@ -305,21 +417,26 @@ class PolicyEngine:
         warnings: List[Dict]
     ):
         """Log policy evaluation"""
-        self.evaluation_history.append({
+        entry = {
             "timestamp": datetime.utcnow().isoformat(),
             "action": action,
             "context": context,
             "violations": violations,
             "warnings": warnings
-        })
+        }
+        with self._lock:
+            self.evaluation_history.append(entry)
+            self._evaluations += 1
+            if violations:
+                self._rejections += 1
     
     def get_statistics(self) -> Dict:
         """Get policy enforcement statistics"""
-        total = len(self.evaluation_history)
+        with self._lock:
+            total, rejections = self._evaluations, self._rejections
         if total == 0:
             return {"total_evaluations": 0}
         
-        rejections = sum(1 for e in self.evaluation_history if e["violations"])
         approvals = total - rejections
         
         return {
@@ -328,6 +445,37 @@ class PolicyEngine:
             "rejections": rejections,
             "approval_rate": approvals / total if total > 0 else 0
         }
+    
+    def export_state(self) -> Dict:
+        """
+        Counters and the newest evaluations as JSON-serialisable state (for
+        engine snapshots); the size is bounded however long the engine ran.
+        """
+        try:
+            from Core.ODAL.retention import export_history
+        except ImportError:
+            # Fallback for direct execution
+            from SDM_AI_PROJECT.Core.ODAL.retention import export_history
+        
+        with self._lock:
+            return export_history(
+                {
+                    "policy_version": self.policy_version,
+                    "evaluations": self._evaluations,
+                    "rejections": self._rejections
+                },
+                "evaluation_history",
+                self.evaluation_history
+            )
+    
+    def import_state(self, state: Dict):
+        """Replace counters and the evaluation history with exported state"""
+        with self._lock:
+            self.evaluation_history.clear()
+            for entry in state["evaluation_history"]:
+                self.evaluation_history.append(entry)
+            self._evaluations = state["evaluations"]
+            self._rejections = state["rejections"]
 
 
 # Example usage
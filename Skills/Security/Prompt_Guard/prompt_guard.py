@@ -7,6 +7,8 @@ Detects direct/indirect injection attacks with multi-language support.
 
 import re
 import json
+import threading
+import time
 from typing import Dict, List, Tuple, Optional
 from enum import Enum
 from pathlib import Path
@@ -98,15 +100,32 @@ class PromptGuard:
         AttackCategory.DATA_EXFILTRATION: 5,
     }
     
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(self, config_path: Optional[Path] = None, metrics=None, retention=None):
         """
         Initialize Prompt Guard.
         
         Args:
             config_path: Path to configuration file
+            metrics: Metrics registry (counter/histogram factory); None disables metrics
+            retention: Retention policy (buffer factory, see Core/ODAL/retention.py)
+                bounding detection_history; None keeps every detection in memory
         """
         self.config = self._load_config(config_path)
-        self.detection_history = []
+        self.detection_history = retention.buffer("prompt_guard_detections") if retention is not None else []
+        self._lock = threading.Lock()
+        self._detections = 0
+        self._severity_counts: Dict[str, int] = {}
+        self._last_detection: Optional[str] = None
+        self.metrics = metrics
+        if metrics is not None:
+            validations = metrics.counter(
+                "prompt_guard_validations_total", "Inputs validated by Prompt Guard", ["result"]
+            )
+            self._m_safe = validations.labels("safe")
+            self._m_unsafe = validations.labels("unsafe")
+            self._m_duration = metrics.histogram(
+                "prompt_guard_validate_seconds", "Prompt Guard validation time"
+            )
     
     def _load_config(self, config_path: Optional[Path]) -> Dict:
         """Load configuration from file or use defaults"""
@@ -142,6 +161,7 @@ class PromptGuard:
         if not self.config["enabled"]:
             return (True, {"status": "disabled"})
         
+        start = time.perf_counter()
         severity_score = 0
         detected_patterns = []
         
@@ -185,6 +205,10 @@ class PromptGuard:
         if self.config["alert_on_detection"] and not is_safe:
             self._alert(metadata)
         
+        if self.metrics is not None:
+            (self._m_safe if is_safe else self._m_unsafe).inc()
+            self._m_duration.observe(time.perf_counter() - start)
+        
         return (is_safe, metadata)
     
     def _check_patterns(
@@ -230,10 +254,12 @@ class PromptGuard:
     
     def _log_detection(self, user_input: str, metadata: Dict):
         """Log security detection event"""
-        self.detection_history.append({
-            "input": user_input[:100],  # Truncate for privacy
-            "metadata": metadata
-        })
+        with self._lock:
+            self.detection_history.append({
+                "input": user_input[:100],  # Truncate for privacy
+                "metadata": metadata
+            })
+            self._count(metadata)
         
         # In production, write to proper logging system
         print(f"[SECURITY] Prompt injection detected: {metadata['severity_level']}")
@@ -244,22 +270,56 @@ class PromptGuard:
         if metadata["severity_level"] in ["high", "critical"]:
             print(f"[ALERT] High-severity prompt injection: {metadata}")
     
+    def _count(self, metadata: Dict):
+        """Update detection counters (call with the lock held)"""
+        level = metadata["severity_level"]
+        self._detections += 1
+        self._severity_counts[level] = self._severity_counts.get(level, 0) + 1
+        self._last_detection = metadata["timestamp"]
+    
     def get_statistics(self) -> Dict:
         """Get detection statistics"""
-        total = len(self.detection_history)
-        if total == 0:
-            return {"total_detections": 0}
-        
-        severity_counts = {}
-        for detection in self.detection_history:
-            level = detection["metadata"]["severity_level"]
-            severity_counts[level] = severity_counts.get(level, 0) + 1
+        with self._lock:
+            if self._detections == 0:
+                return {"total_detections": 0}
+            
+            return {
+                "total_detections": self._detections,
+                "severity_distribution": dict(self._severity_counts),
+                "last_detection": self._last_detection
+            }
+    
+    def export_state(self) -> Dict:
+        """
+        Counters and the newest detections as JSON-serialisable state (for
+        engine snapshots); the size is bounded however long the guard ran.
+        """
+        try:
+            from Core.ODAL.retention import export_history
+        except ImportError:
+            # Fallback for direct execution
+            from SDM_AI_PROJECT.Core.ODAL.retention import export_history
         
-        return {
-            "total_detections": total,
-            "severity_distribution": severity_counts,
-            "last_detection": self.detection_history[-1]["metadata"]["timestamp"]
-        }
+        with self._lock:
+            return export_history(
+                {
+                    "detections": self._detections,
+                    "severity_counts": dict(self._severity_counts),
+                    "last_detection": self._last_detection
+                },
+                "detection_history",
+                self.detection_history
+            )
+    
+    def import_state(self, state: Dict):
+        """Replace counters and the detection history with exported state"""
+        with self._lock:
+            self.detection_history.clear()
+            for detection in state["detection_history"]:
+                self.detection_history.append(detection)
+            self._detections = state["detections"]
+            self._severity_counts = dict(state["severity_counts"])
+            self._last_detection = state["last_detection"]
 
 
 # Example usage